@@ -15,12 +15,18 @@ import datetime
 
 logger = LogFIDC()
 
-def extract(path_handle, calendar_handle, date, fidc_list, folder_root=None):
+def extract(path_handle, calendar_handle, date, fidc_list, folder_root=None, incremental=False):
     try:
         logger.info(f"Iniciando Processo de Extração dos Dados para o Mês {date}.")
 
         extr = Extractor(path_handle, calendar_handle, "FIDCS", folder_root)
 
+        if incremental:
+            # baixa só o que é novo ou foi reenviado desde a última sincronização
+            fidc_list_synced = extr.sync_fidcs(date, fidc_list or None)
+            logger.info(f"Sincronização incremental concluída. FIDCs atualizados: {fidc_list_synced}")
+            return fidc_list_synced
+
         if not fidc_list:
             fidc_list = extr.list_fidcs(date)
 
@@ -48,15 +54,17 @@ def extract(path_handle, calendar_handle, date, fidc_list, folder_root=None):
         return []
 
 
-def transform(path_handle, calendar_handle, date, fidc_list, folder_root=None):
+def transform(path_handle, calendar_handle, date, fidc_list, folder_root=None, max_workers=None, force=False,
+              output_format="csv", low_memory=False, engine="openpyxl"):
     try:
         logger.info(f"Iniciando Processo de Tratamento dos Dados para o Mês {date}.")
         logger.info(f"FIDCS que devem ser transformados: {fidc_list}")
 
         date_str = date.strftime("%Y_%m_%d")
 
-        transf = Transformer(path_handle, calendar_handle, folder_root)
-        fidc_list_transformed = transf.run(date_str, fidc_list)
+        transf = Transformer(path_handle, calendar_handle, folder_root, engine=engine, output_format=output_format,
+                             low_memory=low_memory)
+        fidc_list_transformed = transf.run(date_str, fidc_list, max_workers, force)
 
         if not fidc_list_transformed:
             logger.error("Erro total no tratamento: lista final vazia.")
@@ -83,7 +91,7 @@ def group(path_handle, calendar_handle, date_source, date_final, fidc_list, fold
         logger.info(f"Iniciando Processo de Agrupamento dos Dados para o Mês {date_final} da fonte de dados da data {date_source}.")
         logger.info(f"FIDCS que devem ser agrupados: {fidc_list}")
 
-        grouper = Grouper(path_handle, calendar_handle, folder_root)
+        grouper = Grouper(path_handle, calendar_handle, folder_root, export_csv=True)
         fidc_list_grouped = grouper.run(date_source, date_final) # fidc_list, tem que veeeer
 
         if not fidc_list_grouped:
@@ -101,4 +109,21 @@ def group(path_handle, calendar_handle, date_source, date_final, fidc_list, fold
             return fidc_list_grouped
     except Exception as e:
         logger.error(f"Erro total no agrupamento: {e}")
-        return []
\ No newline at end of file
+        return []
+
+def backfill(path_handle, calendar_handle, date_source, date_start, date_end, fidc_list=None, folder_root=None):
+    try:
+        logger.info(f"Iniciando Reconstrução dos Relatórios de {date_start} a {date_end} da fonte de dados da data {date_source}.")
+
+        grouper = Grouper(path_handle, calendar_handle, folder_root, export_csv=True)
+        reports = grouper.run_panel(date_source, date_start, date_end, fidc_list)
+
+        if not reports:
+            logger.error("Erro total na reconstrução: nenhum mês com dados no intervalo.")
+            return {}
+
+        logger.info(f"Reconstrução concluída para {len(reports)} meses.")
+        return reports
+    except Exception as e:
+        logger.error(f"Erro total na reconstrução: {e}")
+        return {}
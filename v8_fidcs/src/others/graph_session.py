@@ -0,0 +1,102 @@
+from v8_fidcs.src.others.logger import LogFIDC
+from requests.adapters import HTTPAdapter
+from functools import lru_cache
+from typing import Dict, Optional
+
+import threading
+import requests
+import msal
+
+GRAPH_URL = "https://graph.microsoft.com/v1.0"
+GRAPH_SCOPE = ["https://graph.microsoft.com/.default"]
+
+logger = LogFIDC()
+
+_token_lock = threading.Lock()
+
+
+def build_session(pool_size: int) -> requests.Session:
+    """
+    Cria uma sessão HTTP única para as chamadas ao Microsoft Graph, com keep-alive e
+    pool de conexões dimensionado para a quantidade de downloads simultâneos.
+
+    Args:
+        pool_size (int): Quantidade máxima de conexões abertas por host.
+
+    Returns:
+        requests.Session: Sessão configurada, compartilhada entre threads.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=max(1, pool_size), pool_block=True)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update({
+        "Accept": "application/json",
+        "Accept-Encoding": "gzip, deflate",
+        "Connection": "keep-alive",
+    })
+    return session
+
+
+@lru_cache(maxsize=None)
+def _confidential_app(client_id: str, client_secret: str, authority: str) -> msal.ConfidentialClientApplication:
+    """
+    Uma única aplicação MSAL por credencial no processo; o cache de tokens fica dentro dela.
+    """
+    return msal.ConfidentialClientApplication(
+        client_id,
+        client_credential=client_secret,
+        authority=authority,
+        token_cache=msal.TokenCache(),
+    )
+
+
+def acquire_token(client_id: str, client_secret: str, authority: str) -> str:
+    """
+    Obtém o bearer token do Graph pelo fluxo client credentials, reaproveitando o token em cache
+    enquanto ele for válido. Só há chamada ao Azure AD no primeiro uso e quando o token expira.
+
+    Args:
+        client_id (str): Id da aplicação registrada no Azure AD.
+        client_secret (str): Segredo da aplicação.
+        authority (str): URL da autoridade (https://login.microsoftonline.com/<tenant_id>).
+
+    Returns:
+        str: Access token válido.
+
+    Raises:
+        Exception: Se o Azure AD não devolver um token.
+    """
+    app = _confidential_app(client_id, client_secret, authority)
+    with _token_lock:
+        result = app.acquire_token_for_client(scopes=GRAPH_SCOPE)
+    if "access_token" not in result:
+        logger.error(f"Erro ao obter token do Graph: {result.get('error_description', result.get('error'))}")
+        raise Exception(f"Erro ao obter token do Graph: {result.get('error')}")
+    return result["access_token"]
+
+
+def authorization_headers(handle, fallback: Optional[Dict[str, str]] = None) -> Dict[str, str]:
+    """
+    Monta o cabeçalho de autorização a partir das credenciais de um handle do SharePoint.
+
+    Caso o handle não exponha `client_id`, `client_secret` e `tenant_id`/`authority_url`,
+    usa os cabeçalhos já montados por ele (`fallback`).
+
+    Args:
+        handle: Objeto com as credenciais (ex: instância de `SharePoint`).
+        fallback (Optional[Dict[str, str]]): Cabeçalhos a usar quando não houver credenciais.
+
+    Returns:
+        Dict[str, str]: Cabeçalho `Authorization` com o bearer token.
+    """
+    client_id = getattr(handle, "client_id", None)
+    client_secret = getattr(handle, "client_secret", None)
+    authority = getattr(handle, "authority_url", None)
+    tenant_id = getattr(handle, "tenant_id", None)
+    if not authority and tenant_id:
+        authority = f"https://login.microsoftonline.com/{tenant_id}"
+
+    if client_id and client_secret and authority:
+        return {"Authorization": f"Bearer {acquire_token(client_id, client_secret, authority)}"}
+    return dict(fallback or {})
@@ -0,0 +1,109 @@
+from v8_fidcs.src.others.logger import LogFIDC
+from typing import Any, Dict, Optional
+
+import threading
+import json
+import os
+
+MANIFEST_NAME = "00_RAW_manifest.json"
+ITEM_FIELDS = ("id", "name", "eTag", "cTag", "size", "lastModifiedDateTime")
+
+logger = LogFIDC()
+
+
+class RawManifest(object):
+    """
+    Registro local dos arquivos baixados para a pasta "00_RAW".
+
+    Para cada arquivo guarda o id do driveItem, eTag/cTag, tamanho e data de modificação
+    no SharePoint, além do cursor de delta (`@odata.deltaLink`) de cada pasta sincronizada e dos arquivos
+    pendentes (cujo download falhou) de cada pasta, a serem baixados de novo na próxima sincronização.
+    O arquivo fica ao lado de "00_RAW" (`<folder_root>/00_RAW_manifest.json`).
+    """
+
+    def __init__(self, folder_root: str):
+        self.path = os.path.join(folder_root, MANIFEST_NAME)
+        self._lock = threading.Lock()
+        self.files: Dict[str, Dict[str, Any]] = {}
+        self.delta_links: Dict[str, str] = {}
+        self.pending: Dict[str, Dict[str, str]] = {}
+        self.load()
+
+    def load(self) -> None:
+        """
+        Carrega o manifesto do disco. Um manifesto ausente ou corrompido é tratado como vazio.
+        """
+        if not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                content = json.load(f)
+            self.files = content.get("files", {})
+            self.delta_links = content.get("delta_links", {})
+            self.pending = content.get("pending", {})
+        except (OSError, ValueError) as e:
+            logger.warning(f"Manifesto {self.path} ilegível, será recriado: {e}")
+            self.files, self.delta_links, self.pending = {}, {}, {}
+
+    def save(self) -> None:
+        """
+        Grava o manifesto em disco de forma atômica (arquivo temporário + rename).
+        """
+        with self._lock:
+            content = {"files": self.files, "delta_links": self.delta_links, "pending": self.pending}
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            path_tmp = self.path + ".tmp"
+            with open(path_tmp, "w", encoding="utf-8") as f:
+                json.dump(content, f, ensure_ascii=False, indent=2, sort_keys=True)
+            os.replace(path_tmp, self.path)
+
+    def get(self, file_name: str) -> Optional[Dict[str, Any]]:
+        return self.files.get(file_name)
+
+    def update(self, file_name: str, item: Dict[str, Any], folder_id: Optional[str] = None) -> None:
+        """
+        Registra os metadados do driveItem baixado como `file_name`.
+        """
+        entry = {field: item.get(field) for field in ITEM_FIELDS}
+        entry["folder_id"] = folder_id or (item.get("parentReference") or {}).get("id")
+        with self._lock:
+            self.files[file_name] = entry
+
+    def remove(self, file_name: str) -> None:
+        with self._lock:
+            self.files.pop(file_name, None)
+
+    def remove_item(self, item_id: str) -> None:
+        """
+        Remove os arquivos e pendências do driveItem `item_id` (ex: item apagado no SharePoint, que no delta
+        pode vir sem `name`).
+        """
+        with self._lock:
+            for file_name in [f for f, entry in self.files.items() if entry.get("id") == item_id]:
+                del self.files[file_name]
+            for names in self.pending.values():
+                for name in [n for n, pending_id in names.items() if pending_id == item_id]:
+                    del names[name]
+
+    def is_current(self, file_name: str, item: Dict[str, Any], path_local: str) -> bool:
+        """
+        Indica se o arquivo local corresponde à versão atual do driveItem.
+
+        Compara cTag (muda só com o conteúdo) e, na falta dele, eTag; o arquivo local também precisa existir.
+
+        Args:
+            file_name (str): Nome do arquivo em "00_RAW".
+            item (Dict[str, Any]): driveItem retornado pelo Graph.
+            path_local (str): Caminho completo do arquivo local.
+
+        Returns:
+            bool: True se não há necessidade de baixar o arquivo novamente.
+        """
+        entry = self.files.get(file_name)
+        if entry is None or not os.path.exists(path_local):
+            return False
+        if entry.get("id") != item.get("id"):
+            return False
+        if item.get("cTag") and entry.get("cTag"):
+            return entry["cTag"] == item["cTag"]
+        return entry.get("eTag") == item.get("eTag")
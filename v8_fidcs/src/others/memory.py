@@ -0,0 +1,53 @@
+from v8_fidcs.src.others.logger import LogFIDC
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+import tracemalloc
+import sys
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+MB = 1024 * 1024
+
+logger = LogFIDC()
+
+
+def max_rss_mb() -> Optional[float]:
+    """
+    Pico de memória residente (RSS) do processo atual, em MB. Retorna None onde o módulo `resource` não existe.
+    """
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss vem em bytes no macOS e em KB no Linux
+    return peak / MB if sys.platform == "darwin" else peak / 1024
+
+
+@contextmanager
+def track_peak_memory(label: str) -> Iterator[None]:
+    """
+    Registra no log o pico de memória alocada (via tracemalloc) durante o bloco e o pico de RSS do processo.
+
+    Os buffers do NumPy/pandas são contabilizados pelo tracemalloc. Se o tracemalloc já estiver ativo, apenas
+    o pico é reiniciado e o rastreamento continua ativo ao final.
+
+    Args:
+        label (str): Identificação do bloco nos logs (ex: nome do FIDC).
+    """
+    started = not tracemalloc.is_tracing()
+    if started:
+        tracemalloc.start()
+    else:
+        tracemalloc.reset_peak()
+    try:
+        yield
+    finally:
+        _, peak = tracemalloc.get_traced_memory()
+        if started:
+            tracemalloc.stop()
+        rss = max_rss_mb()
+        rss_str = f", pico de RSS do processo {rss:.1f} MB" if rss is not None else ""
+        logger.info(f"Memória de {label}: pico alocado {peak / MB:.1f} MB{rss_str}.")
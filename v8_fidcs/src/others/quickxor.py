@@ -0,0 +1,60 @@
+import numpy as np
+
+import base64
+
+WIDTH_IN_BITS = 160
+SHIFT = 11
+_MASK = (1 << WIDTH_IN_BITS) - 1
+
+
+def _rotate_left(value: int, shift: int) -> int:
+    return ((value << shift) | (value >> (WIDTH_IN_BITS - shift))) & _MASK
+
+
+class QuickXorHash(object):
+    """
+    Implementação do quickXorHash, o hash que o OneDrive/SharePoint expõe em `file.hashes.quickXorHash`.
+
+    Cada byte na posição `p` é combinado por XOR no vetor de 160 bits deslocado de `(p * 11) % 160` bits;
+    ao final, o tamanho total é combinado nos últimos 64 bits. Como o deslocamento se repete a cada
+    160 bytes, cada bloco recebido é reduzido por XOR em colunas de 160 bytes com NumPy antes da rotação.
+
+    Exemplo:
+        h = QuickXorHash()
+        h.update(b"conteudo")
+        h.base64digest()
+    """
+
+    def __init__(self) -> None:
+        self._acc = 0
+        self._length = 0
+
+    def update(self, data: bytes) -> None:
+        """
+        Acrescenta um bloco de bytes ao hash.
+
+        Args:
+            data (bytes): Próximo trecho do arquivo.
+        """
+        if not data:
+            return
+        arr = np.frombuffer(data, dtype=np.uint8)
+        start = self._length % WIDTH_IN_BITS
+        rows = -(-(start + arr.size) // WIDTH_IN_BITS)
+
+        buffer = np.zeros(rows * WIDTH_IN_BITS, dtype=np.uint8)
+        buffer[start:start + arr.size] = arr
+        folded = np.bitwise_xor.reduce(buffer.reshape(rows, WIDTH_IN_BITS), axis=0)
+
+        for residue in np.flatnonzero(folded):
+            self._acc ^= _rotate_left(int(folded[residue]), (int(residue) * SHIFT) % WIDTH_IN_BITS)
+        self._length += arr.size
+
+    def digest(self) -> bytes:
+        out = bytearray(self._acc.to_bytes(WIDTH_IN_BITS // 8, "little"))
+        for i, b in enumerate(self._length.to_bytes(8, "little")):
+            out[WIDTH_IN_BITS // 8 - 8 + i] ^= b
+        return bytes(out)
+
+    def base64digest(self) -> str:
+        return base64.b64encode(self.digest()).decode("ascii")
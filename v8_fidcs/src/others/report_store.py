@@ -0,0 +1,141 @@
+from v8_fidcs.src.others.logger import LogFIDC
+from contextlib import closing
+from typing import Dict, List
+
+import pandas as pd
+
+import sqlite3
+import os
+
+STORE_NAME = "02_REPORT_store.sqlite"
+
+SCHEMA = (
+    """CREATE TABLE IF NOT EXISTS report_values (
+           month TEXT NOT NULL, fidc TEXT NOT NULL, name TEXT NOT NULL, value REAL,
+           PRIMARY KEY (month, fidc, name)) WITHOUT ROWID""",
+    """CREATE TABLE IF NOT EXISTS report_fidcs (
+           month TEXT NOT NULL, fidc TEXT NOT NULL, position INTEGER NOT NULL,
+           PRIMARY KEY (month, fidc)) WITHOUT ROWID""",
+    """CREATE TABLE IF NOT EXISTS report_columns (
+           month TEXT NOT NULL, name TEXT NOT NULL, position INTEGER NOT NULL,
+           PRIMARY KEY (month, name)) WITHOUT ROWID""",
+)
+
+logger = LogFIDC()
+
+
+class ReportStore(object):
+    """
+    Base local (SQLite) dos relatórios agrupados, chaveada por (mês, FIDC).
+
+    Cada valor é gravado como número em `report_values` (uma linha por mês, FIDC e coluna; valores ausentes não
+    são gravados), e a ordem das colunas e dos FIDCs de cada mês fica em `report_columns` e `report_fidcs`, para
+    que a exportação reproduza o layout do CSV original. Atualizar um FIDC reescreve apenas as linhas desse FIDC,
+    e só se algum valor mudou. O arquivo fica ao lado de "02_REPORT" (`<folder_root>/02_REPORT_store.sqlite`).
+    """
+
+    def __init__(self, folder_root: str):
+        self.path = os.path.join(folder_root, STORE_NAME)
+        os.makedirs(folder_root, exist_ok=True)
+        with closing(self._connect()) as conn, conn:
+            for statement in SCHEMA:
+                conn.execute(statement)
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path)
+
+    @staticmethod
+    def _month(date) -> str:
+        return date.strftime("%Y_%m_%d")
+
+    def has_month(self, date) -> bool:
+        with closing(self._connect()) as conn:
+            row = conn.execute("SELECT 1 FROM report_fidcs WHERE month = ? LIMIT 1", (self._month(date),)).fetchone()
+        return row is not None
+
+    def upsert(self, date, data: pd.DataFrame) -> Dict[str, bool]:
+        """
+        Insere ou substitui as linhas dos FIDCs de `data` no mês de `date`.
+
+        Como no merge do CSV, a linha nova substitui a antiga por inteiro e o FIDC passa para o fim da ordem do mês;
+        colunas novas entram no fim da ordem de colunas. Os valores de um FIDC só são regravados se mudaram.
+
+        Args:
+            date (datetime): Data do relatório.
+            data (pd.DataFrame): Tabela indexada por FIDC, com valores numéricos.
+
+        Returns:
+            Dict[str, bool]: Para cada FIDC de `data`, se os seus valores foram alterados.
+        """
+        month = self._month(date)
+        values = data.apply(pd.to_numeric, errors="coerce")
+        changed = {}
+
+        with closing(self._connect()) as conn, conn:
+            known = {name for (name,) in conn.execute("SELECT name FROM report_columns WHERE month = ?", (month,))}
+            next_col = conn.execute("SELECT COALESCE(MAX(position) + 1, 0) FROM report_columns WHERE month = ?",
+                                    (month,)).fetchone()[0]
+            new_columns = [str(col) for col in values.columns if str(col) not in known]
+            conn.executemany("INSERT INTO report_columns (month, name, position) VALUES (?, ?, ?)",
+                             [(month, col, next_col + i) for i, col in enumerate(new_columns)])
+
+            next_fidc = conn.execute("SELECT COALESCE(MAX(position) + 1, 0) FROM report_fidcs WHERE month = ?",
+                                     (month,)).fetchone()[0]
+            for i, (fidc, row) in enumerate(values.iterrows()):
+                fidc = str(fidc)
+                new = {str(col): float(value) for col, value in row.items() if pd.notna(value)}
+                old = dict(conn.execute("SELECT name, value FROM report_values WHERE month = ? AND fidc = ?",
+                                        (month, fidc)))
+                changed[fidc] = new != old
+                if changed[fidc]:
+                    conn.execute("DELETE FROM report_values WHERE month = ? AND fidc = ?", (month, fidc))
+                    conn.executemany("INSERT INTO report_values (month, fidc, name, value) VALUES (?, ?, ?, ?)",
+                                     [(month, fidc, col, value) for col, value in new.items()])
+                conn.execute("INSERT OR REPLACE INTO report_fidcs (month, fidc, position) VALUES (?, ?, ?)",
+                             (month, fidc, next_fidc + i))
+
+        logger.info(f"Base de relatórios do mês {month}: {sum(changed.values())} de {len(changed)} FIDCs atualizados.")
+        return changed
+
+    def fidcs(self, date) -> List[str]:
+        """FIDCs do mês de `date`, na ordem do relatório."""
+        with closing(self._connect()) as conn:
+            return [fidc for (fidc,) in conn.execute(
+                "SELECT fidc FROM report_fidcs WHERE month = ? ORDER BY position", (self._month(date),))]
+
+    def read(self, date) -> pd.DataFrame:
+        """
+        Relatório do mês de `date` como tabela float64 indexada por FIDC, com colunas e FIDCs na ordem do relatório.
+        """
+        month = self._month(date)
+        with closing(self._connect()) as conn:
+            fidcs = [f for (f,) in conn.execute(
+                "SELECT fidc FROM report_fidcs WHERE month = ? ORDER BY position", (month,))]
+            columns = [c for (c,) in conn.execute(
+                "SELECT name FROM report_columns WHERE month = ? ORDER BY position", (month,))]
+            rows = conn.execute("SELECT fidc, name, value FROM report_values WHERE month = ?", (month,)).fetchall()
+
+        long = pd.DataFrame(rows, columns=["fidc", "name", "value"])
+        table = long.pivot(index="fidc", columns="name", values="value") if rows else pd.DataFrame()
+        table = table.reindex(index=fidcs, columns=columns).astype("float64")
+        table.index.name = "FIDC"
+        table.columns.name = None
+        return table
+
+    def export_csv(self, date, path: str) -> None:
+        """
+        Gera o CSV do relatório do mês (mesmo formato do arquivo de "02_REPORT") a partir da base.
+        Valores ausentes saem como campos vazios, como no merge do CSV.
+        """
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        table = self.read(date)
+        table = table.astype(str).where(table.notna(), "")
+        table.reset_index().to_csv(path, sep=';', index=False, encoding='utf-8-sig')
+
+    def import_csv(self, date, path: str) -> None:
+        """
+        Carrega na base um CSV de relatório gerado antes da existência da base.
+        """
+        old = pd.read_csv(path, sep=';', encoding='utf-8-sig', dtype=str, index_col="FIDC")
+        logger.info(f"Importando o relatório {path} para a base de relatórios.")
+        self.upsert(date, old)
@@ -0,0 +1,94 @@
+from v8_fidcs.src.others.logger import LogFIDC
+from typing import Dict, Optional
+
+import hashlib
+import json
+import os
+
+CACHE_NAME = "01_PARSED_cache.json"
+CHUNK_SIZE = 1024 * 1024
+
+logger = LogFIDC()
+
+
+def file_digest(path: str) -> str:
+    """
+    Hash (sha256) do conteúdo de um arquivo, lido em blocos.
+    """
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+class TransformCache(object):
+    """
+    Registro local das transformações já feitas para a pasta "01_PARSED".
+
+    Para cada CSV gerado guarda a chave da transformação: hash do Excel em "00_RAW", hash das regras da gestora
+    no `fidcs.yaml` e versão do código do transformador (uma por FIDC que gera o CSV, ver `Transformer.run`). Se a chave não mudou e o CSV ainda existe, o FIDC
+    não precisa ser transformado de novo. O arquivo fica ao lado de "01_PARSED" (`<folder_root>/01_PARSED_cache.json`).
+    """
+
+    def __init__(self, folder_root: str):
+        self.path = os.path.join(folder_root, CACHE_NAME)
+        self.files: Dict[str, Dict[str, str]] = {}
+        self.load()
+
+    def load(self) -> None:
+        """
+        Carrega o cache do disco. Um cache ausente ou corrompido é tratado como vazio.
+        """
+        if not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                self.files = json.load(f).get("files", {})
+        except (OSError, ValueError) as e:
+            logger.warning(f"Cache de transformação {self.path} ilegível, será recriado: {e}")
+            self.files = {}
+
+    def save(self) -> None:
+        """
+        Grava o cache em disco de forma atômica (arquivo temporário + rename).
+        """
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        path_tmp = self.path + ".tmp"
+        with open(path_tmp, "w", encoding="utf-8") as f:
+            json.dump({"files": self.files}, f, ensure_ascii=False, indent=2, sort_keys=True)
+        os.replace(path_tmp, self.path)
+
+    @staticmethod
+    def key(path_read: str, pattern_digest: str, version: str, output_format: str = "csv",
+            engine: str = "openpyxl") -> Dict[str, str]:
+        """
+        Monta a chave de uma transformação.
+
+        Args:
+            path_read (str): Caminho do Excel em "00_RAW".
+            pattern_digest (str): Hash das regras da gestora (`ManagerPattern.digest`).
+            version (str): Versão do código do transformador.
+            output_format (str): Formato de saída em "01_PARSED".
+            engine (str): Engine de leitura do Excel efetivamente usado (ver `resolve_engine`).
+
+        Returns:
+            Dict[str, str]: Chave com os componentes.
+        """
+        return {"raw": file_digest(path_read), "pattern": pattern_digest, "version": version, "format": output_format,
+                "engine": engine}
+
+    def is_current(self, file_name: str, key: Optional[Dict[str, str]], *paths_save: str) -> bool:
+        """
+        Indica se o CSV `file_name` foi gerado com a mesma chave e se todos os arquivos de saída ainda existem em disco.
+        """
+        if key is None or not all(os.path.exists(path) for path in paths_save):
+            return False
+        return self.files.get(file_name) == key
+
+    def update(self, file_name: str, key: Optional[Dict[str, str]]) -> None:
+        if key is not None:
+            self.files[file_name] = key
+
+    def remove(self, file_name: str) -> None:
+        self.files.pop(file_name, None)
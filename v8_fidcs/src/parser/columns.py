@@ -0,0 +1,205 @@
+from v8_fidcs.src.others.logger import LogFIDC
+
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import hashlib
+import json
+import re
+import os
+
+# versão das regras de normalização; incrementar quando uma mudança alterar os nomes gerados (invalida o cache)
+NORMALIZER_VERSION = "1"
+CACHE_NAME = "02_REPORT_columns.json"
+
+logger = LogFIDC()
+
+SUFFIX_PATTERN = re.compile(r'\.\d+$')
+
+# colunas que representam intervalos de dias, antes da padronização
+DAYS_DETECT = tuple(re.compile(p) for p in (
+    r"(?i)^\d+\s*a\s*\d+$",
+    r"(?i)^\d+\s*-\s*\d+$",
+    r"(?i)^\d+\s*-\s*\d+\s*dias$",
+    r"(?i)^de\s+\d+\s*a\s+\d+\s*dias$",
+    r"(?i)^\d+\s*e\s*\d+\s*dias$",
+    r"(?i)^acima\s+de\s+\d+\s*dias$",
+    r"(?i)^superior\s+a\s+\d+$",
+    r"(?i)^superior\s+\d+$",
+    r"(?i)^>\s*\d+$",
+    r"(?i)^até\s+\d+$",
+    r"(?i)^até\s+\d+\s*dias$",
+))
+
+# colunas de intervalos de dias já padronizadas
+DAYS_GROUP = tuple(re.compile(p) for p in (
+    r'(\d+)\s*-\s*(\d+)\s*dias?',  # intervalo: 10 - 20 dias
+    r'>\s*(\d+)\s*dias?',  # > 120 dias
+    r'<=\s*(\d+)\s*dias?',  # <= 10 dias
+))
+
+UNWANTED_NUMBERS = {6, 16, 31, 61, 91, 121, 151, 181, 366, 721}
+
+
+def _range(m) -> str:
+    start = int(m.group(1)) - 1 if int(m.group(1)) in UNWANTED_NUMBERS else m.group(1)
+    return f"{start}-{m.group(2)} dias"
+
+
+def _above(m) -> str:
+    return f"> {int(m.group(1)) - 1 if int(m.group(1)) == 121 else m.group(1)} dias"
+
+
+DAYS_CHANGE = tuple((re.compile(p), f) for p, f in (
+    (r"^1-(\d+)", lambda m: f"0-{m.group(1)} dias"),
+    (r"^de\s*(\d+)\s*a\s*(\d+)\s*dias?$", _range),
+    (r"^(\d+)\s*(?:a|e|-)\s*(\d+)\s*dias?$", _range),
+    (r"^(\d+)\s*(?:a|e|-)\s*(\d+)$", _range),
+    (r"^até\s*(\d+)(?:\s*dias?)?$", lambda m: f"<= {m.group(1)} dias"),
+    (r"^>\s*(\d+)$", _above),
+    (r"^(?:acima\s*de|superior(?:\s*a)?)\s*(\d+)(?:\s*dias?)?$", _above),
+))
+
+
+def matches_any(entry: Any, patterns: Sequence[re.Pattern]) -> bool:
+    """
+    Verifica se o texto (em minúsculas e sem espaços nas pontas) contém algum dos padrões compilados.
+    """
+    text = str(entry).lower().strip()
+    return any(p.search(text) for p in patterns)
+
+
+def days_string(entry: Optional[str]) -> Optional[str]:
+    """
+    Padroniza um texto de intervalo de dias (ex: "de 2 a 30 dias" -> "1-30 dias", "> 121" -> "> 120 dias").
+
+    Returns:
+        Optional[str]: Texto padronizado ou None se a entrada for inválida ou não casar com nenhum padrão.
+    """
+    if not entry or not isinstance(entry, str):
+        return None
+
+    entry = entry.lower().strip()
+    for pattern, format in DAYS_CHANGE:
+        if match := pattern.fullmatch(entry):
+            return format(match)
+    return None
+
+
+def remove_suffix(columns: Iterable[str]) -> List[str]:
+    """Remove o sufixo ".1", ".2", ... que o pandas dá às colunas repetidas."""
+    return [SUFFIX_PATTERN.sub('', col) for col in columns]
+
+
+def process_days(columns: Iterable[Any]) -> List[Any]:
+    """Padroniza os nomes das colunas que representam intervalos de dias; as demais ficam como estão."""
+    return [days_string(col) if matches_any(col, DAYS_DETECT) else col for col in columns]
+
+
+def group_days(columns: Iterable[Any]) -> List[Any]:
+    """
+    Prefixa cada coluna de intervalo de dias com a última coluna que não é intervalo
+    (ex: "prazo médio", "0-30 dias" -> "prazo médio", "(prazo médio)0-30 dias").
+    """
+    new_columns = []
+    last = None
+    for col in columns:
+        if not matches_any(col, DAYS_GROUP):
+            new_columns.append(col)
+            last = col
+        elif last is not None:
+            new_columns.append(f"({last}){col}")
+        else:
+            new_columns.append(col)
+    return new_columns
+
+
+def invert_aliases(equiv_columns: Dict[str, Optional[List[str]]]) -> Dict[str, str]:
+    """
+    Inverte o `colunas.yaml` (nome desejado -> apelidos) para apelido -> nome desejado. Se um apelido aparece
+    em mais de um nome, vale o último, como no `rename` original.
+    """
+    aliases = {}
+    for wanted_name, possibilities in equiv_columns.items():
+        for possibility in possibilities or ():
+            aliases[possibility] = wanted_name
+    return aliases
+
+
+class ColumnNormalizer(object):
+    """
+    Converte os cabeçalhos de um arquivo de "01_PARSED" nos nomes canônicos usados no agrupamento.
+
+    Aplica, em sequência: remoção dos sufixos de colunas repetidas, padronização dos intervalos de dias,
+    renomeação pelos apelidos do `colunas.yaml` e prefixo de contexto nas colunas de dias. Todos os padrões
+    são pré-compilados e o resultado é memorizado pela tupla de colunas de entrada. Se `cache_dir` for dado,
+    a memória é gravada em disco (`<cache_dir>/02_REPORT_columns.json`) e reaproveitada entre execuções enquanto
+    o `colunas.yaml` e `NORMALIZER_VERSION` não mudarem.
+
+    Args:
+        equiv_columns (Dict[str, Optional[List[str]]]): Conteúdo do `colunas.yaml`.
+        cache_dir (Optional[str]): Pasta do cache em disco. Se None, o cache fica só em memória.
+    """
+
+    def __init__(self, equiv_columns: Dict[str, Optional[List[str]]], cache_dir: Optional[str] = None):
+        self.aliases = invert_aliases(equiv_columns)
+        self.fingerprint = hashlib.sha256(
+            json.dumps([NORMALIZER_VERSION, equiv_columns], ensure_ascii=False).encode("utf-8")
+        ).hexdigest()
+        self.path = os.path.join(cache_dir, CACHE_NAME) if cache_dir is not None else None
+        self._memo: Dict[Tuple[Any, ...], Tuple[Any, ...]] = {}
+        self._dirty = False
+        self.load()
+
+    def load(self) -> None:
+        """
+        Carrega o cache do disco. Um cache ausente, corrompido ou de outro `colunas.yaml` é ignorado.
+        """
+        if self.path is None or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                content = json.load(f)
+            if content.get("fingerprint") != self.fingerprint:
+                logger.info("Cache de nomes de colunas desatualizado, será recriado.")
+                return
+            self._memo = {tuple(source): tuple(target) for source, target in content.get("mappings", [])}
+        except (OSError, ValueError, TypeError) as e:
+            logger.warning(f"Cache de nomes de colunas {self.path} ilegível, será recriado: {e}")
+            self._memo = {}
+
+    def save(self) -> None:
+        """
+        Grava o cache em disco (arquivo temporário + rename), se houver mapeamentos novos.
+        """
+        if self.path is None or not self._dirty:
+            return
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        content = {"fingerprint": self.fingerprint,
+                   "mappings": [[list(source), list(target)] for source, target in self._memo.items()]}
+        path_tmp = self.path + ".tmp"
+        with open(path_tmp, "w", encoding="utf-8") as f:
+            json.dump(content, f, ensure_ascii=False)
+        os.replace(path_tmp, self.path)
+        self._dirty = False
+
+    def rename(self, columns: Iterable[Any]) -> List[Any]:
+        """Aplica os apelidos do `colunas.yaml`."""
+        return [self.aliases.get(col, col) for col in columns]
+
+    def normalize(self, columns: Iterable[Any]) -> List[Any]:
+        """
+        Nomes canônicos das colunas, na mesma ordem.
+
+        Args:
+            columns (Iterable[Any]): Cabeçalho lido do arquivo.
+
+        Returns:
+            List[Any]: Cabeçalho normalizado.
+        """
+        key = tuple(columns)
+        target = self._memo.get(key)
+        if target is None:
+            target = tuple(group_days(self.rename(process_days(remove_suffix(key)))))
+            self._memo[key] = target
+            self._dirty = True
+        return list(target)
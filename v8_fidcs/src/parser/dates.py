@@ -0,0 +1,147 @@
+from v8_fidcs.src.others.logger import LogFIDC
+
+from functools import lru_cache
+from typing import Dict, Hashable, Iterable, Tuple
+
+import pandas as pd
+import numpy as np
+
+import unicodedata
+import datetime
+import numbers
+
+logger = LogFIDC()
+
+MONTHS_PT = ("janeiro", "fevereiro", "março", "abril", "maio", "junho",
+             "julho", "agosto", "setembro", "outubro", "novembro", "dezembro")
+
+# datas seriais do Excel (dias desde 30/12/1899) aceitas: de 1954 a 2119, para não confundir com outros números
+EXCEL_ORIGIN = "1899-12-30"
+EXCEL_SERIAL_RANGE = (20000, 80000)
+
+# padrões aplicados ao texto normalizado (minúsculas, separadores trocados por espaço, sem " de ")
+TEXT_PATTERNS = (
+    r"^(?:(?P<day>\d{1,2}) )?(?P<month>[^\d\s]+) (?P<year>\d{4}|\d{2})$",       # janeiro 2023, jan/23, 01 jan 2023
+    r"^(?P<day>\d{1,2}) (?P<month>\d{1,2}) (?P<year>\d{4}|\d{2})$",             # 31/01/2023
+    r"^(?P<year>\d{4}) (?P<month>\d{1,2}) (?P<day>\d{1,2})(?:[ t]\d.*)?$",      # 2023-01-31 (00:00:00)
+)
+SERIAL_PATTERN = r"^\d{5}(?:\.\d+)?$"
+
+CACHE_SIZE = 256
+
+
+def _strip_accents(text: str) -> str:
+    return unicodedata.normalize("NFKD", text).encode("ascii", "ignore").decode("ascii")
+
+
+def _build_month_lookup() -> Dict[str, int]:
+    """
+    Tabela nome do mês -> número, com o nome completo e a abreviação de 3 letras, com e sem acento.
+    """
+    lookup = {}
+    for number, name in enumerate(MONTHS_PT, start=1):
+        for variant in (name, _strip_accents(name)):
+            lookup[variant] = number
+            lookup[variant[:3]] = number
+    return lookup
+
+
+MONTH_LOOKUP = _build_month_lookup()
+
+
+def _kind(value) -> str:
+    if isinstance(value, str):
+        return "text"
+    if isinstance(value, (pd.Timestamp, datetime.datetime, datetime.date, np.datetime64)):
+        return "datetime"
+    if isinstance(value, numbers.Real) and not isinstance(value, bool) and not pd.isna(value):
+        return "serial"
+    return "other"
+
+
+def _parse_serials(values: pd.Series) -> pd.Series:
+    serials = pd.to_numeric(values, errors="coerce")
+    low, high = EXCEL_SERIAL_RANGE
+    serials = serials.where((serials >= low) & (serials <= high))
+    return pd.to_datetime(serials, unit="D", origin=EXCEL_ORIGIN, errors="coerce")
+
+
+def _parse_texts(texts: pd.Series) -> pd.Series:
+    """
+    Converte, de forma vetorizada, textos de data em português para datetime. Falhas viram NaT.
+    """
+    text = texts.str.strip()
+    serial = text.str.fullmatch(SERIAL_PATTERN)
+
+    norm = (text.str.casefold()
+            .str.replace(r"[-/._]", " ", regex=True)
+            .str.replace(r"\s+de\s+", " ", regex=True)
+            .str.replace(r"\s+", " ", regex=True))
+
+    parts = pd.DataFrame({"year": np.nan, "month": np.nan, "day": np.nan}, index=text.index)
+    pending = ~serial
+    for pattern in TEXT_PATTERNS:
+        if not pending.any():
+            break
+        found = norm[pending].str.extract(pattern)
+        found = found[found["month"].notna()]
+        if found.empty:
+            continue
+        months = found["month"]
+        if not months.str.isdigit().all():
+            months = months.map(MONTH_LOOKUP)
+        parts.loc[found.index, "month"] = pd.to_numeric(months, errors="coerce")
+        parts.loc[found.index, "year"] = pd.to_numeric(found["year"], errors="coerce")
+        parts.loc[found.index, "day"] = pd.to_numeric(found["day"], errors="coerce").fillna(1)
+        pending[found.index] = False
+
+    # ano com 2 dígitos segue o mesmo pivô do "%y": 69-99 -> 19xx, 00-68 -> 20xx
+    short = parts["year"] < 100
+    parts.loc[short, "year"] += np.where(parts.loc[short, "year"] < 69, 2000, 1900)
+
+    dates = pd.to_datetime(parts, errors="coerce")
+    if serial.any():
+        dates[serial] = _parse_serials(text[serial])
+    return dates
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _parse_labels(labels: Tuple[Hashable, ...]) -> pd.Series:
+    values = pd.Series(labels, dtype=object)
+    kinds = values.map(_kind)
+    dates = pd.Series(pd.NaT, index=values.index, dtype="datetime64[ns]")
+
+    for kind, parser in (("datetime", lambda v: pd.to_datetime(v, errors="coerce")),
+                         ("serial", _parse_serials),
+                         ("text", _parse_texts)):
+        mask = kinds == kind
+        if mask.any():
+            dates[mask] = parser(values[mask])
+    return dates
+
+
+def parse_dates(labels: Iterable) -> pd.Series:
+    """
+    Converte rótulos de data dos relatórios dos FIDCs para datetime.
+
+    Aceita, em qualquer combinação:
+        - Mês e ano em português, por extenso ou abreviado, com ou sem acento ("Janeiro 2023", "mar/23",
+          "Março-2023", "jan de 23"), convertidos para o primeiro dia do mês.
+        - Datas "dd/mm/aaaa" (ou com "-" e "."), e "aaaa-mm-dd".
+        - Datas seriais do Excel, como número ou texto.
+        - Timestamps/datetimes, mantidos como estão.
+
+    O resultado é memorizado por conjunto de rótulos: FIDCs da mesma gestora costumam repetir os mesmos rótulos.
+
+    Args:
+        labels (Iterable): Rótulos de data.
+
+    Returns:
+        pd.Series: Datas em datetime64, na ordem dos rótulos, com NaT para os que não puderem ser convertidos.
+    """
+    labels = tuple(labels)
+    try:
+        return _parse_labels(labels).copy()
+    except TypeError:
+        # rótulo não hasheável: converte sem passar pelo cache
+        return _parse_labels.__wrapped__(labels)
@@ -1,17 +1,18 @@
 from v8_utilities.paths import PathV8
 from v8_fidcs.src.parser.fidc import FIDC
+from v8_fidcs.src.parser.patterns import PATTERNS, ManagerPattern
+from v8_fidcs.src.parser.workbook import Workbook, DEFAULT_ENGINE
+from v8_fidcs.src.parser.parsed import DEFAULT_FORMAT, check_format, write_parsed
+from v8_fidcs.src.parser.strategies import TransformState, strategy_for
 from v8_fidcs.src.others.logger import LogFIDC
-from v8_utilities.yaml_functions import load_yaml
 from v8_utilities.anbima_calendar import Calendar
 
-from typing import Tuple, Dict, List, Any
-
-from functools import reduce
+from typing import Tuple, Dict, List, Any, Sequence, Union
 
 import pandas as pd
 import numpy as np
 
-import re
+import time
 import os
 
 pd.set_option('future.no_silent_downcasting', True)
@@ -22,67 +23,127 @@ script_dir = os.path.dirname(script_path)
 
 PATH = os.path.join(script_dir, "..","..", "..", 'yamls')
 
+# versão do código de transformação; incrementar quando uma mudança alterar os CSVs gerados (invalida o cache)
+TRANSFORM_VERSION = "4"
+
 logger = LogFIDC()
 
 class ExcelTransformer(object):
 
-    def __init__(self, path_handle, calendar_handle, path_read, path_save, name):
+    def __init__(self, path_handle, calendar_handle, path_read, path_save, name, engine: str = DEFAULT_ENGINE,
+                 output_format: str = DEFAULT_FORMAT, low_memory: bool = False):
         self.path_handle = path_handle
         self.calendar_handle = calendar_handle
         self.path_read = path_read
         self.path_save = path_save
-
-        sheet_names =  pd.ExcelFile(self.path_read).sheet_names
-        patterns_fidcs = load_yaml(os.path.join(PATH, "fidcs.yaml"))
-        type, pattern = self._check_name(name, patterns_fidcs)
-
-        if len(sheet_names) > 1 and type in ["ORRAM", "MULTIASSET", "FIRMA"]:
-            tables = []
-            if len(sheet_names) > 3:
-                logger.warning(f"Mais de 3 sheets encontrada no FIDC {name}, serão lidas as 3 primeiras.")
-                sheet_names = sheet_names[:-1]  # remove a última planilha
-            for sheet in sheet_names:
-                df = pd.read_excel(self.path_read, sheet_name=sheet, header = None, decimal=',', thousands=".")
-                df = df.T
-                #print(df)
-                df.reset_index(drop=True, inplace=True)
-                tables.append(df)
-            raw_table = tables.copy()
-            table = pd.concat(tables, axis = 1)
-            table = table.dropna(how='all')
-        elif type == "SOLAR":
-            raw_table = pd.read_excel(self.path_read, sheet_name = "Dados", header = None, decimal=',', thousands=".")
-            table = raw_table.T
-        elif len(sheet_names) > 1 and type not in ["ORRAM", "MULTIASSET"]:
-            logger.warning(f"Mais de uma sheet encontrada no FIDC {name}, será lida apenas a primeira.")
-            raw_table = pd.read_excel(self.path_read, decimal=',', thousands=".")
-            table = raw_table.T
-        else:
-            raw_table = pd.read_excel(self.path_read, decimal=',', thousands=".")
-            table = raw_table.T
-
+        self.output_format = check_format(output_format)
+        # modo econômico: descarta a tabela bruta assim que é consumida e evita cópias defensivas
+        self.low_memory = low_memory
+
+        self.manager = self._check_name(name)
+        type, pattern = self.manager.name, self.manager.rules
+
+        # o arquivo é aberto uma única vez e todas as sheets saem do mesmo handle
+        with Workbook(self.path_read, engine) as workbook:
+            sheet_names = workbook.sheet_names
+
+            if len(sheet_names) > 1 and type in ["ORRAM", "MULTIASSET", "FIRMA"]:
+                tables = []
+                if len(sheet_names) > 3:
+                    logger.warning(f"Mais de 3 sheets encontrada no FIDC {name}, serão lidas as 3 primeiras.")
+                    sheet_names = sheet_names[:-1]  # remove a última planilha
+                for df in workbook.read_many(sheet_names, header = None).values():
+                    df = df.T
+                    #print(df)
+                    df.reset_index(drop=True, inplace=True)
+                    tables.append(df)
+                if low_memory:
+                    # as estratégias multi-sheet partem só das sheets (raw_table); a tabela concatenada não é usada
+                    raw_table = tables
+                    table = None
+                else:
+                    raw_table = tables.copy()
+                    table = pd.concat(tables, axis = 1)
+                    table = table.dropna(how='all')
+            elif type == "SOLAR":
+                raw_table = workbook.read("Dados", header = None)
+                table = raw_table.T
+            elif len(sheet_names) > 1 and type not in ["ORRAM", "MULTIASSET"]:
+                logger.warning(f"Mais de uma sheet encontrada no FIDC {name}, será lida apenas a primeira.")
+                raw_table = workbook.read()
+                table = raw_table.T
+            else:
+                raw_table = workbook.read()
+                table = raw_table.T
+
+        if low_memory and not isinstance(raw_table, list):
+            # só as gestoras multi-sheet voltam à tabela bruta
+            raw_table = None
         #self.table.to_csv("./PARSED/raw_" + name + ".csv", sep = ";",  encoding = "utf-8-sig")
-        self.fidc = FIDC(path_handle = self.path_handle, calendar_handle = self.calendar_handle, table = table, raw_table = raw_table, name = name, type = type, pattern = pattern)
+        self.fidc = FIDC(path_handle = self.path_handle, calendar_handle = self.calendar_handle, table = table, raw_table = raw_table, name = name, type = type, pattern = pattern, index = self.manager.exact_index)
         logger.info(f"FIDC {self.fidc.name} da Gestora {self.fidc.type} carregado com sucesso.")
 
     # --------------------------------------------------------------------- #
     # PEQUENOS HELPERS (sem warnings)
     # --------------------------------------------------------------------- #
-    def _extract_indexes_and_prepare(self, tbl: pd.DataFrame, item_label: str = "Item") -> Tuple[
-        pd.DataFrame, pd.Series]:
+    @staticmethod
+    def _normalize_label(value: Any) -> str:
+        """Forma canônica de um rótulo para a busca aproximada: minúsculas e espaços colapsados."""
+        return " ".join(str(value).split()).casefold()
+
+    def _locate_label(self, tbl: pd.DataFrame, labels: Union[str, Sequence[str]], fuzzy: bool = True) -> Tuple[int, int]:
+        """
+        Encontra a primeira célula (percorrendo linha a linha) cujo conteúdo é um dos rótulos em `labels`.
+
+        A busca é feita com máscaras de igualdade do NumPy sobre o array da tabela, sem acesso célula a célula.
+        Se nenhuma célula for exatamente igual a um dos rótulos e `fuzzy` for True, as células de texto são
+        comparadas ignorando maiúsculas/minúsculas e espaços extras.
+
+        Args:
+            tbl (pd.DataFrame): Tabela original lida do Excel.
+            labels (Union[str, Sequence[str]]): Rótulo ou lista de rótulos candidatos.
+            fuzzy (bool, optional): Se True, faz a busca aproximada quando não há correspondência exata. Default é True.
+
+        Returns:
+            Tuple[int, int]: Posição (linha, coluna) da célula encontrada.
+
+        Raises:
+            ValueError: Se nenhum dos rótulos for encontrado na tabela.
+        """
+        labels = [labels] if isinstance(labels, str) else list(labels)
+        values = tbl.to_numpy(dtype=object)
+
+        mask = np.zeros(values.shape, dtype=bool)
+        for label in labels:
+            mask |= (values == label)
+
+        if not mask.any() and fuzzy and values.size:
+            is_text = np.frompyfunc(lambda v: isinstance(v, str), 1, 1)(values).astype(bool)
+            wanted = {self._normalize_label(label) for label in labels}
+            mask[is_text] = [self._normalize_label(v) in wanted for v in values[is_text]]
+
+        if not mask.any():
+            raise ValueError(f"Rótulo {' / '.join(labels)} não encontrado na tabela.")
+        i, j = np.unravel_index(np.argmax(mask), mask.shape)
+        return int(i), int(j)
+
+    def _extract_indexes_and_prepare(self, tbl: pd.DataFrame, item_label: Union[str, Sequence[str]] = "Item",
+                                     fuzzy: bool = True) -> Tuple[pd.DataFrame, pd.Series]:
         """
         Extrai a coluna de índice a partir do rótulo `item_label`, promove a primeira linha encontrada como cabeçalho,
         e remove as linhas originais do cabeçalho.
 
         Passos:
-            - Busca a célula que contém `item_label`.
+            - Busca a célula que contém `item_label` (via `_locate_label`).
             - Usa a coluna abaixo dessa célula como índice.
             - Promove a linha onde `item_label` foi encontrado como cabeçalho das colunas.
             - Remove as linhas acima e inclusive a linha do cabeçalho antigo.
 
         Args:
             tbl (pd.DataFrame): Tabela original lida do Excel.
-            item_label (str, optional): Texto que identifica a coluna índice. Default é "Item".
+            item_label (Union[str, Sequence[str]], optional): Texto (ou textos candidatos) que identifica a coluna
+                índice. Default é "Item".
+            fuzzy (bool, optional): Aceita o rótulo com diferenças de maiúsculas/minúsculas e espaços. Default é True.
 
         Returns:
             Tuple[pd.DataFrame, pd.Series]:
@@ -90,20 +151,12 @@ class ExcelTransformer(object):
                 - Série contendo os valores da coluna índice extraída.
 
         Raises:
-            Exception: Se ocorrer erro na extração, a exceção é relançada com mensagem descritiva.
+            Exception: Se o rótulo não for encontrado ou ocorrer erro na extração, a exceção é relançada com
+                mensagem descritiva.
         """
         try:
-            found = False
-            m = 0
-            for i in range(tbl.shape[0]):
-                for j in range(tbl.shape[1]):
-                    if tbl.iloc[i, j] == item_label:
-                        idx = tbl.iloc[i + 1:, j]  # values below header row
-                        m = i
-                        found = True
-                        break  # interrompe o loop interno
-                if found:
-                    break
+            m, j = self._locate_label(tbl, item_label, fuzzy)
+            idx = tbl.iloc[m + 1:, j]  # values below header row
             tbl.columns = tbl.iloc[m, :].infer_objects()
             tbl = tbl.drop(tbl.index[:m + 1])
 
@@ -169,43 +222,30 @@ class ExcelTransformer(object):
     # --------------------------------------------------------------------- #
     # YAML & COLUMN CHECKERS
     # --------------------------------------------------------------------- #
-    def _check_name(
-            self,
-            name: str,
-            patterns_fidcs: Dict[str, List[Dict[str, Any]]]
-    ) -> Tuple[str, Any]:
+    def _check_name(self, name: str) -> ManagerPattern:
         """
         Verifica se um nome está presente nas definições de padrões dos FIDCs e retorna seu tipo e padrão.
 
-        Busca o `name` dentro do dicionário `patterns_fidcs` que contém gestores e seus respectivos padrões.
+        A busca usa o registro de padrões do processo (`PATTERNS`), que lê o `fidcs.yaml` uma única vez.
         - Se o nome está listado dentro da chave 'FUNDS' de um gestor, retorna o nome do gestor e seu padrão.
         - Se o nome coincide diretamente com o nome do gestor, retorna o padrão do gestor.
 
         Args:
             name (str): Nome a ser verificado.
-            patterns_fidcs (Dict[str, List[Dict[str, Any]]]): Dicionário contendo os padrões dos FIDCs.
 
         Returns:
-            Tuple[str, Any]: Tupla contendo o tipo (nome do gestor) e o padrão associado.
+            ManagerPattern: Padrão do gestor, com o nome (tipo do FIDC), os pares (regex, tipo da regra) e o índice compilado.
 
         Raises:
             Exception: Se o nome não for encontrado no YAML de padrões.
         """
-        for manager_name, items in patterns_fidcs.items():
-            itemskeys = set(key for d in items for key in d.keys())
-            if 'FUNDS' in itemskeys:
-                if name in items[1]['FUNDS']:
-                    logger.info(f"Nome {name} encontrado na Gestora {manager_name}.")
-                    type_ = manager_name
-                    pattern = patterns_fidcs[manager_name][0]["COLUMNS"]
-                    return type_, pattern
-            elif name == manager_name:
-                logger.info(f"Nome {name} encontrado.")
-                pattern = next(iter(patterns_fidcs[manager_name][0].values()))
-                type_ = manager_name
-                return type_, pattern
-        logger.error(f"Nome {name} não encontrado no YAML de padrões de FIDCs.")
-        raise Exception(f"Nome {name} não encontrado no YAML de padrões de FIDCs.")
+        try:
+            manager = PATTERNS.manager_of(name, os.path.join(PATH, "fidcs.yaml"))
+        except KeyError:
+            logger.error(f"Nome {name} não encontrado no YAML de padrões de FIDCs.")
+            raise Exception(f"Nome {name} não encontrado no YAML de padrões de FIDCs.")
+        logger.info(f"Nome {name} encontrado na Gestora {manager.name}.")
+        return manager
 
     def _check_columns(self, data: pd.DataFrame) -> pd.DataFrame:
         """
@@ -223,55 +263,50 @@ class ExcelTransformer(object):
         Returns:
             pd.DataFrame: DataFrame com colunas ajustadas conforme o padrão, removendo as inválidas.
         """
-        expected_columns = self.fidc.pattern.copy()
+        index = self.manager.index
         data.columns = data.columns.astype(str)
         columns = list(data.columns)
+        assigned = index.assign(columns)
 
         # Verificação das colunas esperadas
-        for item in expected_columns:
-            expected_column_name, type_column = next(iter(item.items()))
-            matched = any(re.fullmatch(expected_column_name, col) for col in columns)
-            if not matched:
+        found = {i for col in columns for i in index.matches(col)}
+        for i, (expected_column_name, type_column) in enumerate(index.rules):
+            if i not in found:
                 logger.debug(
                     f"COLUNA NO PADRÃO(REGEX) {expected_column_name} ESPERADA NÃO ENCONTRADA NO FIDC {self.fidc.name}."
                 )
 
-        # Verificação e remoção das colunas extras ou com atributo de remoção
-        for col in columns:
-            matched = False
-            for i, item in enumerate(expected_columns):
-                pattern, value = next(iter(item.items()))
-                if re.fullmatch(pattern, col, flags=re.IGNORECASE):
-                    matched = True
-                    if value == 'remove':
-                        idx = data.columns.get_loc(col)
-                        if isinstance(idx, (np.ndarray, list)):
-                            pos = np.where(idx)[0]  # apagando pelo final
-                            data = data.iloc[:, [j for j in range(data.shape[1]) if j != pos[1]]]
-                        else:
-                            data = data.drop(col, axis=1)
-                        logger.debug(f"Coluna {col} removida, devido ao atributo 'remove'")
-                    elif value == "removerepeat":
-                        idx = data.columns.get_loc(col)
-                        pos = np.where(idx)[0]  # apagando pelo começo
-                        data = data.iloc[:, [j for j in range(data.shape[1]) if j != pos[0]]]
-                        logger.debug(f"Coluna {col} removida, devido ao atributo 'remove'")
-
-                    # Remove da lista expected_columns se não for um tipo repetido
-                    if value not in ('repeat', 'repeatpercent', 'repeatmez', 'repeatsen'):
-                        del expected_columns[i]
-                    break
-
-            if not matched:
-                idx = data.columns.get_loc(col)
-                if isinstance(idx, (np.ndarray, list)):
-                    pos = np.where(idx)[0]
-                    data = data.iloc[:, [j for j in range(data.shape[1]) if j != pos[1]]]
-                else:
-                    data = data.drop(col, axis=1)
+        # Verificação e remoção das colunas extras ou com atributo de remoção.
+        # As remoções são feitas sobre a lista de posições mantidas e aplicadas à tabela uma única vez no final.
+        kept = list(range(len(columns)))
+
+        def drop(col: str, which: int) -> None:
+            idx = pd.Index([columns[k] for k in kept]).get_loc(col)
+            if isinstance(idx, (np.ndarray, list)):
+                pos = np.where(idx)[0]
+                del kept[pos[which]]
+            else:
+                kept[:] = [k for k in kept if columns[k] != col]
+
+        for col, rule in zip(columns, assigned):
+            if rule is None:
+                drop(col, 1)
                 logger.debug(f"Coluna {col} removida, pois não era prevista no padrão")
-
-        return data
+                continue
+
+            value = index.rules[rule][1]
+            if value == 'remove':
+                drop(col, 1)  # apagando pelo final
+                logger.debug(f"Coluna {col} removida, devido ao atributo 'remove'")
+            elif value == "removerepeat":
+                idx = pd.Index([columns[k] for k in kept]).get_loc(col)
+                pos = np.where(idx)[0]  # apagando pelo começo
+                del kept[pos[0]]
+                logger.debug(f"Coluna {col} removida, devido ao atributo 'remove'")
+
+        if len(kept) == len(columns):
+            return data
+        return data.iloc[:, kept]
 
     # --------------------------------------------------------------------- #
     # TRANSFORM
@@ -279,7 +314,11 @@ class ExcelTransformer(object):
     def transform_table(self) -> pd.DataFrame:
         """
             Realiza a transformação da tabela Excel conforme o tipo do FIDC, aplicando diversos tratamentos específicos
-            para cada tipo, e salva o resultado final em CSV no caminho especificado.
+            para cada tipo, e salva o resultado final em CSV no caminho especificado (e também em Parquet, com colunas
+            float64, se `output_format` for "parquet").
+
+            As etapas de cada gestora vêm do registro `STRATEGIES` (ver `strategies.py`), indexado pelo tipo do FIDC;
+            o tempo de cada etapa fica em `self.stage_timings` e é registrado em nível debug.
 
             O processamento inclui:
                 - Extração e preparação dos índices.
@@ -293,251 +332,39 @@ class ExcelTransformer(object):
             Returns:
                 pd.DataFrame: DataFrame transformado e salvo no arquivo CSV.
             """
-        table_copy = self.fidc.table.copy()
-        fidc_type = self.fidc.type
-
-        # -------- TERCON -------------------------------------------------- #
-        if fidc_type == "TERCON":
-            if table_copy.index.equals(pd.RangeIndex(len(table_copy))):
-                table_copy.index = table_copy.iloc[:, 0] # se não tiver index, vamos usar a primeira coluna como index
-            table_copy, indexes = self._extract_indexes_and_prepare(table_copy)
-            table_copy, _ = self._standardize(table_copy, indexes, drop_item=False, reset_index=False)
-
-            table_copy = table_copy[
-                ~(pd.to_datetime(indexes.index, errors="coerce")).isna()
-            ]
-
-        # -------- M8 ------------------------------------------------------ #
-        elif fidc_type == "M8":
-            table_copy, indexes = self._extract_indexes_and_prepare(table_copy)
-            table_copy, indexes = self._standardize(table_copy, indexes)
-            date = self.fidc.convert_date(indexes)
-            self._set_index(table_copy, date)
-
-        # -------- ORRAM --------------------------------------------------- #
-        elif fidc_type == "ORRAM":
-            def _prep_sheet(sheet):
-                sheet, idx = self._extract_indexes_and_prepare(sheet, "Item")
-                sheet, _ = self._standardize(sheet, idx, do_check=False)  # <- skip check here
-                return sheet
-
-            processed = [
-                _prep_sheet(s.dropna(how="all"))  # ignore empty sheets
-                for s in self.fidc.raw_table
-            ]
-
-            table_copy = reduce(
-                lambda l, r: pd.merge(l, r, on="Item", how="inner"),
-                processed,
-            )
-            indexes = table_copy["Item"]
-            table_copy = self._check_columns(table_copy)
-
-            if self.fidc.name == "SIFRANPP":
-                table_copy = self.fidc.sum_columns(table_copy, "mez")
-                table_copy["PL Sênior"] = np.nan
-                table_copy = self.fidc.sum_columns(table_copy, "sen")
-            table_copy = self.fidc.correct_assets(table_copy)
-            self._set_index(table_copy, indexes)
-
-        # -------- ALFA ---------------------------------------------------- #
-        elif fidc_type == "ALFA":
-            table_copy, indexes = self._extract_indexes_and_prepare(table_copy)
-            table_copy, indexes = self._standardize(table_copy, indexes)
-            self._set_index(table_copy, indexes)
-
-            table_copy = self.fidc.create_10_biggests(table_copy, "Sacado")
-            table_copy = self.fidc.create_10_biggests(table_copy, "Cedente")
-
-
-        # -------- BARCELONA ----------------------------------------------- #
-        elif fidc_type == "BARCELONA":
-            table_copy, indexes = self._extract_indexes_and_prepare(table_copy)
-            table_copy, indexes = self._standardize(table_copy, indexes)
-            table_copy = self.fidc.correct_assets(table_copy)
-            self._set_index(table_copy, indexes)
-
-
-        # -------- UNIQUEAAA -------------------------------------------------- #
-        if fidc_type == "UNIQUEAAA":
-            table_copy, indexes = self._extract_indexes_and_prepare(table_copy)
-            table_copy, _ = self._standardize(table_copy, indexes, drop_item=False, reset_index=False)
-            table_copy = table_copy[
-                ~(pd.to_datetime(indexes, errors="coerce")).isna()
-            ]
-            indexes = indexes[~(pd.to_datetime(indexes, errors="coerce")).isna()]
-            self._set_index(table_copy, indexes)
-
-        # -------- MULTIASSET ---------------------------------------------- #
-        elif fidc_type == "MULTIASSET":
-            def _prep_sheet(sheet):
-                sheet, idx = self._extract_indexes_and_prepare(sheet, "Item")
-                sheet, _ = self._standardize(sheet, idx, do_check=False)  # <- skip check here
-                return sheet
-
-            processed = [
-                _prep_sheet(s.dropna(how="all"))  # ignore empty sheets
-                for s in self.fidc.raw_table
-            ]
-            table_copy = reduce(
-                lambda l, r: pd.merge(l, r, on="Item", how="inner"),
-                processed,
-            )
-
-            indexes = table_copy["Item"]
-
-            table_copy = self._check_columns(table_copy)
-            table_copy = self.fidc.correct_assets(table_copy)
-            self._set_index(table_copy, indexes)
-
-        # -------- MULTIPLIKE ---------------------------------------------- #
-        elif fidc_type == "MULTIPLIKE":
-            table_copy, indexes = self._extract_indexes_and_prepare(table_copy)
-            table_copy, indexes = self._standardize(table_copy, indexes)
-
-            table_copy = self.fidc.create_10_biggests(table_copy, "Sacado")
-            table_copy = self.fidc.create_10_biggests(table_copy, "Cedente")
-            table_copy.index = indexes
-            table_copy = table_copy[
-                ~(pd.to_datetime(table_copy.index, errors="coerce")).isna()
-            ]
-
-        # -------- ONE7 ---------------------------------------------------- #
-        elif fidc_type == "ONE7":
-            table_copy, indexes = self._extract_indexes_and_prepare(table_copy)
-            table_copy, _ = self._standardize(table_copy, indexes, drop_item=False)
-            table_copy = self.fidc.create_10_biggests(table_copy, "Sacado")
-            table_copy = self.fidc.create_10_biggests(table_copy, "Cedente")
-            date = self.fidc.convert_date(indexes)
-            self._set_index(table_copy, date)
-
-        # -------- VALOREM ------------------------------------------------- #
-        elif fidc_type == "VALOREM":
-            table_copy, indexes = self._extract_indexes_and_prepare(
-                table_copy, "Descrição/Período"
-            )
-            table_copy, indexes = self._standardize(table_copy, indexes, subset = "Descrição/Período")
-            table_copy = self.fidc.clean_column_names(table_copy)
-            self._set_index(table_copy, indexes)
-
-        # -------- SOLAR --------------------------------------------------- #
-        elif fidc_type == "SOLAR":
-            table_copy, indexes = self._extract_indexes_and_prepare(table_copy)
-            table_copy, indexes = self._standardize(table_copy, indexes)
-            self._set_index(table_copy, indexes)
-            table_copy = self.fidc.correct_values(table_copy)
-            table_copy = self.fidc.correct_percentages(
-                table_copy, "PL Total Classe (R$ mil)"
-            )
-            table_copy = self.fidc.create_10_biggests(table_copy, "Sacado")
-            table_copy = self.fidc.create_10_biggests(table_copy, "Cedente")
-
-        # -------- ONIX ---------------------------------------------------- #
-        elif fidc_type == "ONIXOLD":
-            table_copy, indexes = self._extract_indexes_and_prepare(table_copy)
-            table_copy, indexes = self._standardize(table_copy, indexes, multi_item = True)
-            self._set_index(table_copy, indexes)
-
-            table_copy = table_copy[
-                ~(pd.to_datetime(table_copy.index, errors="coerce")).isna()
-            ]
-            table_copy = self.fidc.correct_assets(table_copy)
-            table_copy = self.fidc.create_10_biggests(table_copy, "Sacado")
-            table_copy = self.fidc.create_10_biggests(table_copy, "Cedente")
-
-        # -------- RAIZES -------------------------------------------------- #
-        elif fidc_type == "RAIZES":
-            table_copy, indexes = self._extract_indexes_and_prepare(table_copy)
-            table_copy, indexes = self._standardize(table_copy, indexes, multi_item=True)
-            self._set_index(table_copy, indexes)
-            table_copy = self.fidc.create_10_biggests(table_copy, "Sacado")
-            table_copy = self.fidc.create_10_biggests(table_copy, "Cedente")
-
-        # -------- FIRMA --------------------------------------------------- #
-        elif fidc_type == "FIRMA":
-            def _prep_sheet(sheet):
-                sheet, idx = self._extract_indexes_and_prepare(sheet, "Item")
-                sheet, _ = self._standardize(sheet, idx, do_check=False)  # <- skip check here
-                return sheet
-
-            processed = [
-                _prep_sheet(s.dropna(how="all"))  # ignore empty sheets
-                for s in self.fidc.raw_table
-            ]
-
-            table_copy = reduce(
-                lambda l, r: pd.merge(l, r, on="Item", how="inner"),
-                processed,
-            )
-            indexes = table_copy["Item"]
-            table_copy = self._check_columns(table_copy)
-            self._set_index(table_copy, indexes)
-
-        # -------- RNX ----------------------------------------------------- #
-        elif fidc_type == "RNX":
-            table_copy, indexes = self._extract_indexes_and_prepare(table_copy)
-            table_copy, indexes = self._standardize(table_copy, indexes)
-            date = self.fidc.convert_date(indexes)
-            self._set_index(table_copy, date)
-            table_copy = self.fidc.correct_column_names(table_copy)
-            table_copy = self.fidc.create_10_biggests(table_copy, "Sacado")
-            table_copy = self.fidc.create_10_biggests(table_copy, "Cedente")
-
-        # -------- SABIA --------------------------------------------------- #
-        elif fidc_type == "SABIA":
-            table_copy, indexes = self._extract_indexes_and_prepare(table_copy)
-            table_copy, indexes = self._standardize(table_copy, indexes)
-            date = self.fidc.convert_date(indexes)
-            self._set_index(table_copy, date)
-            table_copy = self.fidc.create_10_biggests(table_copy, "Sacado")
-            table_copy = self.fidc.create_10_biggests(table_copy, "Cedente")
-
-        # -------- OXSS ---------------------------------------------------- #
-        elif fidc_type == "OXSS":
-            table_copy, indexes = self._extract_indexes_and_prepare(table_copy)
-            table_copy, _ = self._standardize(table_copy, indexes, drop_item=False, reset_index=False)
-
-        # -------- IOSAN --------------------------------------------------- #
-        elif fidc_type == "IOXI(IOSAN)":
-            table_copy, indexes = self._extract_indexes_and_prepare(table_copy, "FIDC")
-            table_copy, indexes = self._standardize(table_copy, indexes, subset = "FIDC")
-            table_copy = self.fidc.correct_percentages(
-                table_copy, "PL Total"
-            )
-            table_copy = self.fidc.correct_column_names(table_copy)
-            self._set_index(table_copy, indexes)
-
-        elif fidc_type == "IOXI(IOSAN)(NOVO)":
-            table_copy, indexes = self._extract_indexes_and_prepare(table_copy)
-            table_copy, indexes = self._standardize(table_copy, indexes, subset = "Item")
-            table_copy = self.fidc.correct_column_names(table_copy)
-            self._set_index(table_copy, indexes)
-
-        # -------- INTERBANK ------------------------------------------------ #
-        elif fidc_type == "INTERBANK":
-            table_copy, indexes = self._extract_indexes_and_prepare(table_copy)
-            table_copy, indexes = self._standardize(table_copy, indexes, drop_item=False, reset_index=False)
-            table_copy = table_copy[
-                ~(pd.to_datetime(indexes.index, errors="coerce")).isna()
-            ]
-            table_copy = self.fidc.rename_columns(table_copy, ["10 Maiores Cedentes (R$)", "Cedente 1", "10 Maiores Sacados (R$)", "Sacado 1", "Antecipado", "D0", "Entre D1-D5", "Entre D6-D15", "Entre D16-D30", "Acima de D30"])
+        if self.low_memory:
+            # a tabela passa a existir só no estado da transformação
+            state = TransformState(self.fidc.table)
+            self.fidc.table = None
+        else:
+            state = TransformState(self.fidc.table.copy())
+        self.stage_timings = []
+
+        for stage in strategy_for(self.fidc.type):
+            start = time.perf_counter()
+            stage(self, state)
+            elapsed = time.perf_counter() - start
+            self.stage_timings.append((stage.name, elapsed))
+            logger.debug(f"FIDC {self.fidc.name} ({self.fidc.type}): etapa {stage.name} em {elapsed:.3f}s.")
+
+        table_copy = state.table
+        state.table = None
 
         # ----------------------------------------------------------------- #
         # Salvar / atualizar instância
         # ----------------------------------------------------------------- #
         table_copy = self.fidc.convert_to_double(table_copy)
-        table_copy = self.fidc._days_to_start_of_month(table_copy)
+        table_copy = self.fidc._days_to_start_of_month(table_copy, copy=not self.low_memory)
         table_copy.index.name = "Data"
 
         #file_name = f"{self.fidc.name}" + "_" + date + ".csv"
 
         #path_out = os.path.join(path, file_name)
         # print(table_copy.tail())
+        write_parsed(table_copy, self.path_save, self.output_format)
         table_copy = table_copy.astype(str)
-        # print(table_copy.tail())
-        table_copy.to_csv(self.path_save, sep = ";",  encoding = "utf-8-sig")
 
-        self.fidc.table = table_copy.copy()
-        logger.info(f"Transformação finalizada e CSV salvo em {self.path_save}")
+        self.fidc.table = table_copy if self.low_memory else table_copy.copy()
+        logger.info(f"Transformação finalizada e {self.output_format.upper()} salvo em {self.path_save}")
 
         return table_copy
\ No newline at end of file
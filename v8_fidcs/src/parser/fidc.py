@@ -1,5 +1,7 @@
-from typing import Union, List, Optional
+from typing import Dict, FrozenSet, Union, List, Optional, Tuple
 from v8_fidcs.src.others.logger import LogFIDC
+from v8_fidcs.src.parser.patterns import ColumnIndex
+from v8_fidcs.src.parser.dates import parse_dates
 #from v8_utilities.yaml_functions import load_yaml
 
 import pandas as pd
@@ -12,7 +14,7 @@ import re
 logger = LogFIDC()
 
 class FIDC():
-    def __init__(self, path_handle, calendar_handle, table: pd.DataFrame, raw_table: Union[pd.DataFrame, list], name: str, type: str, pattern: list) -> None:
+    def __init__(self, path_handle, calendar_handle, table: pd.DataFrame, raw_table: Union[pd.DataFrame, list], name: str, type: str, pattern: Tuple[Tuple[str, str], ...], index: Optional[ColumnIndex] = None) -> None:
         #patterns_fidcs = load_yaml(os.path.join(PATH, "fidcs.yaml"))
         self.path_handle = path_handle
         self.calendar_handle = calendar_handle
@@ -22,6 +24,14 @@ class FIDC():
         self.name = name
         self.type = type
         self.pattern = pattern
+        self.index = index if index is not None else ColumnIndex(pattern, ignore_case=False)
+
+        # classificação das colunas da última tabela vista, refeita só quando as colunas mudam
+        self._classified_columns: Optional[Tuple[str, ...]] = None
+        self._column_types: Dict[str, FrozenSet[str]] = {}
+
+        # preenchido por `convert_to_double(..., diagnostics=True)`
+        self.conversion_diagnostics: Optional[pd.DataFrame] = None
 
         self._ptbr_num = re.compile(
             r'''^          # start
@@ -34,29 +44,97 @@ class FIDC():
             re.VERBOSE,
         )
 
-    def _str_ptbr_to_float(self, s: str) -> float:
+    def _classify_columns(self, data: pd.DataFrame) -> Dict[str, FrozenSet[str]]:
         """
-        Converte uma string numérica no formato brasileiro para float.
+        Classifica as colunas de `data` pelos tipos de regra do YAML que casam com cada uma.
 
-        Exemplo:
-            '322.850,74' → 322850.74
+        A classificação é guardada e reaproveitada por todos os ajustes enquanto as colunas da tabela
+        forem as mesmas; qualquer mudança (coluna criada, removida ou renomeada) faz com que seja refeita.
 
-        Assumes que a string já está validada e corresponde ao padrão `_ptbr_num`.
+        Args:
+            data (pd.DataFrame): DataFrame cujas colunas serão classificadas.
+
+        Returns:
+            Dict[str, FrozenSet[str]]: Mapeamento coluna -> tipos de regra que casam com ela.
+        """
+        columns = tuple(data.columns)
+        if columns != self._classified_columns:
+            self._column_types = {col: self.index.types_of(col) for col in columns}
+            self._classified_columns = columns
+        return self._column_types
+
+    def _columns_of(self, data: pd.DataFrame, *types: str) -> List[str]:
+        """
+        Colunas de `data` (na ordem da tabela, com repetições) que casam com alguma regra dos tipos informados.
+        """
+        column_types = self._classify_columns(data)
+        return [col for col in data.columns if not column_types[col].isdisjoint(types)]
+
+    def _coerce_objects(self, values: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Trata, de uma só vez, valores do tipo object (as colunas object da tabela, concatenadas) cujas strings
+        já estão sem espaços nas pontas.
+
+        - Strings no formato brasileiro (ex: '322.850,74') são convertidas para float.
+        - Valores que `float()` não aceita viram NaN.
+        - Os demais valores são mantidos; a conversão para float64 fica para o `astype` final.
 
         Args:
-            s (str): Valor numérico em formato de string no padrão PT-BR.
+            values (np.ndarray): Valores a tratar (dtype object, uma dimensão).
 
         Returns:
-            float: Valor convertido para ponto flutuante no padrão internacional.
+            Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]: Valores tratados e as máscaras dos números
+            PT-BR convertidos, dos valores inválidos e dos NaT encontrados.
         """
-        logger.debug(f"Número em PTBR encontrado e sendo convertido: '{s}'")
-        return float(s.replace('.', '').replace(',', '.'))
+        series = pd.Series(values, dtype=object)
+        out = values.copy()
+
+        na = series.isna().to_numpy()
+        nat = np.zeros(len(values), dtype=bool)
+        nat[na] = [v is pd.NaT for v in values[na]]
+
+        is_str = series.map(lambda v: isinstance(v, str)).to_numpy(dtype=bool)
+        ptbr = np.zeros(len(values), dtype=bool)
+        if is_str.any():
+            strings = series[is_str]
+            ptbr[is_str] = strings.str.match(self._ptbr_num).to_numpy(dtype=bool)
+            if ptbr.any():
+                cleaned = series[ptbr].str.replace(".", "", regex=False).str.replace(",", ".", regex=False)
+                out[ptbr] = cleaned.to_numpy(dtype=object).astype(np.float64)
+
+        # o cast de object para float64 do numpy usa a mesma regra de `float()`; só quando ele falha é
+        # preciso descobrir quais valores são inválidos, e apenas os recusados pelo `pd.to_numeric` são
+        # verificados um a um (o `float()` aceita formatos que o `pd.to_numeric` recusa, como '1_000')
+        invalid = np.zeros(len(values), dtype=bool)
+        rest = np.flatnonzero(~na & ~ptbr)
+        if rest.size:
+            try:
+                values[rest].astype(np.float64)
+            except (TypeError, ValueError, OverflowError):
+                numeric = pd.to_numeric(series.iloc[rest], errors="coerce").to_numpy()
+                refused = rest[np.isnan(numeric)]
+                # sem dígito, 'nan' ou 'inf' o `float()` certamente recusa a string
+                hopeless = is_str[refused]
+                hopeless[hopeless] = ~series.iloc[refused[hopeless]].str.contains(
+                    r"\d|nan|inf", case=False, regex=True).to_numpy(dtype=bool)
+                invalid[refused[hopeless]] = True
+                for pos in refused[~hopeless]:
+                    val = values[pos]
+                    if not pd.api.types.is_scalar(val):
+                        continue
+                    try:
+                        float(val)
+                    except Exception:
+                        invalid[pos] = True
+                out[invalid] = np.nan
+
+        return out, ptbr, invalid, nat
 
-    def convert_to_double(self, data: pd.DataFrame) -> pd.DataFrame:
+    def convert_to_double(self, data: pd.DataFrame, diagnostics: bool = False) -> pd.DataFrame:
         """
         Limpa e converte os dados de um DataFrame para o tipo float64 (“double”).
 
-        Operações realizadas:
+        Operações realizadas (por coluna, sem percorrer as células uma a uma em Python):
             1. Remove espaços em branco e substitui entradas vazias por NaN.
             2. Trata valores no formato brasileiro (ex: '1.234,56') e converte para float.
             3. Valida valores inválidos e converte-os para NaN.
@@ -65,55 +143,69 @@ class FIDC():
 
         Args:
             data (pd.DataFrame): DataFrame com dados brutos a serem tratados e convertidos.
+            diagnostics (bool): Se True, monta uma tabela por coluna com o que foi convertido, anulado ou
+                removido, guardada em `self.conversion_diagnostics` e registrada no log.
 
         Returns:
             pd.DataFrame: DataFrame convertido e sanitizado com valores em float64.
         """
         # 1. Replace obvious “empty” entries with NaN
-        data = data.map(lambda x: x.strip() if isinstance(x, str) else x)
+        # só colunas object podem ter strings; o `map` por coluna mantém a mesma inferência de tipos do
+        # `DataFrame.map`, sem passar pelas colunas numéricas
+        data = data.copy(deep=False)
+        for i, dtype in enumerate(data.dtypes):
+            if dtype == object:
+                data.isetitem(i, data.iloc[:, i].map(lambda x: x.strip() if isinstance(x, str) else x))
 
         invalid_entries = ["-", " ", ""]
         data = data.replace(invalid_entries, np.nan).infer_objects(copy=False)
 
-        rows_to_drop = set()
-
-        # 2. Row‑wise cleanup (colunas com nomes repetidos tratadas corretamente)
-        for i in range(data.shape[1]):
-            col = data.columns[i]
-            series = data.iloc[:, i]
-
-            for row_pos, (idx, val) in enumerate(series.items()):
-                if not pd.api.types.is_scalar(val):
-                    continue
-
-                if pd.isna(val) and type(val).__name__ == "NaTType":
-                    logger.debug(
-                        f"Valor do tipo NaT encontrado | Coluna: '{col}' | Linha: {idx} — linha será removida"
-                    )
-                    rows_to_drop.add(idx)
-                    continue
-
-                if pd.isna(val):
-                    continue
-
-                if isinstance(val, str) and self._ptbr_num.match(val):
-                    try:
-                        data.iat[row_pos, i] = self._str_ptbr_to_float(val)
-                        continue
-                    except Exception:
-                        pass
-
-                try:
-                    float(val)
-                except Exception:
-                    logger.debug(
-                        f"Valor inválido convertido para NaN: '{val}' | "
-                        f"Coluna: '{col}' | Linha: {idx}"
-                    )
-                    data.iat[row_pos, i] = np.nan
+        # 2. Conversão das colunas object todas de uma vez (colunas com nomes repetidos tratadas pela posição)
+        n_rows = data.shape[0]
+        object_cols = [i for i, dtype in enumerate(data.dtypes) if dtype == object]
+        masks = {}
+        if object_cols:
+            raw = np.column_stack([data.iloc[:, i].to_numpy(dtype=object) for i in object_cols])
+            values, ptbr, invalid, nat = (arr.reshape(raw.shape, order="F")
+                                          for arr in self._coerce_objects(raw.ravel(order="F")))
+            for j, i in enumerate(object_cols):
+                if ptbr[:, j].any() or invalid[:, j].any():
+                    data.isetitem(i, pd.Series(values[:, j], index=data.index, dtype=object))
+                masks[i] = (raw[:, j], ptbr[:, j], invalid[:, j], nat[:, j])
+
+        nat_rows = np.zeros(n_rows, dtype=bool)
+        no_values = np.zeros(n_rows, dtype=bool)
+        report = []
+        for i, dtype in enumerate(data.dtypes):
+            if i in masks:
+                column_raw, ptbr, invalid, nat = masks[i]
+            else:
+                column_raw, ptbr, invalid = None, no_values, no_values
+                if pd.api.types.is_datetime64_any_dtype(dtype) or pd.api.types.is_timedelta64_dtype(dtype):
+                    nat = data.iloc[:, i].isna().to_numpy()
+                else:
+                    nat = no_values
+
+            nat_rows |= nat
+            if diagnostics:
+                examples = column_raw[invalid][:3] if invalid.any() else []
+                report.append({
+                    "Coluna": data.columns[i],
+                    "Números PT-BR": int(ptbr.sum()),
+                    "Inválidos (NaN)": int(invalid.sum()),
+                    "NaT": int(nat.sum()),
+                    "Exemplos inválidos": ", ".join(repr(v) for v in examples),
+                })
+
+        if diagnostics:
+            self.conversion_diagnostics = pd.DataFrame(report)
+            logger.info(f"Diagnóstico da conversão para double ({self.name}):\n"
+                        f"{self.conversion_diagnostics.to_string(index=False)}")
 
         # Remoção das linhas marcadas
-        if rows_to_drop:
+        if nat_rows.any():
+            rows_to_drop = data.index[nat_rows].unique()
+            logger.debug(f"{len(rows_to_drop)} linha(s) com NaT removida(s) de {self.name}")
             data = data.drop(index=rows_to_drop)
 
         # 3. Conversão final para float64 (“double”)
@@ -131,8 +223,7 @@ class FIDC():
         Returns:
             pd.DataFrame: DataFrame com as colunas 'absolute' ajustadas para valores negativos e convertidas de milhar para unidade.
         """
-        absolute_cols = [k for d in self.pattern for k, v in d.items() if v == "absolute"]
-        cols_to_multiply = [col for col in data.columns if any(re.fullmatch(rx, col) for rx in absolute_cols)]
+        cols_to_multiply = self._columns_of(data, "absolute")
         data[cols_to_multiply] = data[cols_to_multiply] * -1000  # PDD está em milhares
         return data
 
@@ -148,8 +239,7 @@ class FIDC():
         Returns:
             pd.DataFrame: DataFrame com as colunas 'valueR1000' convertidas de milhar para unidade.
         """
-        r1000_cols = [k for d in self.pattern for k, v in d.items() if v == "valueR1000"]
-        cols_to_multiply = [col for col in data.columns if any(re.fullmatch(rx, col) for rx in r1000_cols)]
+        cols_to_multiply = self._columns_of(data, "valueR1000")
         data[cols_to_multiply] = data[cols_to_multiply] * 1000
         return data
 
@@ -167,8 +257,7 @@ class FIDC():
         Returns:
             pd.DataFrame: DataFrame com as colunas percentuais corrigidas com base na coluna alvo.
         """
-        percent_cols = [k for d in self.pattern for k, v in d.items() if v == "repeatpercent" or v == "percentrp"]
-        cols_to_multiply = [col for col in data.columns if any(re.fullmatch(rx, col) for rx in percent_cols)]
+        cols_to_multiply = self._columns_of(data, "repeatpercent", "percentrp")
         for col in cols_to_multiply:
             idxs = [i for i, c in enumerate(data.columns) if c == col]
             for idx in idxs:
@@ -254,16 +343,9 @@ class FIDC():
         Returns:
             pd.DataFrame: DataFrame ajustado com correções e renomeações aplicadas.
         """
-        assets = list({k for d in self.pattern for k, v in d.items() if v == "asset"})
-        dc = {k for d in self.pattern for k, v in d.items() if v == "dc"}
-        renames = list({k for d in self.pattern for k, v in d.items() if v == "rename"})
-
-        assets, dc = [
-            [val for val in data.columns if any(re.fullmatch(rx, val) for rx in padroes)]
-            for padroes in (assets, dc)
-        ]
-
-        renames = [val for val in data.columns if any(re.fullmatch(rx, val) for rx in renames)]
+        assets = self._columns_of(data, "asset")
+        dc = self._columns_of(data, "dc")
+        renames = self._columns_of(data, "rename")
 
         for col in renames:
             data[f"{col} (%)"] = data[col]
@@ -294,10 +376,10 @@ class FIDC():
         def clean_col(col: str) -> str:
             return re.sub(r'\s*\(.*?\)\s*', '', col).strip()
 
-        par_cols = [k for d in self.pattern for k, v in d.items() if v == "removepar" or v == "percentrp"]
+        column_types = self._classify_columns(data)
         new_columns = {}
         for col in data.columns:
-            if any(re.fullmatch(pat, col) for pat in par_cols):
+            if not column_types[col].isdisjoint(("removepar", "percentrp")):
                 new_columns[col] = clean_col(col)
             else:
                 new_columns[col] = col  # mantém original
@@ -305,7 +387,7 @@ class FIDC():
         data = data.rename(columns=new_columns)
         return data
 
-    def _days_to_start_of_month(self, data: pd.DataFrame) -> pd.DataFrame:
+    def _days_to_start_of_month(self, data: pd.DataFrame, copy: bool = True) -> pd.DataFrame:
         """
         Ajusta o índice do DataFrame para o primeiro dia do mês correspondente a cada data,
         e agrupa as linhas mantendo apenas a primeira ocorrência de cada mês.
@@ -317,12 +399,13 @@ class FIDC():
 
         Args:
             data (pd.DataFrame): DataFrame com índice temporal (datas).
+            copy (bool): Se False, o índice de `data` é alterado no lugar, sem cópia da tabela.
 
         Returns:
             pd.DataFrame: DataFrame agrupado por mês com índice no primeiro dia de cada mês,
                           contendo apenas a primeira linha de cada mês.
         """
-        df = data.copy()
+        df = data.copy() if copy else data
         df.index = pd.to_datetime(df.index, errors='coerce')
         df = df[~df.index.isna()]
 
@@ -343,12 +426,12 @@ class FIDC():
         Returns:
             pd.DataFrame: DataFrame atualizado com a coluna alvo recebendo a soma das colunas correspondentes.
         """
-        columns_to_sum_regex = list({k for d in self.pattern for k, v in d.items() if v == "repeat" + sign})
-        columns_to_sum = [col for col in data.columns if any(re.fullmatch(rx, col) for rx in columns_to_sum_regex)]
+        columns_to_sum = self._columns_of(data, "repeat" + sign)
 
-        column_regex: Optional[str] = next((k for d in self.pattern for k, v in d.items() if v == sign), None)
-        column: Optional[str] = next((col for col in data.columns if column_regex and re.fullmatch(column_regex, col)),
-                                     None)
+        # apenas a primeira regra do tipo `sign` define a coluna alvo
+        column_rule: Optional[int] = next((i for i, (k, v) in enumerate(self.pattern) if v == sign), None)
+        column: Optional[str] = next((col for col in data.columns
+                                      if column_rule is not None and column_rule in self.index.matches(col)), None)
 
         if column:
             data[column] = data[columns_to_sum].sum(axis=1)
@@ -366,8 +449,7 @@ class FIDC():
         Returns:
             None: A função modifica o DataFrame no lugar adicionando a nova coluna.
         """
-        liquid_days_p = list({k for d in self.pattern for k, v in d.items() if v == "liquids"})
-        liquid_days = [val for val in data.columns if any(re.fullmatch(rx, val) for rx in liquid_days_p)]
+        liquid_days = self._columns_of(data, "liquids")
         data["Liquidado Total(R$)"] = data[liquid_days].sum(axis=1)
 
     def convert_date(self, arr: List[Union[str, pd.Timestamp]]) -> pd.Series:
@@ -375,10 +457,10 @@ class FIDC():
         Converte uma lista de strings ou timestamps contendo datas no formato mês-ano em português
         para objetos datetime do pandas.
 
-        O métdo realiza:
-            - Normalização e substituição do nome do mês em português pela forma capitalizada.
-            - Tenta converter as datas no formato "%B %Y" (ex: "Janeiro 2023").
-            - Para valores que falharem na primeira conversão, tenta "%B %y" (ex: "Janeiro 23").
+        A conversão é vetorizada e memorizada por conjunto de rótulos (ver `parse_dates`):
+            - Nomes de mês em português, completos ou abreviados, com ou sem acento (ex: "Janeiro 2023", "jan/23").
+            - Datas "dd/mm/aaaa" e "aaaa-mm-dd", e datas seriais do Excel.
+            - Timestamps são mantidos.
 
         Args:
             arr (List[Union[str, pd.Timestamp]]): Lista de datas em string ou pd.Timestamp.
@@ -386,34 +468,11 @@ class FIDC():
         Returns:
             pd.Series: Série do pandas contendo as datas convertidas em datetime64, com NaT para falhas.
         """
-        arr_en = []
-        for raw in arr:
-            if isinstance(raw, (pd.Timestamp,)):
-                arr_en.append(raw)
-            elif isinstance(raw, str):
-                s = re.sub(r"\s+", " ", raw.strip().replace("-", " "))
-                month, year = s.split(" ")
-                month_en = self.calendar_handle.get_month_by_name(month, "pt")
-                s = s.replace(month, month_en.capitalize())
-                arr_en.append(s)
-            else:
-                arr_en.append(raw)
-
-        # Tenta primeiro com %B %Y, depois com %B %y para os que falharem
-        dates = pd.to_datetime(arr_en, format="%B %Y", errors='coerce')
-
-        mask_na = dates.isna()
-        if mask_na.any():
-            dates2 = pd.to_datetime(pd.Series(arr_en)[mask_na], format="%B %y", errors='coerce')
-            dates = pd.Series(dates)
-            dates[mask_na] = dates2
-
-        return dates
+        return parse_dates(arr)
 
     def rename_columns(self, data:pd.DataFrame, arr_names:list[str]):
         # vo fazer essa função de forma simplificada para facilitar minha vida
-        regex_rename = list({k for d in self.pattern for k, v in d.items() if v == "rename"})
-        renames = [val for val in data.columns if any(re.fullmatch(rx, val) for rx in regex_rename)]
+        renames = self._columns_of(data, "rename")
 
         mapeamento = dict(zip(renames, arr_names))
 
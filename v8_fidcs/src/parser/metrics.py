@@ -0,0 +1,127 @@
+from typing import Callable, Iterable, Tuple, Union
+
+import pandas as pd
+import numpy as np
+
+
+def optional(data: pd.DataFrame, column: str, default: float = 0.0) -> Union[pd.Series, float]:
+    """Coluna opcional de uma fórmula: os valores ausentes (ou a coluna inteira, se não existir) valem `default`."""
+    return data[column].fillna(default) if column in data.columns else default
+
+
+def ratio(numerator: str, denominator: str = "PL Total") -> Callable[[pd.DataFrame], pd.Series]:
+    """Fórmula `numerator / denominator`."""
+    return lambda d: d[numerator] / d[denominator]
+
+
+class Metric(object):
+    """
+    Métrica derivada do relatório agrupado.
+
+    A métrica é calculada sobre colunas inteiras (uma ou várias linhas por FIDC), desde que todas as colunas de
+    `requires` existam na tabela e nenhuma das de `unless` exista. Com `fill=True`, a fórmula só preenche os
+    valores ausentes de uma coluna já existente (ou criada por uma definição anterior da mesma métrica),
+    funcionando como regra de fallback. Com `unless`, a definição é uma alternativa usada só quando a tabela
+    não tem aquelas colunas (os ausentes da alternativa principal continuam ausentes).
+
+    Args:
+        name (str): Nome da coluna gerada.
+        requires (Tuple[str, ...]): Colunas necessárias.
+        formula (Callable[[pd.DataFrame], pd.Series]): Cálculo vetorizado a partir da tabela.
+        fill (bool): Se True, apenas preenche os ausentes de `name`.
+        uses (Tuple[str, ...]): Colunas opcionais lidas pela fórmula (ver `optional`), só para consulta.
+        unless (Tuple[str, ...]): Colunas que, se existirem, impedem o cálculo.
+    """
+    __slots__ = ("name", "requires", "formula", "fill", "uses", "unless")
+
+    def __init__(self, name: str, requires: Tuple[str, ...], formula: Callable[[pd.DataFrame], pd.Series],
+                 fill: bool = False, uses: Tuple[str, ...] = (), unless: Tuple[str, ...] = ()):
+        self.name = name
+        self.requires = requires
+        self.formula = formula
+        self.fill = fill
+        self.uses = uses
+        self.unless = unless
+
+    def applies_to(self, data: pd.DataFrame) -> bool:
+        return (all(col in data.columns for col in self.requires)
+                and not any(col in data.columns for col in self.unless))
+
+    def apply(self, data: pd.DataFrame) -> None:
+        values = self.formula(data)
+        if self.fill and self.name in data.columns:
+            data[self.name] = data[self.name].fillna(values)
+        else:
+            data[self.name] = values
+
+    def __repr__(self) -> str:
+        return f"Metric({self.name!r}, requires={self.requires})"
+
+
+# catálogo, na ordem de cálculo (métricas podem depender de outras já calculadas)
+METRICS: Tuple[Metric, ...] = (
+    Metric("Subordinação (%)", ("PL Mezanino", "PL Subordinada Jr", "PL Total"),
+           lambda d: (d["PL Mezanino"] + d["PL Subordinada Jr"]) / d["PL Total"]),
+    Metric("Subordinação Jr (%)", ("PL Subordinada Jr", "PL Total"), ratio("PL Subordinada Jr")),
+    Metric("PDD Total (PL%)", ("PDD Total", "PL Total"), ratio("PDD Total")),
+    Metric("CVNP (PL%)", ("Vencidos Total", "PL Total"), ratio("Vencidos Total")),
+    Metric("CVNP - PDD (PL%)", ("CVNP (PL%)", "PDD Total (PL%)"),
+           lambda d: d["CVNP (PL%)"] - d["PDD Total (PL%)"]),
+    Metric("CVNP - PDD (PL%)", ("Vencidos Total - PDD", "PL Total"), ratio("Vencidos Total - PDD"), fill=True),
+    Metric("Concentração Maior Cedente (PL%)", ("Cedente 1", "PL Total"), ratio("Cedente 1")),
+    Metric("Concentração Maior Sacado (PL%)", ("Sacado 1", "PL Total"), ratio("Sacado 1")),
+    Metric("Concentração 10 Maiores Cedentes (PL%)", ("Concentração Top 10 Cedentes (R$)", "PL Total"),
+           ratio("Concentração Top 10 Cedentes (R$)")),
+    Metric("Concentração 10 Maiores Sacados (PL%)", ("Concentração Top 10 Sacados (R$)", "PL Total"),
+           ratio("Concentração Top 10 Sacados (R$)")),
+    Metric("Recompra (PL%)", ("Recompra (R$)", "PL Total"), ratio("Recompra (R$)")),
+    Metric("Liquidados Total (PL%)", ("Liquidado Total (R$)", "PL Total"), ratio("Liquidado Total (R$)")),
+    Metric("Duplicata (PL%)", ("Duplicata (%)",), lambda d: d["Duplicata (%)"]),
+    Metric("Duplicata (PL%)", ("Duplicata", "PL Total"), ratio("Duplicata"), unless=("Duplicata (%)",)),
+    Metric("Taxa Média", ("Taxa Média", "Taxa Ponderada de Cessão"),
+           lambda d: d["Taxa Média"].fillna(d["Taxa Ponderada de Cessão"])),
+    Metric("Volume Operado (PL%)", ("Volume Operado", "Valor Pago nas Operações no Mês", "PL Total"),
+           lambda d: d["Valor Pago nas Operações no Mês"].fillna(d["Volume Operado"]) / d["PL Total"]),
+    Metric("Caixa/Disponibilidades (%PL)", ("Caixa/Disponibilidades", "PL Total"),
+           lambda d: (d["Caixa/Disponibilidades"] + optional(d, "Fundo Soberano")) / d["PL Total"],
+           uses=("Fundo Soberano",)),
+    Metric("Alavancagem", ("PL Subordinada Jr", "PL Total"), lambda d: d["PL Total"] / d["PL Subordinada Jr"]),
+    Metric("Indicador 1", ("PL Subordinada Jr", "Concentração Top 10 Cedentes (R$)"),
+           lambda d: d["PL Subordinada Jr"] / d["Concentração Top 10 Cedentes (R$)"]),
+    Metric("Indicador 2", ("PL Subordinada Jr", "PL Mezanino", "Concentração Top 10 Cedentes (R$)"),
+           lambda d: (d["PL Subordinada Jr"] + d["PL Mezanino"]) / d["Concentração Top 10 Cedentes (R$)"]),
+    Metric("Prazo Médio (Padronizado D.C)", ("Prazo Médio (D.C)", "Prazo Médio (D.U)"),
+           lambda d: pd.Series(np.where(d["Prazo Médio (D.U)"].isna(), d["Prazo Médio (D.C)"],
+                                        d["Prazo Médio (D.U)"] * 30 / 22), index=d.index)),
+)
+
+
+def apply_metrics(data: pd.DataFrame, metrics: Iterable[Metric] = METRICS) -> pd.DataFrame:
+    """
+    Calcula, no lugar, todas as métricas do catálogo cujas colunas necessárias existem em `data`.
+
+    As fórmulas são operações de coluna, então `data` pode ter uma linha por FIDC (um mês) ou várias
+    (painel com vários meses).
+
+    Returns:
+        pd.DataFrame: A própria `data`, com as colunas das métricas.
+    """
+    for metric in metrics:
+        if metric.applies_to(data):
+            metric.apply(data)
+    return data
+
+
+def metric_coverage(data: pd.DataFrame, metrics: Iterable[Metric] = METRICS) -> pd.DataFrame:
+    """
+    Indica, para cada linha de `data` (FIDC), quais métricas foram calculadas, isto é, têm valor.
+
+    Returns:
+        pd.DataFrame: Tabela booleana com o mesmo índice de `data` e uma coluna por métrica do catálogo.
+    """
+    names = list(dict.fromkeys(metric.name for metric in metrics))
+    coverage = pd.DataFrame(False, index=data.index, columns=names)
+    for name in names:
+        if name in data.columns:
+            coverage[name] = data[name].notna().to_numpy()
+    return coverage
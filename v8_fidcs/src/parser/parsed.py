@@ -0,0 +1,128 @@
+from v8_fidcs.src.others.logger import LogFIDC
+
+from typing import List
+
+import importlib.util
+
+import pandas as pd
+
+import csv
+import os
+
+logger = LogFIDC()
+
+# "csv" mantém o comportamento original; "parquet" grava também um arquivo tipado, lido pelo Grouper sem parsing de texto
+FORMATS = ("csv", "parquet")
+DEFAULT_FORMAT = "csv"
+EXTENSIONS = {"csv": ".csv", "parquet": ".parquet"}
+CSV_OPTIONS = {"sep": ";", "encoding": "utf-8-sig"}
+
+PYARROW = importlib.util.find_spec("pyarrow") is not None
+
+
+def check_format(output_format: str) -> str:
+    """
+    Valida o formato de saída da etapa 01_PARSED.
+
+    Raises:
+        ValueError: Se `output_format` não for um dos valores de `FORMATS`.
+    """
+    if output_format not in FORMATS:
+        raise ValueError(f"Formato de saída {output_format} inválido. Opções: {', '.join(FORMATS)}.")
+    return output_format
+
+
+def output_paths(path_csv: str, output_format: str) -> List[str]:
+    """
+    Arquivos gerados para um FIDC. O CSV é sempre gravado (é o artefato usado pelos analistas); no formato
+    "parquet" o arquivo tipado fica ao lado dele, com o mesmo nome.
+
+    Args:
+        path_csv (str): Caminho do CSV em "01_PARSED".
+        output_format (str): Um dos valores de `FORMATS`.
+
+    Returns:
+        List[str]: Caminhos de todos os arquivos de saída.
+    """
+    if check_format(output_format) == "csv":
+        return [path_csv]
+    return [path_csv, os.path.splitext(path_csv)[0] + EXTENSIONS[output_format]]
+
+
+def _unique_columns(columns) -> List[str]:
+    """
+    Nomes de coluna como texto e sem repetição, com o mesmo sufixo (".1", ".2", ...) que o `pd.read_csv`
+    aplica às colunas repetidas do CSV.
+    """
+    seen = {}
+    out = []
+    for col in map(str, columns):
+        if col in seen:
+            seen[col] += 1
+            new_col = f"{col}.{seen[col]}"
+            while new_col in seen:
+                seen[col] += 1
+                new_col = f"{col}.{seen[col]}"
+            seen[new_col] = 0
+            out.append(new_col)
+        else:
+            seen[col] = 0
+            out.append(col)
+    return out
+
+
+def write_parsed(table: pd.DataFrame, path_csv: str, output_format: str = DEFAULT_FORMAT) -> None:
+    """
+    Grava a tabela tratada de um FIDC em "01_PARSED".
+
+    O CSV continua no formato de texto original. No formato "parquet", a tabela também é gravada com colunas
+    float64 e índice datetime ("Data"), para que o agrupamento não precise interpretar texto.
+
+    Args:
+        table (pd.DataFrame): Tabela tratada, com índice de datas.
+        path_csv (str): Caminho do CSV de saída.
+        output_format (str): Um dos valores de `FORMATS`.
+    """
+    check_format(output_format)
+
+    table.astype(str).to_csv(path_csv, **CSV_OPTIONS)
+
+    path_parquet = os.path.splitext(path_csv)[0] + EXTENSIONS["parquet"]
+    if output_format == "parquet":
+        typed = table.astype("float64")
+        typed.columns = _unique_columns(typed.columns)
+        typed.index = pd.DatetimeIndex(pd.to_datetime(typed.index), name="Data")
+        typed.to_parquet(path_parquet)
+    elif os.path.exists(path_parquet):
+        # um Parquet de uma execução anterior teria preferência sobre o CSV novo no agrupamento
+        os.remove(path_parquet)
+
+
+def _csv_header(path: str) -> List[str]:
+    """Nomes das colunas do CSV, como estão no arquivo (sem o sufixo ".1" que o `pd.read_csv` dá às repetidas)."""
+    with open(path, "r", encoding=CSV_OPTIONS["encoding"], newline="") as f:
+        return next(csv.reader(f, delimiter=CSV_OPTIONS["sep"]), [])
+
+
+def read_parsed(path: str) -> pd.DataFrame:
+    """
+    Lê um arquivo de "01_PARSED" (CSV ou Parquet) como colunas float64 indexadas pela data.
+
+    O CSV é lido com o engine do pyarrow (multithread e sem inferência de tipos: todas as colunas, exceto "Data",
+    são declaradas float64) quando o pacote está instalado, e com o engine C do pandas caso contrário.
+
+    Args:
+        path (str): Caminho do arquivo.
+
+    Returns:
+        pd.DataFrame: Tabela do FIDC com índice datetime "Data".
+    """
+    if path.endswith(EXTENSIONS["parquet"]):
+        return pd.read_parquet(path)
+
+    dtype = {col: "float64" for col in _csv_header(path) if col != "Data"}
+    engine = "pyarrow" if PYARROW else "c"
+    df = pd.read_csv(path, engine=engine, dtype=dtype, **CSV_OPTIONS)
+    df = df.set_index("Data").astype("float64", copy=False)
+    df.index = pd.DatetimeIndex(pd.to_datetime(df.index, format="ISO8601"), name="Data")
+    return df
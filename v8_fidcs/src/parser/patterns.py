@@ -0,0 +1,243 @@
+from v8_fidcs.src.others.logger import LogFIDC
+from v8_utilities.yaml_functions import load_yaml
+
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Pattern, Tuple
+
+import threading
+import hashlib
+import json
+import re
+import os
+
+# tipos de regra que podem casar com mais de uma coluna (não são consumidos no _check_columns)
+REPEAT_RULES = frozenset({"repeat", "repeatpercent", "repeatmez", "repeatsen"})
+
+logger = LogFIDC()
+
+
+class ColumnIndex(object):
+    """
+    Índice pré-compilado das regras de colunas de uma gestora.
+
+    Cada regex do YAML é compilada uma única vez, e uma alternação com todas elas serve de pré-filtro: uma coluna que não casa com a alternação é descartada com uma única
+    chamada ao motor de regex. O resultado por nome de coluna é memorizado, então cabeçalhos repetidos entre
+    FIDCs da mesma gestora (e entre meses) não são reavaliados.
+
+    Com `ignore_case=True` as regras casam sem diferenciar maiúsculas (como no `_check_columns`); com False,
+    casam exatamente como um `re.fullmatch(regex, coluna)`, que é o que os ajustes do `FIDC` usam.
+
+    Args:
+        rules (Tuple[Tuple[str, str], ...]): Pares (regex, tipo da regra), na ordem do YAML.
+        ignore_case (bool): Se True, compila as regras com IGNORECASE.
+    """
+
+    def __init__(self, rules: Tuple[Tuple[str, str], ...], ignore_case: bool = True):
+        self.rules = rules
+        self.ignore_case = ignore_case
+        flags = re.IGNORECASE if ignore_case else 0
+        self._compiled = tuple(re.compile(rx, flags) for rx, _ in rules)
+        self._prefilter = self._build_prefilter(rules, ignore_case)
+        self._matches: Dict[str, Tuple[int, ...]] = {}
+
+    @staticmethod
+    def _build_prefilter(rules: Tuple[Tuple[str, str], ...], ignore_case: bool = True) -> Optional[Pattern]:
+        """
+        Junta todas as regras em uma única alternação. Retorna None se alguma regra não puder ser combinada
+        (flags globais fora do início, grupos nomeados ou retrovisores), caso em que não há pré-filtro.
+        """
+        parts = []
+        for rx, _ in rules:
+            scoped = "?:"
+            if rx.startswith("(?i)"):
+                rx = rx[len("(?i)"):]
+                scoped = "?i:"  # no modo exato, a flag da regra vale só para ela
+            if re.search(r"\\(?:\d|g<)|\(\?P[<=]|\(\?[aiLmsux]+\)", rx):
+                return None
+            parts.append(f"({scoped}{rx})")
+        try:
+            return re.compile("|".join(parts), re.IGNORECASE if ignore_case else 0) if parts else None
+        except re.error:
+            return None
+
+    def matches(self, column: str) -> Tuple[int, ...]:
+        """
+        Posições (em `rules`) de todas as regras que casam integralmente com `column`, em ordem.
+        """
+        found = self._matches.get(column)
+        if found is None:
+            if self._prefilter is not None and self._prefilter.fullmatch(column) is None:
+                found = ()
+            else:
+                found = tuple(i for i, rx in enumerate(self._compiled) if rx.fullmatch(column))
+            self._matches[column] = found
+        return found
+
+    def types_of(self, column: str) -> FrozenSet[str]:
+        """
+        Tipos de regra de todas as regras que casam com `column`.
+        """
+        return frozenset(self.rules[i][1] for i in self.matches(column))
+
+    def assign(self, columns: Iterable[str]) -> List[Optional[int]]:
+        """
+        Atribui a cada coluna, em ordem, a primeira regra ainda disponível que casa com ela.
+
+        Regras que não são do tipo repetido (`REPEAT_RULES`) são consumidas ao serem usadas, de modo que
+        uma segunda coluna com o mesmo nome cai na próxima regra compatível ou fica sem regra.
+
+        Args:
+            columns (Iterable[str]): Nomes das colunas, na ordem da tabela.
+
+        Returns:
+            List[Optional[int]]: Posição da regra atribuída a cada coluna, ou None se nenhuma regra casar.
+        """
+        consumed = set()
+        assigned = []
+        for column in columns:
+            rule = next((i for i in self.matches(column) if i not in consumed), None)
+            if rule is not None and self.rules[rule][1] not in REPEAT_RULES:
+                consumed.add(rule)
+            assigned.append(rule)
+        return assigned
+
+    def classify(self, columns: Iterable[str]) -> Dict[str, str]:
+        """
+        Mapeamento coluna -> tipo da regra atribuída por `assign`. Colunas sem regra ficam de fora.
+        """
+        columns = list(columns)
+        return {col: self.rules[rule][1] for col, rule in zip(columns, self.assign(columns)) if rule is not None}
+
+
+class ManagerPattern(object):
+    """
+    Padrão de colunas de uma gestora, como definido no `fidcs.yaml`. Imutável depois de criado.
+
+    Attributes:
+        name (str): Nome da gestora (chave do YAML), usado como tipo do FIDC.
+        rules (Tuple[Tuple[str, str], ...]): Pares (regex da coluna, tipo da regra), na ordem do YAML.
+        funds (Tuple[str, ...]): FIDCs listados em 'FUNDS'. Vazio se a gestora não tiver essa chave.
+        index (ColumnIndex): Regras compiladas sem diferenciar maiúsculas, para o `_check_columns`.
+        exact_index (ColumnIndex): Regras compiladas diferenciando maiúsculas, para os ajustes do `FIDC`.
+        digest (str): Hash (sha256) do nome e das regras; muda só quando a entrada da gestora no YAML muda.
+    """
+    __slots__ = ("name", "rules", "funds", "digest", "_index", "_exact_index")
+
+    def __init__(self, name: str, items: list):
+        columns = next(iter(items[0].values())) or []
+        funds = next((d["FUNDS"] for d in items if "FUNDS" in d), None)
+        object.__setattr__(self, "name", name)
+        object.__setattr__(self, "rules", tuple(next(iter(d.items())) for d in columns))
+        object.__setattr__(self, "funds", tuple(funds or ()))
+        object.__setattr__(self, "digest", hashlib.sha256(json.dumps([name, self.rules], ensure_ascii=False).encode("utf-8")).hexdigest())
+        object.__setattr__(self, "_index", None)
+        object.__setattr__(self, "_exact_index", None)
+
+    def __setattr__(self, key, value):
+        raise AttributeError(f"ManagerPattern é imutável (atributo {key}).")
+
+    @property
+    def index(self) -> ColumnIndex:
+        """Índice compilado das regras, criado no primeiro uso e compartilhado por todos os FIDCs da gestora."""
+        if self._index is None:
+            object.__setattr__(self, "_index", ColumnIndex(self.rules))
+        return self._index
+
+    @property
+    def exact_index(self) -> ColumnIndex:
+        """Como `index`, mas diferenciando maiúsculas de minúsculas."""
+        if self._exact_index is None:
+            object.__setattr__(self, "_exact_index", ColumnIndex(self.rules, ignore_case=False))
+        return self._exact_index
+
+    def __repr__(self) -> str:
+        return f"ManagerPattern({self.name!r}, {len(self.rules)} regras)"
+
+
+class PatternRegistry(object):
+    """
+    Cache, por processo, dos YAMLs de padrões (fidcs.yaml, colunas.yaml, regex.yaml).
+
+    Cada arquivo é lido uma única vez e só volta a ser lido quando o seu mtime muda. Para o `fidcs.yaml`
+    também são montados uma única vez os objetos `ManagerPattern` e o índice FIDC -> gestora.
+    O conteúdo devolvido é compartilhado entre todas as instâncias e não deve ser modificado.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._files: Dict[str, Tuple[int, Any]] = {}
+        self._managers: Dict[str, Tuple[int, Dict[str, ManagerPattern], Dict[str, ManagerPattern]]] = {}
+
+    def load(self, path: str) -> Any:
+        """
+        Retorna o conteúdo do YAML em `path`, relendo o arquivo apenas se ele tiver sido alterado.
+
+        Args:
+            path (str): Caminho do arquivo YAML.
+
+        Returns:
+            Any: Conteúdo do YAML (compartilhado, somente leitura).
+        """
+        path = os.path.abspath(path)
+        mtime = os.stat(path).st_mtime_ns
+        with self._lock:
+            cached = self._files.get(path)
+            if cached is not None and cached[0] == mtime:
+                return cached[1]
+            content = load_yaml(path)
+            self._files[path] = (mtime, content)
+            logger.debug(f"YAML de padrões {path} carregado.")
+            return content
+
+    def _manager_index(self, path: str) -> Tuple[Dict[str, ManagerPattern], Dict[str, ManagerPattern]]:
+        path = os.path.abspath(path)
+        content = self.load(path)
+        mtime = self._files[path][0]
+        with self._lock:
+            cached = self._managers.get(path)
+            if cached is not None and cached[0] == mtime:
+                return cached[1], cached[2]
+
+            managers = {name: ManagerPattern(name, items) for name, items in content.items()}
+            by_fidc: Dict[str, ManagerPattern] = {}
+            # mesma precedência da busca original: primeira gestora do YAML que aceita o nome
+            for manager in managers.values():
+                if manager.funds:
+                    for fund in manager.funds:
+                        by_fidc.setdefault(fund, manager)
+                else:
+                    by_fidc.setdefault(manager.name, manager)
+
+            self._managers[path] = (mtime, managers, by_fidc)
+            return managers, by_fidc
+
+    def managers(self, path: str) -> Dict[str, ManagerPattern]:
+        """
+        Retorna todas as gestoras do `fidcs.yaml` em `path`, indexadas pelo nome.
+        """
+        return self._manager_index(path)[0]
+
+    def manager_of(self, name: str, path: str) -> ManagerPattern:
+        """
+        Encontra a gestora de um FIDC.
+
+        - Se a gestora tem 'FUNDS', o FIDC precisa estar nessa lista.
+        - Caso contrário, o nome do FIDC precisa ser igual ao nome da gestora.
+
+        Args:
+            name (str): Nome do FIDC.
+            path (str): Caminho do `fidcs.yaml`.
+
+        Returns:
+            ManagerPattern: Padrão da gestora encontrada.
+
+        Raises:
+            KeyError: Se o nome não for encontrado no YAML.
+        """
+        by_fidc = self._manager_index(path)[1]
+        if name not in by_fidc:
+            raise KeyError(name)
+        return by_fidc[name]
+
+
+# instância única por processo
+PATTERNS = PatternRegistry()
@@ -0,0 +1,359 @@
+from v8_fidcs.src.others.logger import LogFIDC
+
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+import pandas as pd
+import numpy as np
+
+logger = LogFIDC()
+
+
+class TransformState(object):
+    """
+    Estado compartilhado pelas etapas de uma transformação: a tabela em tratamento e a série de índices
+    (datas) extraída do cabeçalho.
+    """
+    __slots__ = ("table", "indexes")
+
+    def __init__(self, table: pd.DataFrame, indexes: Optional[pd.Series] = None):
+        self.table = table
+        self.indexes = indexes
+
+
+class Stage(object):
+    """
+    Etapa reutilizável de uma estratégia de transformação.
+
+    Cada etapa recebe o `ExcelTransformer` (que dá acesso aos helpers e ao `FIDC`) e o `TransformState`, e
+    altera o estado no lugar. O nome é usado nos logs de tempo por etapa.
+
+    Args:
+        name (str): Nome da etapa, com os parâmetros relevantes.
+        func (Callable[[Any, TransformState], None]): Implementação da etapa.
+    """
+    __slots__ = ("name", "func")
+
+    def __init__(self, name: str, func: Callable[[Any, TransformState], None]):
+        self.name = name
+        self.func = func
+
+    def __call__(self, transformer, state: TransformState) -> None:
+        self.func(transformer, state)
+
+    def __repr__(self) -> str:
+        return f"Stage({self.name})"
+
+
+# --------------------------------------------------------------------- #
+# ETAPAS
+# --------------------------------------------------------------------- #
+def index_from_first_column() -> Stage:
+    """Usa a primeira coluna como índice quando a tabela não tem um (índice padrão 0..n-1)."""
+    def run(t, s: TransformState) -> None:
+        if s.table.index.equals(pd.RangeIndex(len(s.table))):
+            s.table.index = s.table.iloc[:, 0]
+    return Stage("index_from_first_column", run)
+
+
+def extract(label: Union[str, Tuple[str, ...]] = "Item") -> Stage:
+    """Promove a linha de `label` (ou do primeiro candidato encontrado) a cabeçalho e extrai os índices abaixo dele."""
+    def run(t, s: TransformState) -> None:
+        s.table, s.indexes = t._extract_indexes_and_prepare(s.table, label)
+    return Stage(f"extract({label})", run)
+
+
+def standardize(**flags) -> Stage:
+    """Limpeza e checagem de colunas via `ExcelTransformer._standardize`, com as flags dadas."""
+    def run(t, s: TransformState) -> None:
+        s.table, s.indexes = t._standardize(s.table, s.indexes, **flags)
+    return Stage(f"standardize({', '.join(f'{k}={v}' for k, v in flags.items())})", run)
+
+
+# tratamento de colunas com o mesmo nome em sheets diferentes
+OVERLAPS = ("keep", "first", "last", "suffix")
+
+
+def join_sheets(sheets: List[pd.DataFrame], label: str = "Item", overlap: str = "keep") -> pd.DataFrame:
+    """
+    Junta as sheets de um FIDC pela coluna `label` em uma única passada.
+
+    Cada sheet é indexada por `label` uma vez e todas são concatenadas lado a lado com junção interna
+    (apenas os valores de `label` presentes em todas as sheets), na ordem da primeira sheet. A coluna `label`
+    volta como primeira coluna da tabela resultante.
+
+    Args:
+        sheets (List[pd.DataFrame]): Sheets já preparadas, cada uma com a coluna `label`.
+        label (str): Coluna usada como chave da junção.
+        overlap (str): O que fazer com colunas que aparecem em mais de uma sheet:
+            "keep" mantém todas com o mesmo nome (o `_check_columns` as trata como colunas repetidas);
+            "first"/"last" mantém só a da primeira/última sheet; "suffix" renomeia as repetições para
+            "<coluna>_<n>", onde n é a posição (a partir de 1) da sheet de origem.
+
+    Returns:
+        pd.DataFrame: Tabela única com a coluna `label` e as colunas de todas as sheets.
+
+    Raises:
+        ValueError: Se `overlap` não for um dos valores de `OVERLAPS`.
+    """
+    if overlap not in OVERLAPS:
+        raise ValueError(f"Tratamento de colunas repetidas {overlap} inválido. Opções: {', '.join(OVERLAPS)}.")
+
+    indexed = []
+    seen = set()
+    for n, sheet in enumerate(sheets, start=1):
+        sheet = sheet.set_index(label)
+        if sheet.index.has_duplicates:
+            logger.warning(f"Valores repetidos de {label} na sheet {n}, mantendo a primeira ocorrência.")
+            sheet = sheet[~sheet.index.duplicated(keep="first")]
+
+        repeated = [col for col in sheet.columns if col in seen]
+        if repeated and overlap == "first":
+            sheet = sheet.drop(columns=repeated)
+        elif repeated and overlap == "last":
+            indexed = [prev.drop(columns=[c for c in repeated if c in prev.columns]) for prev in indexed]
+        elif repeated and overlap == "suffix":
+            sheet = sheet.rename(columns={col: f"{col}_{n}" for col in repeated})
+        seen.update(sheet.columns)
+        indexed.append(sheet)
+
+    table = pd.concat(indexed, axis=1, join="inner")
+    table.index.name = label
+    return table.reset_index()
+
+
+def merge_sheets(label: str = "Item", overlap: str = "keep") -> Stage:
+    """
+    Para gestoras com várias sheets: prepara cada sheet não vazia, junta todas pela coluna `label`
+    (`join_sheets`) e só então checa as colunas da tabela resultante.
+    """
+    def run(t, s: TransformState) -> None:
+        def _prep_sheet(sheet):
+            sheet, idx = t._extract_indexes_and_prepare(sheet, label)
+            sheet, _ = t._standardize(sheet, idx, do_check=False)
+            return sheet
+
+        processed = [_prep_sheet(sheet.dropna(how="all")) for sheet in t.fidc.raw_table]
+        if t.low_memory:
+            t.fidc.raw_table = None
+        s.table = join_sheets(processed, label, overlap)
+        s.indexes = s.table[label]
+        s.table = t._check_columns(s.table)
+    return Stage(f"merge_sheets({label}, {overlap})", run)
+
+
+def drop_invalid_dates(on: str = "table") -> Stage:
+    """
+    Remove as linhas cuja data não é válida.
+
+    Args:
+        on (str): Origem das datas. "table": índice da tabela; "indexes": valores dos índices extraídos
+            (filtra também os índices); "index_labels": rótulos da série de índices.
+    """
+    if on not in ("table", "indexes", "index_labels"):
+        raise ValueError(f"Origem de datas {on} inválida.")
+
+    def run(t, s: TransformState) -> None:
+        if on == "table":
+            s.table = s.table[~(pd.to_datetime(s.table.index, errors="coerce")).isna()]
+        elif on == "index_labels":
+            s.table = s.table[~(pd.to_datetime(s.indexes.index, errors="coerce")).isna()]
+        else:
+            valid = ~(pd.to_datetime(s.indexes, errors="coerce")).isna()
+            s.table = s.table[valid]
+            s.indexes = s.indexes[valid]
+    return Stage(f"drop_invalid_dates({on})", run)
+
+
+def set_index(convert_date: bool = False, raw: bool = False) -> Stage:
+    """
+    Define os índices extraídos como índice da tabela.
+
+    Args:
+        convert_date (bool): Converte antes os índices com `FIDC.convert_date` (datas por extenso).
+        raw (bool): Atribui a série diretamente, sem a inferência de tipo de `_set_index`.
+    """
+    def run(t, s: TransformState) -> None:
+        if raw:
+            s.table.index = s.indexes
+        elif convert_date:
+            t._set_index(s.table, t.fidc.convert_date(s.indexes))
+        else:
+            t._set_index(s.table, s.indexes)
+    return Stage("set_index(convert_date)" if convert_date else "set_index(raw)" if raw else "set_index", run)
+
+
+def fidc_step(method: str, *args) -> Stage:
+    """Aplica à tabela um helper de correção do `FIDC` (ex: "correct_assets", "correct_percentages")."""
+    def run(t, s: TransformState) -> None:
+        s.table = getattr(t.fidc, method)(s.table, *args)
+    return Stage(f"{method}({', '.join(map(repr, args))})" if args else method, run)
+
+
+def top_10(*targets: str) -> Stage:
+    """Cria as colunas dos 10 maiores para cada alvo (ex: "Sacado", "Cedente")."""
+    def run(t, s: TransformState) -> None:
+        for target in targets:
+            s.table = t.fidc.create_10_biggests(s.table, target)
+    return Stage(f"top_10({', '.join(targets)})", run)
+
+
+def set_column(column: str, value: Any) -> Stage:
+    """Atribui `value` a uma coluna inteira."""
+    def run(t, s: TransformState) -> None:
+        s.table[column] = value
+    return Stage(f"set_column({column})", run)
+
+
+def only_for(names: Tuple[str, ...], *stages: Stage) -> Stage:
+    """Executa `stages` apenas para os FIDCs em `names`."""
+    def run(t, s: TransformState) -> None:
+        if t.fidc.name in names:
+            for stage in stages:
+                stage(t, s)
+    return Stage(f"only_for({', '.join(names)})", run)
+
+
+# --------------------------------------------------------------------- #
+# ESTRATÉGIAS POR GESTORA (chaves do fidcs.yaml)
+# --------------------------------------------------------------------- #
+STRATEGIES: Dict[str, Tuple[Stage, ...]] = {
+    "TERCON": (
+        index_from_first_column(),
+        extract(),
+        standardize(drop_item=False, reset_index=False),
+        drop_invalid_dates("index_labels"),
+    ),
+    "M8": (
+        extract(),
+        standardize(),
+        set_index(convert_date=True),
+    ),
+    "ORRAM": (
+        merge_sheets(),
+        only_for(("SIFRANPP",),
+                 fidc_step("sum_columns", "mez"),
+                 set_column("PL Sênior", np.nan),
+                 fidc_step("sum_columns", "sen")),
+        fidc_step("correct_assets"),
+        set_index(),
+    ),
+    "ALFA": (
+        extract(),
+        standardize(),
+        set_index(),
+        top_10("Sacado", "Cedente"),
+    ),
+    "BARCELONA": (
+        extract(),
+        standardize(),
+        fidc_step("correct_assets"),
+        set_index(),
+    ),
+    "UNIQUEAAA": (
+        extract(),
+        standardize(drop_item=False, reset_index=False),
+        drop_invalid_dates("indexes"),
+        set_index(),
+    ),
+    "MULTIASSET": (
+        merge_sheets(),
+        fidc_step("correct_assets"),
+        set_index(),
+    ),
+    "MULTIPLIKE": (
+        extract(),
+        standardize(),
+        top_10("Sacado", "Cedente"),
+        set_index(raw=True),
+        drop_invalid_dates("table"),
+    ),
+    "ONE7": (
+        extract(),
+        standardize(drop_item=False),
+        top_10("Sacado", "Cedente"),
+        set_index(convert_date=True),
+    ),
+    "VALOREM": (
+        extract("Descrição/Período"),
+        standardize(subset="Descrição/Período"),
+        fidc_step("clean_column_names"),
+        set_index(),
+    ),
+    "SOLAR": (
+        extract(),
+        standardize(),
+        set_index(),
+        fidc_step("correct_values"),
+        fidc_step("correct_percentages", "PL Total Classe (R$ mil)"),
+        top_10("Sacado", "Cedente"),
+    ),
+    "ONIXOLD": (
+        extract(),
+        standardize(multi_item=True),
+        set_index(),
+        drop_invalid_dates("table"),
+        fidc_step("correct_assets"),
+        top_10("Sacado", "Cedente"),
+    ),
+    "RAIZES": (
+        extract(),
+        standardize(multi_item=True),
+        set_index(),
+        top_10("Sacado", "Cedente"),
+    ),
+    "FIRMA": (
+        merge_sheets(),
+        set_index(),
+    ),
+    "RNX": (
+        extract(),
+        standardize(),
+        set_index(convert_date=True),
+        fidc_step("correct_column_names"),
+        top_10("Sacado", "Cedente"),
+    ),
+    "SABIA": (
+        extract(),
+        standardize(),
+        set_index(convert_date=True),
+        top_10("Sacado", "Cedente"),
+    ),
+    "OXSS": (
+        extract(),
+        standardize(drop_item=False, reset_index=False),
+    ),
+    "IOXI(IOSAN)": (
+        extract("FIDC"),
+        standardize(subset="FIDC"),
+        fidc_step("correct_percentages", "PL Total"),
+        fidc_step("correct_column_names"),
+        set_index(),
+    ),
+    "IOXI(IOSAN)(NOVO)": (
+        extract(),
+        standardize(subset="Item"),
+        fidc_step("correct_column_names"),
+        set_index(),
+    ),
+    "INTERBANK": (
+        extract(),
+        standardize(drop_item=False, reset_index=False),
+        drop_invalid_dates("index_labels"),
+        fidc_step("rename_columns", ["10 Maiores Cedentes (R$)", "Cedente 1", "10 Maiores Sacados (R$)", "Sacado 1",
+                                     "Antecipado", "D0", "Entre D1-D5", "Entre D6-D15", "Entre D16-D30", "Acima de D30"]),
+    ),
+}
+
+
+def strategy_for(manager: str) -> Tuple[Stage, ...]:
+    """
+    Etapas da transformação de uma gestora. Gestoras sem estratégia registrada (ex: ACREDITAR) não têm etapas
+    específicas: a tabela segue direto para a conversão numérica e o ajuste de datas.
+
+    Args:
+        manager (str): Nome da gestora (chave do `fidcs.yaml`).
+
+    Returns:
+        Tuple[Stage, ...]: Etapas, na ordem de execução.
+    """
+    return STRATEGIES.get(manager, ())
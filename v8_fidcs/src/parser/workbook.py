@@ -0,0 +1,142 @@
+from v8_fidcs.src.others.logger import LogFIDC
+
+from typing import Dict, List, Optional, Union
+
+import importlib.util
+
+import pandas as pd
+
+logger = LogFIDC()
+
+# formato numérico brasileiro usado em todas as leituras
+READ_OPTIONS = {"decimal": ",", "thousands": "."}
+
+# o openpyxl é o padrão; o calamine é opcional ("calamine", ou "auto" para usá-lo só se estiver instalado)
+ENGINES = ("auto", "calamine", "openpyxl")
+DEFAULT_ENGINE = "openpyxl"
+FALLBACK_ENGINE = "openpyxl"
+
+
+def resolve_engine(path: str, engine: str = DEFAULT_ENGINE) -> str:
+    """
+    Define o engine do pandas usado para ler `path`.
+
+    Arquivos `.xls` sempre são lidos pelo xlrd. Para os demais, "auto" escolhe o calamine se estiver
+    instalado; pedir o calamine sem o pacote instalado cai no openpyxl com um aviso.
+
+    Args:
+        path (str): Caminho do arquivo Excel.
+        engine (str): Um dos valores de `ENGINES`.
+
+    Returns:
+        str: Nome do engine a ser passado para o `pd.ExcelFile`.
+
+    Raises:
+        ValueError: Se `engine` não for um dos valores de `ENGINES`.
+    """
+    if engine not in ENGINES:
+        raise ValueError(f"Engine de leitura {engine} inválido. Opções: {', '.join(ENGINES)}.")
+
+    if path.lower().endswith(".xls"):
+        return "xlrd"
+
+    calamine = importlib.util.find_spec("python_calamine") is not None
+    if engine == "auto":
+        return "calamine" if calamine else FALLBACK_ENGINE
+    if engine == "calamine" and not calamine:
+        logger.warning(f"Pacote python-calamine não instalado, {path} será lido com {FALLBACK_ENGINE}.")
+        return FALLBACK_ENGINE
+    return engine
+
+
+class Workbook(object):
+    """
+    Planilha Excel aberta uma única vez.
+
+    O arquivo (zip, shared strings, estilos) é lido na abertura e todas as sheets são extraídas desse mesmo
+    handle, em vez de um `pd.read_excel` por sheet. Deve ser usado como context manager, para que o arquivo
+    seja fechado assim que as sheets forem lidas.
+
+    O engine rápido (calamine) só é usado quando pedido ("calamine" ou "auto"); se ele falhar ao abrir o arquivo
+    ou ao ler uma sheet, a leitura é refeita com o openpyxl, o engine padrão.
+
+    Args:
+        path (str): Caminho do arquivo Excel.
+        engine (str): Engine de leitura, um dos valores de `ENGINES`. Padrão: "openpyxl".
+    """
+
+    def __init__(self, path: str, engine: str = DEFAULT_ENGINE):
+        self.path = path
+        self.engine = resolve_engine(path, engine)
+        self._fallback: Optional[pd.ExcelFile] = None
+        try:
+            self._excel: Optional[pd.ExcelFile] = pd.ExcelFile(path, engine=self.engine)
+        except Exception as e:
+            if self.engine == FALLBACK_ENGINE or self.engine == "xlrd":
+                raise
+            logger.warning(f"Falha ao abrir {path} com {self.engine} ({e}), usando {FALLBACK_ENGINE}.")
+            self.engine = FALLBACK_ENGINE
+            self._excel = pd.ExcelFile(path, engine=self.engine)
+
+    def __enter__(self) -> "Workbook":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Libera o arquivo. Chamadas repetidas não têm efeito.
+        """
+        for handle in (self._excel, self._fallback):
+            if handle is not None:
+                handle.close()
+        self._excel = None
+        self._fallback = None
+
+    @property
+    def sheet_names(self) -> List[str]:
+        return self._handle().sheet_names
+
+    def _handle(self) -> pd.ExcelFile:
+        if self._excel is None:
+            raise ValueError(f"Planilha {self.path} já foi fechada.")
+        return self._excel
+
+    def read(self, sheet: Union[str, int] = 0, header: Optional[int] = 0) -> pd.DataFrame:
+        """
+        Lê uma sheet do arquivo já aberto, com o formato numérico brasileiro.
+
+        Args:
+            sheet (Union[str, int]): Nome ou posição da sheet. Padrão: a primeira.
+            header (Optional[int]): Linha do cabeçalho, ou None para não usar cabeçalho.
+
+        Returns:
+            pd.DataFrame: Conteúdo da sheet.
+        """
+        handle = self._handle()
+        try:
+            return handle.parse(sheet_name=sheet, header=header, **READ_OPTIONS)
+        except Exception as e:
+            # sheet inexistente não é limitação do engine: o erro sobe direto
+            missing = isinstance(sheet, str) and sheet not in handle.sheet_names
+            if self.engine == FALLBACK_ENGINE or self.engine == "xlrd" or missing:
+                raise
+            logger.warning(f"Falha ao ler a sheet {sheet} de {self.path} com {self.engine} ({e}), "
+                           f"usando {FALLBACK_ENGINE}.")
+            if self._fallback is None:
+                self._fallback = pd.ExcelFile(self.path, engine=FALLBACK_ENGINE)
+            return self._fallback.parse(sheet_name=sheet, header=header, **READ_OPTIONS)
+
+    def read_many(self, sheets: List[Union[str, int]], header: Optional[int] = 0) -> Dict[Union[str, int], pd.DataFrame]:
+        """
+        Lê várias sheets do arquivo já aberto, na ordem pedida.
+
+        Args:
+            sheets (List[Union[str, int]]): Nomes ou posições das sheets.
+            header (Optional[int]): Linha do cabeçalho, ou None para não usar cabeçalho.
+
+        Returns:
+            Dict[Union[str, int], pd.DataFrame]: Conteúdo de cada sheet, indexado como em `sheets`.
+        """
+        return {sheet: self.read(sheet, header=header) for sheet in sheets}
@@ -2,22 +2,42 @@ from v8_utilities.paths import PathV8
 from v8_utilities.sharepoint import SharePoint
 from v8_utilities.anbima_calendar import Calendar
 from v8_fidcs.src.others.logger import LogFIDC
-from typing import List, Optional
+from v8_fidcs.src.others.graph_session import GRAPH_URL, build_session, authorization_headers
+from v8_fidcs.src.others.manifest import RawManifest
+from v8_fidcs.src.others.quickxor import QuickXorHash
+from typing import Any, Callable, Dict, Iterator, List, Optional
+from urllib.parse import quote
+from concurrent.futures import ThreadPoolExecutor
+from email.utils import parsedate_to_datetime
 
 import pandas as pd
 
 import requests
+import urllib3
 import datetime
+import time
 import os
 
+# O SharePoint começa a devolver 429 com mais de ~4 downloads simultâneos por aplicação
+DEFAULT_MAX_WORKERS = 4
+MAX_THROTTLE_RETRIES = 5
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+MAX_RESUME_ATTEMPTS = 3
+MAX_BATCH_SIZE = 20  # limite de sub-requisições por chamada ao $batch do Graph
+ITEM_SELECT = "id,name,eTag,cTag,size,lastModifiedDateTime,parentReference,file,folder,deleted"
+
 logger = LogFIDC()
 
 class Extractor(SharePoint):
-    def __init__(self, path_handle: PathV8, calendar_handle: Calendar, site_name: str, folder_root:str = None) -> None:
+    def __init__(self, path_handle: PathV8, calendar_handle: Calendar, site_name: str, folder_root:str = None,
+                 max_workers: int = DEFAULT_MAX_WORKERS, graph_url: str = GRAPH_URL) -> None:
         #super().__init__(tenant_id, client_id, client_secret, authority_url, site_domain, site_name, site_id)
         super().__init__(site_name)
         self.calendar_handle = calendar_handle
         self.path_handle = path_handle
+        self.max_workers = max(1, max_workers)
+        self.session = build_session(self.max_workers)
+        self.graph_url = graph_url.rstrip("/")
 
         if folder_root is None:
             self.folder_root = self.path_handle.FIDCS_RELATORIOS_GERAIS
@@ -53,31 +73,171 @@ class Extractor(SharePoint):
             logger.error(f"Erro ao construir caminho de download: {e}")
             raise e
 
-    def list_files(self, path_file: str) -> List[str]:
+    def _request(self, method: str, url: str, **kwargs) -> requests.Response:
         """
-        Lista os arquivos e pastas dentro de um caminho específico no SharePoint.
-        Parâmetros:
-            path_file (str): Caminho da pasta onde os arquivos estão localizados, separado por '/'.
-        Retorna:
-            List[str]: Lista de nomes de arquivos e pastas encontrados no caminho especificado.
+        Faz uma requisição ao Graph pela sessão compartilhada, com o token em cache e repetição em caso de 429.
+
+        Args:
+            method (str): Método HTTP.
+            url (str): URL completa da requisição.
+            **kwargs: Argumentos repassados para `requests.Session.request`.
+
+        Returns:
+            requests.Response: Resposta com status de sucesso.
+
+        Raises:
+            requests.exceptions.HTTPError: Se a resposta final não for de sucesso.
+        """
+        kwargs.setdefault("timeout", 15)
+        extra_headers = kwargs.pop("headers", None) or {}
+
+        def send() -> requests.Response:
+            headers = authorization_headers(self, getattr(self, "headers", None))
+            headers.update(extra_headers)
+            response = self.session.request(method, url, headers=headers, **kwargs)
+            try:
+                response.raise_for_status()
+            except requests.exceptions.HTTPError:
+                # com stream=True o corpo não é lido: sem fechar, a conexão não volta ao pool (que bloqueia)
+                response.close()
+                raise
+            return response
+
+        return self._call_with_retry(send)
+
+    def _drive_path_url(self, path_file: str, suffix: str = "") -> str:
+        """
+        Monta a URL do Graph que endereça um item do drive pelo caminho.
+        """
+        path = quote(path_file.strip("/"), safe="/")
+        return f"{self.graph_url}/sites/{self.site_id}/drive/root:/{path}{':' + suffix if suffix else ''}"
+
+    def _get_item_id(self, path_file: str) -> Optional[Dict[str, str]]:
+        """
+        Resolve o id do item do drive correspondente ao caminho informado.
+
+        Args:
+            path_file (str): Caminho do arquivo ou pasta no SharePoint, separado por '/'.
+
+        Returns:
+            Optional[Dict[str, str]]: Dicionário {caminho: id do item}, ou None se o item não existir.
         """
         try:
-            item_id = self._get_item_id(path_file)
-            if item_id is None:
-                logger.error(f"Item ID não encontrado para o caminho '{path_file}'.")
-                raise Exception(f"Item ID não encontrado para o caminho.")
+            response = self._request("GET", self._drive_path_url(path_file), params={"$select": "id"})
+            return {path_file: response.json()["id"]}
+        except requests.exceptions.HTTPError as e:
+            if e.response is not None and e.response.status_code == 404:
+                return None
+            raise
+
+    def download_file(self, file_path: str, file_name: str, path_target: str,
+                      item: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Baixa um arquivo do SharePoint para `path_target` em blocos, com retomada e gravação atômica.
+
+        O conteúdo é gravado em `<path_target>.part`, em blocos de `DOWNLOAD_CHUNK_SIZE`. Se a conexão cair,
+        o download é retomado do ponto em que parou via cabeçalho HTTP `Range` (inclusive em uma execução
+        seguinte, já que o `.part` permanece em disco). Ao final, tamanho e quickXorHash são conferidos
+        com os metadados do Graph e só então o arquivo é renomeado para `path_target`.
 
-            item_id_value = next(iter(item_id.values()))
-            drive_item_url = f"https://graph.microsoft.com/v1.0/sites/{self.site_id}/drive/items/{item_id_value}/children"
+        Args:
+            file_path (str): Caminho do arquivo no SharePoint, separado por '/'.
+            file_name (str): Nome do arquivo, usado nos logs.
+            path_target (str): Caminho local onde o arquivo será salvo.
+            item (Optional[Dict[str, Any]]): Metadados do driveItem (id, size, file), se já conhecidos. Se None,
+                são consultados no Graph.
 
-            response = requests.get(drive_item_url, headers=self.headers, timeout=15)
-            response.raise_for_status()
+        Raises:
+            IOError: Se o arquivo baixado não bater com o tamanho ou hash informados pelo Graph.
+            requests.exceptions.RequestException: Se o download falhar após `MAX_RESUME_ATTEMPTS` retomadas.
+        """
+        if item is None:
+            item = self._request("GET", self._drive_path_url(file_path),
+                                 params={"$select": "id,size,file"}).json()
+        expected_size = item.get("size")
+        expected_hash = ((item.get("file") or {}).get("hashes") or {}).get("quickXorHash")
+        content_url = f"{self.graph_url}/sites/{self.site_id}/drive/items/{item['id']}/content"
+        path_part = path_target + ".part"
+
+        if os.path.exists(path_part) and expected_size is not None and os.path.getsize(path_part) > expected_size:
+            os.remove(path_part)
+
+        for attempt in range(MAX_RESUME_ATTEMPTS + 1):
+            offset = os.path.getsize(path_part) if os.path.exists(path_part) else 0
+            if expected_size is not None and 0 < offset == expected_size:
+                break
+            # sem compressão de transporte, para que os offsets do Range sejam bytes do arquivo
+            headers = {"Accept-Encoding": "identity"}
+            if offset:
+                headers["Range"] = f"bytes={offset}-"
+            try:
+                response = self._request("GET", content_url, headers=headers, stream=True, timeout=60)
+                with response:
+                    mode = "ab" if offset and response.status_code == 206 else "wb"
+                    with open(path_part, mode) as f:
+                        for chunk in self._iter_body(response):
+                            f.write(chunk)
+                break
+            except (requests.exceptions.ConnectionError, requests.exceptions.ChunkedEncodingError,
+                    requests.exceptions.Timeout, urllib3.exceptions.HTTPError) as e:
+                if attempt == MAX_RESUME_ATTEMPTS:
+                    raise
+                logger.warning(f"Download de {file_name} interrompido ({e}). Retomando do byte "
+                               f"{os.path.getsize(path_part) if os.path.exists(path_part) else 0}.")
+
+        self._verify_download(path_part, file_name, expected_size, expected_hash)
+        os.replace(path_part, path_target)
+        logger.info(f"Arquivo {file_name} baixado em {path_target}.")
+
+    @staticmethod
+    def _iter_body(response: requests.Response) -> Iterator[bytes]:
+        """
+        Percorre o corpo de uma resposta em stream em blocos de até `DOWNLOAD_CHUNK_SIZE`.
 
-            folder_names = [item["name"] for item in response.json().get('value', [])]
+        Usa `read1`, que devolve os bytes já recebidos sem esperar o bloco inteiro: se a conexão cair no meio
+        de um bloco, o que chegou até ali já foi gravado no `.part` e a retomada parte desse ponto.
+        """
+        read1 = getattr(response.raw, "read1", None)
+        if read1 is None:  # urllib3 < 2
+            yield from response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE)
+            return
+        while chunk := read1(DOWNLOAD_CHUNK_SIZE):
+            yield chunk
+
+    @staticmethod
+    def _verify_download(path_part: str, file_name: str, expected_size: Optional[int],
+                         expected_hash: Optional[str]) -> None:
+        """
+        Confere tamanho e quickXorHash do arquivo baixado. Em caso de divergência o `.part` é apagado,
+        para que a próxima tentativa recomece do zero.
 
-            # folder_names = [item['name'] for item in items]
+        Raises:
+            IOError: Se tamanho ou hash não conferirem.
+        """
+        size = os.path.getsize(path_part)
+        if expected_size is not None and size != expected_size:
+            os.remove(path_part)
+            raise IOError(f"Tamanho do arquivo {file_name} diverge do SharePoint ({size} != {expected_size}).")
+
+        if expected_hash:
+            hasher = QuickXorHash()
+            with open(path_part, "rb") as f:
+                for chunk in iter(lambda: f.read(DOWNLOAD_CHUNK_SIZE), b""):
+                    hasher.update(chunk)
+            if hasher.base64digest() != expected_hash:
+                os.remove(path_part)
+                raise IOError(f"Hash do arquivo {file_name} diverge do SharePoint.")
 
-            return folder_names
+    def list_files(self, path_file: str) -> List[str]:
+        """
+        Lista os arquivos e pastas dentro de um caminho específico no SharePoint.
+        Parâmetros:
+            path_file (str): Caminho da pasta onde os arquivos estão localizados, separado por '/'.
+        Retorna:
+            List[str]: Lista de nomes de arquivos e pastas encontrados no caminho especificado, de todas as páginas.
+        """
+        try:
+            return [item["name"] for item in self.list_items(path_file)]
         # caso ocorra erro, aqui tem que acabar, pq é a base de tudo
         except requests.exceptions.Timeout:
             logger.error(f"Timeout ao listar arquivos na pasta '{path_file}'.")
@@ -111,49 +271,364 @@ class Extractor(SharePoint):
             logger.error(f"Erro ao listar os FIDCs.")
             return None
 
-    def download_fidcs(self, date: datetime.date, fidc_list: List[str]) -> List[str]:
+    def _iter_pages(self, url: str, params: Optional[Dict[str, str]] = None) -> Iterator[Dict[str, Any]]:
         """
-        Realiza o download dos arquivos .xlsx correspondentes à lista de FIDCs para a data especificada,
-        salvando-os na pasta "00_RAW" dentro do diretório raiz configurado.
+        Percorre as páginas de uma coleção do Graph seguindo `@odata.nextLink`.
 
         Args:
-            fidc_list (List[str]): Lista com os nomes das pastas/arquivos FIDC a serem baixados.
-            date (datetime.date): Data usada para construir o caminho de origem e nomear os arquivos baixados.
+            url (str): URL da primeira página.
+            params (Optional[Dict[str, str]]): Parâmetros da primeira requisição; as seguintes já vêm no nextLink.
+
+        Yields:
+            Dict[str, Any]: JSON de cada página.
+        """
+        while url:
+            page = self._request("GET", url, params=params).json()
+            yield page
+            url, params = page.get("@odata.nextLink"), None
+
+    def list_items(self, path_file: str) -> List[Dict[str, Any]]:
+        """
+        Lista os driveItems (com id, eTag, cTag, tamanho e data de modificação) de uma pasta do SharePoint.
+
+        Args:
+            path_file (str): Caminho da pasta, separado por '/'.
+
+        Returns:
+            List[Dict[str, Any]]: driveItems filhos da pasta, de todas as páginas.
+        """
+        url = self._drive_path_url(path_file, "/children")
+        items = []
+        for page in self._iter_pages(url, params={"$select": ITEM_SELECT}):
+            items.extend(page.get("value", []))
+        return items
+
+    def _relative_url(self, url: str) -> str:
+        """
+        Converte uma URL absoluta do Graph (ex: `@odata.nextLink`) no formato relativo exigido pelo `$batch`.
+        """
+        return url[len(self.graph_url):] if url.startswith(self.graph_url) else url
+
+    def _batch(self, sub_requests: Dict[str, str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Executa várias requisições GET ao Graph via `$batch`, em lotes de até `MAX_BATCH_SIZE`.
+
+        Sub-requisições respondidas com 429 são reenviadas em um novo lote após o maior `Retry-After` do lote.
+
+        Args:
+            sub_requests (Dict[str, str]): Mapa {id da sub-requisição: URL relativa ao endpoint do Graph}.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Mapa {id: sub-resposta}, com as chaves "status", "headers" e "body".
+        """
+        pending = list(sub_requests.items())
+        results: Dict[str, Dict[str, Any]] = {}
+        attempt = 0
+        while pending:
+            throttled, wait = [], 0.0
+            for start in range(0, len(pending), MAX_BATCH_SIZE):
+                chunk = pending[start:start + MAX_BATCH_SIZE]
+                payload = {"requests": [{"id": key, "method": "GET", "url": url} for key, url in chunk]}
+                response = self._request("POST", f"{self.graph_url}/$batch", json=payload, timeout=30)
+                urls = dict(chunk)
+                for sub in response.json().get("responses", []):
+                    if sub.get("status") == 429 and attempt < MAX_THROTTLE_RETRIES:
+                        throttled.append((sub["id"], urls[sub["id"]]))
+                        retry_after = (sub.get("headers") or {}).get("Retry-After")
+                        wait = max(wait, float(retry_after) if retry_after else float(2 ** attempt))
+                    else:
+                        results[sub["id"]] = sub
+            if throttled:
+                logger.warning(f"{len(throttled)} sub-requisições do $batch limitadas (429). Nova tentativa em {wait:.1f}s.")
+                time.sleep(wait)
+            pending, attempt = throttled, attempt + 1
+        return results
+
+    def get_items(self, paths: List[str]) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        Resolve em lote, via `$batch`, os metadados (id, eTag, cTag, tamanho, hashes, ...) de vários driveItems.
+
+        Args:
+            paths (List[str]): Caminhos separados por '/'.
+
+        Returns:
+            Dict[str, Optional[Dict[str, Any]]]: Mapa {caminho: driveItem}, com None para caminhos inexistentes.
+        """
+        sub_requests = {str(i): self._relative_url(self._drive_path_url(path)) + f"?$select={ITEM_SELECT}"
+                        for i, path in enumerate(paths)}
+        responses = self._batch(sub_requests) if sub_requests else {}
+        items = {}
+        for i, path in enumerate(paths):
+            sub = responses.get(str(i), {})
+            items[path] = sub.get("body") if sub.get("status") == 200 else None
+        return items
+
+    def _folder_delta(self, folder_id: str, delta_link: Optional[str],
+                      known_ids: Optional[set] = None) -> Optional[tuple]:
+        """
+        Consulta o endpoint `/delta` do drive a partir do cursor salvo e filtra as mudanças da pasta.
+
+        O SharePoint só oferece delta na raiz do drive, então cada pasta guarda o próprio cursor
+        e as mudanças são filtradas por `parentReference.id`. Itens apagados podem vir sem `parentReference`
+        (e sem `name`), por isso também são mantidos os apagados cujo id está em `known_ids`.
+
+        Args:
+            folder_id (str): Id do driveItem da pasta do mês.
+            delta_link (Optional[str]): Cursor salvo no manifesto. Se None, apenas gera um cursor novo.
+            known_ids (Optional[set]): Ids dos itens da pasta já registrados no manifesto.
+
+        Returns:
+            Optional[tuple]: (driveItems alterados na pasta, novo deltaLink). Retorna None se o cursor expirou (HTTP 410).
+        """
+        if delta_link is None:
+            url = f"{self.graph_url}/sites/{self.site_id}/drive/root/delta"
+            params = {"token": "latest"}
+        else:
+            url, params = delta_link, None
+
+        known_ids = known_ids or set()
+        changed: Dict[str, Dict[str, Any]] = {}
+        new_link = None
+        try:
+            for page in self._iter_pages(url, params=params):
+                for item in page.get("value", []):
+                    in_folder = (item.get("parentReference") or {}).get("id") == folder_id
+                    if in_folder or ("deleted" in item and item.get("id") in known_ids):
+                        changed[item["id"]] = item  # a última versão de um item prevalece
+                new_link = page.get("@odata.deltaLink", new_link)
+        except requests.exceptions.HTTPError as e:
+            if e.response is not None and e.response.status_code == 410:
+                logger.warning(f"Cursor de delta expirado para a pasta {folder_id}; será feita listagem completa.")
+                return None
+            raise
+        return list(changed.values()), new_link
+
+    def sync_fidcs(self, date: datetime.date, fidc_list: Optional[List[str]] = None,
+                   max_workers: Optional[int] = None) -> List[str]:
+        """
+        Sincroniza incrementalmente a pasta "00_RAW" com a pasta do mês no SharePoint.
+
+        Usa o manifesto `00_RAW_manifest.json` (id, eTag/cTag, tamanho e data de modificação de cada arquivo)
+        e o endpoint `/delta` do Graph para baixar somente os arquivos novos ou alterados, inclusive os que
+        já existem localmente mas foram reenviados pela gestora.
+
+        Na primeira sincronização de uma pasta (ou se o cursor de delta expirar), a pasta é listada por completo
+        e comparada com o manifesto. O cursor só avança se todos os downloads deram certo e nenhum item foi
+        deixado de fora por `fidc_list`; os arquivos com falha ficam pendentes no manifesto e são baixados
+        de novo na próxima sincronização.
+
+        Args:
+            date (datetime.date): Data usada para determinar a pasta do mês.
+            fidc_list (Optional[List[str]]): Restringe a sincronização a esses FIDCs. Se None, considera todos.
+            max_workers (Optional[int]): Quantidade de downloads simultâneos.
 
         Returns:
-            List[str]: Lista atualizada dos FIDCs que foram baixados com sucesso. FIDCs com falha no download são removidos da lista.
+            List[str]: FIDCs baixados nesta execução (novos ou alterados), na ordem da pasta.
 
         Raises:
-            Exception: Relança qualquer exceção inesperada ocorrida durante o processo de download geral após registrar o erro.
+            Exception: Relança qualquer exceção ocorrida na sincronização após registrar o erro.
         """
         try:
             raw_path = os.path.join(self.folder_root, "00_RAW")
             date_str = date.strftime("%Y_%m_%d")
+            path_folder = self._build_path(date)
+            manifest = RawManifest(self.folder_root)
 
-            path_to_download = self._build_path(date)
-            for fidc_name in fidc_list[:]:
+            item_id = self._get_item_id(path_folder)
+            if item_id is None:
+                raise Exception(f"Item ID não encontrado para o caminho '{path_folder}'.")
+            folder_id = next(iter(item_id.values()))
+
+            pending = dict(manifest.pending.get(folder_id, {}))
+            known_ids = {entry.get("id") for entry in manifest.files.values() if entry.get("folder_id") == folder_id}
+            known_ids.update(pending.values())
+
+            delta_link = manifest.delta_links.get(folder_id)
+            delta = self._folder_delta(folder_id, delta_link, known_ids) if known_ids and delta_link else None
+
+            if delta is None:
+                _, delta_link = self._folder_delta(folder_id, None)
+                items = self.list_items(path_folder)
+            else:
+                items, delta_link = delta
+                # pendências de execuções anteriores que não mudaram desde então não voltam no delta
+                listed = {item.get("name") for item in items}
+                missing = [f"{path_folder}/{name}" for name in pending
+                           if name not in listed and (fidc_list is None or name in fidc_list)]
+                items.extend(item for item in self.get_items(missing).values() if item is not None)
+
+            candidates, skipped = {}, []
+            for item in items:
+                if "deleted" in item:
+                    manifest.remove_item(item["id"])
+                    continue
+                name = item.get("name")
+                if "folder" in item:
+                    continue
+                if fidc_list is not None and name not in fidc_list:
+                    skipped.append(name)
+                    continue
+                file_name = f"FIDC_{name}_{date_str}.xlsx"
+                if manifest.is_current(file_name, item, os.path.join(raw_path, file_name)):
+                    continue
+                candidates[name] = item
+
+            logger.info(f"FIDCs novos ou alterados no SharePoint: {list(candidates)}")
+            downloaded = self.download_fidcs(date, list(candidates), max_workers=max_workers, overwrite=True,
+                                             items=candidates)
+
+            for name in downloaded:
+                manifest.update(f"FIDC_{name}_{date_str}.xlsx", candidates[name], folder_id)
+
+            failed = {name: item["id"] for name, item in candidates.items() if name not in downloaded}
+            # pendências fora do filtro desta execução continuam pendentes
+            still_pending = {name: pending_id for name, pending_id in manifest.pending.get(folder_id, {}).items()
+                             if fidc_list is not None and name not in fidc_list}
+            still_pending.update(failed)
+            if still_pending:
+                manifest.pending[folder_id] = still_pending
+            else:
+                manifest.pending.pop(folder_id, None)
+
+            if delta_link and not failed and not skipped:
+                manifest.delta_links[folder_id] = delta_link
+            elif failed or skipped:
+                logger.warning(f"Cursor de delta da pasta mantido: {len(failed)} downloads com falha e "
+                               f"{len(skipped)} itens fora de `fidc_list`.")
+            manifest.save()
+
+            return downloaded
+        except Exception as e:
+            logger.error(f"Erro na sincronização incremental dos FIDCs: {e}")
+            raise e
+
+    @staticmethod
+    def _retry_after(response: requests.Response, attempt: int) -> float:
+        """
+        Calcula quantos segundos aguardar antes de repetir uma requisição limitada (HTTP 429).
+
+        Usa o cabeçalho `Retry-After` enviado pelo Graph (em segundos ou como data HTTP) e,
+        na ausência dele, aplica um backoff exponencial.
+
+        Args:
+            response (requests.Response): Resposta com status 429.
+            attempt (int): Número da tentativa atual, começando em 0.
+
+        Returns:
+            float: Tempo de espera em segundos.
+        """
+        header = response.headers.get("Retry-After") if response is not None else None
+        if header:
+            try:
+                return max(0.0, float(header))
+            except ValueError:
                 try:
-                    file_name = f"FIDC_{fidc_name}_{date_str}.xlsx"
-                    path_target = os.path.join(raw_path, file_name)
+                    retry_at = parsedate_to_datetime(header)
+                    return max(0.0, (retry_at - datetime.datetime.now(retry_at.tzinfo)).total_seconds())
+                except (TypeError, ValueError):
+                    pass
+        return float(2 ** attempt)
+
+    def _call_with_retry(self, func: Callable, *args, **kwargs):
+        """
+        Executa `func` repetindo a chamada enquanto o SharePoint responder HTTP 429 (throttling),
+        respeitando o `Retry-After`, até `MAX_THROTTLE_RETRIES` tentativas.
 
-                    if os.path.exists(path_target):
-                        logger.info(f"Arquivo {file_name} já foi baixado. Pulando download.")
-                        continue  # pula para o próximo fidc_name
+        Raises:
+            requests.exceptions.HTTPError: Se o erro não for 429 ou as tentativas se esgotarem.
+        """
+        for attempt in range(MAX_THROTTLE_RETRIES + 1):
+            try:
+                return func(*args, **kwargs)
+            except requests.exceptions.HTTPError as e:
+                response = e.response
+                if response is None or response.status_code != 429 or attempt == MAX_THROTTLE_RETRIES:
+                    raise
+                wait = self._retry_after(response, attempt)
+                logger.warning(f"SharePoint limitou as requisições (429). Nova tentativa em {wait:.1f}s.")
+                time.sleep(wait)
+
+    def _download_fidc(self, fidc_name: str, path_to_download: str, raw_path: str, date_str: str,
+                       overwrite: bool = False, item: Optional[Dict[str, Any]] = None) -> bool:
+        """
+        Baixa o arquivo de um único FIDC para a pasta "00_RAW".
 
-                    file_path = f"{path_to_download}/{fidc_name}"
+        Args:
+            fidc_name (str): Nome do arquivo do FIDC no SharePoint.
+            path_to_download (str): Pasta do mês no SharePoint.
+            raw_path (str): Pasta local "00_RAW".
+            date_str (str): Data no formato YYYY_MM_DD usada no nome do arquivo.
+            overwrite (bool): Se True, baixa o arquivo mesmo que ele já exista em "00_RAW".
+            item (Optional[Dict[str, Any]]): Metadados do driveItem, se já conhecidos.
 
-                    os.makedirs(os.path.dirname(path_target), exist_ok=True)
+        Returns:
+            bool: True se o arquivo estiver disponível em "00_RAW" ao final, False caso contrário.
+        """
+        file_name = f"FIDC_{fidc_name}_{date_str}.xlsx"
+        path_target = os.path.join(raw_path, file_name)
 
-                    self.download_file(file_path, file_name, path_target)
+        if os.path.exists(path_target) and not overwrite:
+            logger.info(f"Arquivo {file_name} já foi baixado. Pulando download.")
+            return True
 
-                    if not os.path.exists(path_target):
-                        fidc_list.remove(fidc_name)
-                        logger.error(f"O Arquivo {fidc_name} não será baixado.")
+        try:
+            file_path = f"{path_to_download}/{fidc_name}"
+            self.download_file(file_path, file_name, path_target, item)
+        except Exception as error:
+            logger.error(f"Erro Inesperado para o FIDC {fidc_name}: {error}")
+            return False
+
+        if not os.path.exists(path_target):
+            logger.error(f"O Arquivo {fidc_name} não será baixado.")
+            return False
+        return True
+
+    def download_fidcs(self, date: datetime.date, fidc_list: List[str], max_workers: Optional[int] = None,
+                       overwrite: bool = False, items: Optional[Dict[str, Dict[str, Any]]] = None) -> List[str]:
+        """
+        Realiza o download dos arquivos .xlsx correspondentes à lista de FIDCs para a data especificada,
+        salvando-os na pasta "00_RAW" dentro do diretório raiz configurado.
 
-                except Exception as error:
-                    logger.error(f"Erro Inesperado para o FIDC {fidc_name}: {error}")
+        Os downloads são feitos em paralelo por um pool de `max_workers` threads. Arquivos já presentes
+        em "00_RAW" são pulados e respostas HTTP 429 são repetidas respeitando o `Retry-After`. Os metadados
+        (id, tamanho e hash) dos arquivos a baixar são resolvidos antes, em lote, por `get_items`.
 
-            return fidc_list
+        Args:
+            fidc_list (List[str]): Lista com os nomes das pastas/arquivos FIDC a serem baixados.
+            date (datetime.date): Data usada para construir o caminho de origem e nomear os arquivos baixados.
+            max_workers (Optional[int]): Quantidade de downloads simultâneos. Default é `self.max_workers`.
+            overwrite (bool): Se True, baixa novamente arquivos já existentes em "00_RAW". Default é False.
+            items (Optional[Dict[str, Dict[str, Any]]]): Metadados já conhecidos, por FIDC (ex: da listagem ou
+                do delta). Se None, são resolvidos por `get_items`.
+
+        Returns:
+            List[str]: Lista dos FIDCs baixados com sucesso, na mesma ordem de `fidc_list`. FIDCs com falha no download são removidos da lista.
+
+        Raises:
+            Exception: Relança qualquer exceção inesperada ocorrida durante o processo de download geral após registrar o erro.
+        """
+        try:
+            raw_path = os.path.join(self.folder_root, "00_RAW")
+            date_str = date.strftime("%Y_%m_%d")
+
+            path_to_download = self._build_path(date)
+            os.makedirs(raw_path, exist_ok=True)
+
+            if items is None:
+                to_fetch = [name for name in fidc_list
+                            if overwrite or not os.path.exists(os.path.join(raw_path, f"FIDC_{name}_{date_str}.xlsx"))]
+                found = self.get_items([f"{path_to_download}/{name}" for name in to_fetch])
+                items = {name: found[f"{path_to_download}/{name}"] for name in to_fetch}
+
+            workers = max(1, min(max_workers or self.max_workers, len(fidc_list) or 1))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                downloaded = list(executor.map(
+                    lambda fidc_name: self._download_fidc(fidc_name, path_to_download, raw_path, date_str, overwrite,
+                                                          items.get(fidc_name)),
+                    fidc_list
+                ))
+
+            return [fidc_name for fidc_name, ok in zip(fidc_list, downloaded) if ok]
         except Exception as e:
             logger.error(f"Erro em baixar os FIDCs.")
-            raise e
\ No newline at end of file
+            raise e
@@ -1,13 +1,18 @@
 import pandas as pd
-import numpy as np
 
 from typing import Dict, List, Optional, Tuple
 from itertools import chain
+from concurrent.futures import ThreadPoolExecutor
 from v8_fidcs.src.others.logger import LogFIDC
+from v8_fidcs.src.others.report_store import ReportStore
 from v8_utilities.paths import PathV8
 from v8_utilities.anbima_calendar import Calendar
-from v8_utilities.yaml_functions import load_yaml
+from v8_fidcs.src.parser.patterns import PATTERNS
+from v8_fidcs.src.parser.parsed import EXTENSIONS, read_parsed
+from v8_fidcs.src.parser.metrics import apply_metrics, metric_coverage
+from v8_fidcs.src.parser.columns import ColumnNormalizer
 
+import time
 import re
 import os
 import datetime
@@ -17,203 +22,39 @@ script_dir = os.path.dirname(script_path)
 
 PATH = os.path.join(script_dir, "..","..", "..", 'yamls')
 
+# leituras simultâneas dos arquivos de 01_PARSED
+DEFAULT_MAX_WORKERS = 8
+
 logger = LogFIDC()
 
 #ajeitar tudo aqui
 
 class Grouper(object):
-    def __init__(self, path_handle: PathV8, calendar_handle: Calendar, folder_root: str = None):
+    def __init__(self, path_handle: PathV8, calendar_handle: Calendar, folder_root: str = None,
+                 max_workers: int = DEFAULT_MAX_WORKERS, export_csv: bool = False):
         try:
             self.path_handle = path_handle
             self.calendar_handle = calendar_handle
+            self.max_workers = max(1, max_workers)
 
             if folder_root is None:
                 self.folder_root = self.path_handle.FIDCS_RELATORIOS_GERAIS
             else:
                 self.folder_root = folder_root
 
-            self.equiv_columns =  load_yaml(os.path.join(PATH, "colunas.yaml"))
-            self.regex_patterns = load_yaml(os.path.join(PATH, "regex.yaml"))
+            self.equiv_columns = PATTERNS.load(os.path.join(PATH, "colunas.yaml"))
+            self.regex_patterns = PATTERNS.load(os.path.join(PATH, "regex.yaml"))
+            # cabeçalho -> nomes canônicos, memorizado e reaproveitado entre execuções
+            self.normalizer = ColumnNormalizer(self.equiv_columns, self.folder_root)
+            # relatórios por (mês, FIDC); o CSV de 02_REPORT é só uma exportação da base
+            self.store = ReportStore(self.folder_root)
+            self.export_csv = export_csv
             self.csv_dict: Dict[str, pd.DataFrame] = {}
+            self.metric_coverage: Optional[pd.DataFrame] = None
         except:
             logger.error(f"Erro na criação do grouper, arquivos YAML não encontrados.")
             raise (f"Erro na criação do grouper, arquivos YAML não encontrados.")
 
-    # ------------------------  PROCESSAMENTO DE STRINGS  ------------------------ #
-    @staticmethod
-    def _verify_pattern(entry: str, patterns: List[str]) -> bool:
-        """
-        Verifica se a string de entrada corresponde a algum dos padrões fornecidos.
-
-        Args:
-            entry (str): Texto que será verificado.
-            patterns (List[str]): Lista de padrões regex para comparar com o texto.
-
-        Returns:
-            bool: True se algum padrão for encontrado no texto, False caso contrário.
-        """
-        text = str(entry).lower().strip()
-        return any(re.search(p, text) for p in patterns)
-
-    def _days_string_processing(self, entry: Optional[str]) -> Optional[str]:
-        """
-        Padroniza strings que representam intervalos de dias, ajustando formatações variadas para um formato uniforme.
-
-        Exemplos tratados:
-            - "1-30" → "0-30 dias"
-            - "de 2 a 30 dias" → "1-30 dias"
-            - "até 60 dias" → "<= 60 dias"
-            - "> 121" → "> 120 dias"
-
-        Args:
-            entry (Optional[str]): Texto original representando um intervalo de dias.
-
-        Returns:
-            Optional[str]: Texto padronizado ou None se a entrada for inválida ou não casar com nenhum padrão.
-        """
-        if not entry or not isinstance(entry, str):
-            return None
-
-        entry = entry.lower().strip()
-        unwanted_numbers = {6, 16, 31, 61, 91, 121, 151, 181, 366, 721}
-
-        change_pattern = [
-            (r"^1-(\d+)", lambda m: f"0-{m.group(1)} dias"),
-            (r"^de\s*(\d+)\s*a\s*(\d+)\s*dias?$", lambda m:
-             f"{int(m.group(1)) - 1 if int(m.group(1)) in unwanted_numbers else m.group(1)}-{m.group(2)} dias"),
-            (r"^(\d+)\s*(?:a|e|-)\s*(\d+)\s*dias?$", lambda m:
-             f"{int(m.group(1)) - 1 if int(m.group(1)) in unwanted_numbers else m.group(1)}-{m.group(2)} dias"),
-            (r"^(\d+)\s*(?:a|e|-)\s*(\d+)$", lambda m:
-             f"{int(m.group(1)) - 1 if int(m.group(1)) in unwanted_numbers else m.group(1)}-{m.group(2)} dias"),
-            (r"^até\s*(\d+)(?:\s*dias?)?$", lambda m: f"<= {m.group(1)} dias"),
-            (r"^>\s*(\d+)$", lambda m: f"> {int(m.group(1)) - 1 if int(m.group(1)) == 121 else m.group(1)} dias"),
-            (r"^(?:acima\s*de|superior(?:\s*a)?)\s*(\d+)(?:\s*dias?)?$",
-             lambda m: f"> {int(m.group(1)) - 1 if int(m.group(1)) == 121 else m.group(1)} dias"),
-        ]
-
-        for pattern, format in change_pattern:
-            if match := re.fullmatch(pattern, entry):
-                return format(match)
-        return None
-
-    # ------------------------  DATAFRAME MANIPULAÇÃO  ------------------------ #
-    def _days_column_processing(self, df: pd.DataFrame) -> pd.DataFrame:
-        """
-        Padroniza os nomes das colunas de um DataFrame que representam intervalos de dias.
-
-        Detecta colunas com padrões como "1 a 30", "de 2 a 60 dias", "acima de 121 dias", etc.,
-        e aplica a transformação usando `_days_string_processing`, renomeando essas colunas.
-
-        Args:
-            df (pd.DataFrame): DataFrame com colunas a serem verificadas e possivelmente renomeadas.
-
-        Returns:
-            pd.DataFrame: DataFrame com os nomes das colunas de dias padronizados.
-        """
-        columns = pd.Series(df.columns)
-
-        pattern = [
-            r"(?i)^\d+\s*a\s*\d+$",
-            r"(?i)^\d+\s*-\s*\d+$",
-            r"(?i)^\d+\s*-\s*\d+\s*dias$",
-            r"(?i)^de\s+\d+\s*a\s+\d+\s*dias$",
-            r"(?i)^\d+\s*e\s*\d+\s*dias$",
-            r"(?i)^acima\s+de\s+\d+\s*dias$",
-            r"(?i)^superior\s+a\s+\d+$",
-            r"(?i)^superior\s+\d+$",
-            r"(?i)^>\s*\d+$",
-            r"(?i)^até\s+\d+$",
-            r"(?i)^até\s+\d+\s*dias$"
-        ]
-
-        mask = columns.apply(lambda entry: self._verify_pattern(entry, pattern))
-        columns_processed = columns[mask]
-
-        columns[mask] = columns_processed.apply(self._days_string_processing)
-        df.columns = columns
-        return df
-
-    def _rename_equiv_columns(self, df: pd.DataFrame) -> pd.DataFrame:
-        """
-        Renomeia colunas do DataFrame com base em equivalências definidas em `self.equiv_columns`.
-
-        Percorre o dicionário `self.equiv_columns`, onde cada chave é o nome desejado e
-        o valor é uma lista de possíveis nomes alternativos que podem estar presentes
-        no DataFrame. Se alguma dessas alternativas estiver nas colunas do DataFrame, ela é renomeada.
-
-        Exemplo de `self.equiv_columns`:
-            {
-                "prazo": ["prazo_medio", "prazos", "prazo médio"],
-                "retorno": ["ret", "yield"]
-            }
-
-        Args:
-            df (pd.DataFrame): DataFrame com colunas a serem renomeadas.
-
-        Returns:
-            pd.DataFrame: DataFrame com colunas renomeadas conforme o dicionário de equivalência.
-        """
-        rename_dict = {}
-        for wanted_name, possibilities in self.equiv_columns.items():
-            if possibilities is None:
-                continue
-
-            for possibility in possibilities:
-                if possibility in df.columns:
-                    rename_dict[possibility] = wanted_name
-
-        return df.rename(columns=rename_dict)
-
-    def _grouping_days_column(self, df: pd.DataFrame) -> pd.DataFrame:
-        """
-        Agrupa colunas relacionadas a intervalos de dias com base em colunas anteriores
-        que servem como indicador do tipo de métrica associada.
-
-        Identifica colunas com nomes que representam intervalos de dias (ex: "0-30 dias", "> 90 dias")
-        e as renomeia incluindo o contexto da última coluna que não representa intervalo —
-        ou seja, se a coluna anterior for "prazo médio", a nova coluna se torna "(prazo médio)0-30 dias".
-
-        Padrões considerados:
-            - Intervalo: "10 - 20 dias"
-            - Superior: "> 120 dias"
-            - Inferior: "<= 10 dias"
-
-        Args:
-            df (pd.DataFrame): DataFrame com colunas a serem agrupadas.
-
-        Returns:
-            pd.DataFrame: DataFrame com colunas renomeadas para refletir agrupamento contextual.
-        """
-        pattern = [
-            r'(\d+)\s*-\s*(\d+)\s*dias?',  # intervalo: 10 - 20 dias
-            r'>\s*(\d+)\s*dias?',  # > 120 dias
-            r'<=\s*(\d+)\s*dias?'  # <= 10 dias
-        ]
-
-        columns = pd.Series(df.columns)
-        indicator = columns.apply(lambda entry: self._verify_pattern(entry, pattern))
-        # vetor booleano indicando se a coluna representa um intervalo de dias
-
-        last_true_idx = None
-        new_columns = []
-
-        for idx, col_name in enumerate(columns):
-            if not indicator.iloc[idx]:
-                # coluna normal, usada como "prefixo" para futuras colunas de intervalo
-                new_columns.append(col_name)
-                last_true_idx = idx
-            else:
-                # coluna de intervalo, renomeia com base na última coluna não-intervalo
-                if last_true_idx is not None:
-                    new_name = f"({columns.iloc[last_true_idx]}){col_name}"
-                    new_columns.append(new_name)
-                else:
-                    # caso não haja referência anterior, mantém o nome original
-                    new_columns.append(col_name)
-
-        df.columns = new_columns
-        return df
-
     # ------------------------  SELEÇÃO DE COLUNAS  ------------------------ #
     def _selecting_columns_by_name(self) -> Dict[str, List[str]]:
         """
@@ -279,12 +120,12 @@ class Grouper(object):
                Exception: Se ocorrer algum erro durante o agrupamento.
            """
         try:
-            date_str = date.strftime("%Y-%m-%d")
+            date_key = pd.Timestamp(date.strftime("%Y-%m-%d"))
             list_dates = []
 
             for key, df in self.csv_dict.items():
-                if date_str in df.index:
-                    row = df.loc[date_str]
+                if date_key in df.index:
+                    row = df.loc[date_key]
                     row_df = pd.DataFrame([row], index=[key])
                 else:
                     row_df = pd.DataFrame([{col: pd.NA for col in df.columns}], index=[key])
@@ -404,7 +245,9 @@ class Grouper(object):
         indicadores financeiros baseados no PL Total e outros valores específicos.
 
         As colunas calculadas incluem percentuais de subordinação, PDD, concentração de cedentes e sacados,
-        recompra, valores liquidados e taxas.
+        recompra, valores liquidados e taxas. As definições ficam no catálogo `METRICS` (dependências, fórmula
+        vetorizada e regras de fallback) e valem para uma tabela de um mês ou para um painel de vários meses.
+        Quais métricas puderam ser calculadas para cada FIDC fica em `self.metric_coverage`.
 
         Args:
             data (pd.DataFrame): DataFrame contendo as colunas originais para cálculo.
@@ -412,121 +255,40 @@ class Grouper(object):
         Returns:
             pd.DataFrame: DataFrame com as colunas adicionais criadas ou atualizadas.
         """
-        # Função auxiliar para checar existência da coluna
-        def has_col(col):
-            return col in data.columns
-
-        if has_col("PL Mezanino") and has_col("PL Subordinada Jr") and has_col("PL Total"):
-            data["Subordinação (%)"] = (data["PL Mezanino"] + data["PL Subordinada Jr"]) / data["PL Total"]
-        if has_col("PL Subordinada Jr") and has_col("PL Total"):
-            data["Subordinação Jr (%)"] = data["PL Subordinada Jr"] / data["PL Total"]
-        if has_col("PDD Total") and has_col("PL Total"):
-            data["PDD Total (PL%)"] = data["PDD Total"] / data["PL Total"]
-
-        if has_col("Vencidos Total") and has_col("PL Total"):
-            data["CVNP (PL%)"] = data["Vencidos Total"] / data["PL Total"]
-        if "CVNP (PL%)" in data.columns and "PDD Total (PL%)" in data.columns:
-            data["CVNP - PDD (PL%)"] = data["CVNP (PL%)"] - data["PDD Total (PL%)"]
-
-        if "Vencidos Total - PDD" in data.columns and has_col("PL Total"):
-            if not has_col("CVNP - PDD (PL%)"):
-                data["CVNP - PDD (PL%)"] = np.nan
-            col = data["Vencidos Total - PDD"] / data["PL Total"]
-            data["CVNP - PDD (PL%)"] = data["CVNP - PDD (PL%)"].fillna(col)
-
-        if has_col("Cedente 1") and has_col("PL Total"):
-            data["Concentração Maior Cedente (PL%)"] = data["Cedente 1"] / data["PL Total"]
-        if has_col("Sacado 1") and has_col("PL Total"):
-            data["Concentração Maior Sacado (PL%)"] = data["Sacado 1"] / data["PL Total"]
-        if has_col("Concentração Top 10 Cedentes (R$)") and has_col("PL Total"):
-            data["Concentração 10 Maiores Cedentes (PL%)"] = data["Concentração Top 10 Cedentes (R$)"] / data[
-                "PL Total"]
-        if has_col("Concentração Top 10 Sacados (R$)") and has_col("PL Total"):
-            data["Concentração 10 Maiores Sacados (PL%)"] = data["Concentração Top 10 Sacados (R$)"] / data[
-                "PL Total"]
-        if has_col("Recompra (R$)") and has_col("PL Total"):
-            data["Recompra (PL%)"] = data["Recompra (R$)"] / data["PL Total"]
-        if has_col("Liquidado Total (R$)") and has_col("PL Total"):
-            data["Liquidados Total (PL%)"] = data["Liquidado Total (R$)"] / data["PL Total"]
-
-        if has_col("Duplicata (%)"):
-            data["Duplicata (PL%)"] = data["Duplicata (%)"]
-        elif has_col("Duplicata") and has_col("PL Total"):
-            data["Duplicata (PL%)"] = data["Duplicata"] / data["PL Total"]
-
-        if has_col("Taxa Média") and has_col("Taxa Ponderada de Cessão"):
-            def calc_taxa_media(row):
-                if pd.isna(row["Taxa Média"]):
-                    return row["Taxa Ponderada de Cessão"]
-                else:
-                    return row["Taxa Média"]
-
-            data["Taxa Média"] = data.apply(calc_taxa_media, axis=1)
-
-        if has_col("Volume Operado") and has_col("Valor Pago nas Operações no Mês") and has_col("PL Total"):
-            def calc_volume_operado(row):
-                if not pd.isna(row["Valor Pago nas Operações no Mês"]):
-                    val = row["Valor Pago nas Operações no Mês"]
-                else:
-                    val = row["Volume Operado"]
-                return val / row["PL Total"]
-
-            data["Volume Operado (PL%)"] = data.apply(calc_volume_operado, axis=1)
-
-        if has_col("Caixa/Disponibilidades") and has_col("PL Total"):
-            def calc_caixa(row):
-                fundo = row["Fundo Soberano"] if has_col("Fundo Soberano") and not pd.isna(
-                    row.get("Fundo Soberano")) else 0
-                return (row["Caixa/Disponibilidades"] + fundo) / row["PL Total"]
-
-            data["Caixa/Disponibilidades (%PL)"] = data.apply(calc_caixa, axis=1)
-
-        if has_col("PL Subordinada Jr") and has_col("PL Total"):
-            data["Alavancagem"] = (data["PL Total"] / data["PL Subordinada Jr"])
-
-        if has_col("PL Subordinada Jr") and has_col("Concentração Top 10 Cedentes (R$)"):
-            data["Indicador 1"] = (data["PL Subordinada Jr"] / data["Concentração Top 10 Cedentes (R$)"])
-
-        if has_col("PL Subordinada Jr") and has_col("PL Mezanino") and has_col("Concentração Top 10 Cedentes (R$)"):
-            data["Indicador 2"] = ((data["PL Subordinada Jr"] + data["PL Mezanino"])
-                                   / data["Concentração Top 10 Cedentes (R$)"])
-
-        # if has_col("Prazo Médio (D.U)"):
-        #     data["Prazo Médio (Padronizado D.C)"] = data["Prazo Médio (D.U)"] * 30/22
-        #
-        # if has_col("Prazo Médio (D.C)"):
-        #     data["Prazo Médio (Padronizado D.C)"] = data["Prazo Médio (D.C)"]
-        if has_col("Prazo Médio (D.C)") and has_col("Prazo Médio (D.U)"):
-            def calc_dc(row):
-                if pd.isna(row["Prazo Médio (D.U)"]):
-                    return row["Prazo Médio (D.C)"]
-                else:
-                    return row["Prazo Médio (D.U)"] * 30/22
-            data["Prazo Médio (Padronizado D.C)"] = data.apply(calc_dc, axis=1)
-
+        data = apply_metrics(data)
+        self.metric_coverage = metric_coverage(data)
         return data
 
-    def read_csvs(self, date: datetime, fidc_list: list[str] | None = None) -> None:
+    def read_csvs(self, date: datetime, fidc_list: list[str] | None = None, max_workers: Optional[int] = None) -> None:
         """
         Lê arquivos CSV de um diretório, processa os DataFrames aplicando tratamentos específicos e armazena
         os DataFrames processados em um dicionário.
 
+        Quando a transformação foi feita no formato "parquet", o arquivo `.parquet` de cada FIDC é lido no lugar
+        do CSV: as colunas já vêm como float64 e o índice como datetime, sem nenhum parsing de texto.
+
         Se uma lista de nomes `fidc_list` for fornecida, o métdo tentará ler apenas os arquivos cujos nomes
         correspondam aos FIDCs da lista e à data especificada. Se `fidc_list` for None, lê todos os arquivos CSV
         do diretório padrão que contenham a data no nome.
 
+        Os arquivos são lidos em paralelo por um pool de threads (`read_parsed`, com o engine do pyarrow e colunas
+        float64 declaradas) e o tempo de leitura de cada um é registrado no log; o tratamento das colunas é feito
+        em seguida, na ordem dos arquivos.
+
         Para cada arquivo CSV processado, são aplicadas as seguintes operações:
-        - Leitura do CSV com separador ';' e codificação UTF-8 BOM, usando a coluna "Data" como índice.
-        - Remoção de sufixos numéricos nas colunas.
-        - Processamento específico de colunas relacionadas a intervalos de dias.
-        - Renomeação de colunas equivalentes com base em mapeamento definido.
-        - Agrupamento das colunas de dias conforme padrões.
+        - Leitura do arquivo (Parquet ou CSV com separador ';' e codificação UTF-8 BOM), usando a coluna "Data" como índice.
+        - Normalização do cabeçalho por `ColumnNormalizer` (memorizada por cabeçalho, inclusive entre execuções):
+            - Remoção de sufixos numéricos nas colunas.
+            - Processamento específico de colunas relacionadas a intervalos de dias.
+            - Renomeação de colunas equivalentes com base em mapeamento definido.
+            - Agrupamento das colunas de dias conforme padrões.
         - Registro de logs de sucesso ou erro para cada arquivo.
 
         Args:
             date (datetime): Data para filtrar arquivos.
             fidc_list (list[str] | None): Lista opcional com nomes dos FIDCs para leitura.
                 Caso None, lê todos os arquivos CSV do diretório padrão que contenham a data.
+            max_workers (Optional[int]): Quantidade de leituras simultâneas. Se None, usa o valor do construtor.
 
         Raises:
             Exception: Em caso de erro geral durante a leitura ou processamento dos arquivos.
@@ -536,39 +298,48 @@ class Grouper(object):
             date_str = date.strftime("%Y_%m_%d")
             csv_dict = {}
 
-            def remove_suffix(columns):
-                return [re.sub(r'\.\d+$', '', col) for col in columns]
-
-            all_files = [f for f in os.listdir(path) if f.endswith('.csv') and f.endswith(f"_{date_str}.csv")]
-
-            files_to_process = []
+            # nome do FIDC -> arquivo; o Parquet, quando existe, tem preferência sobre o CSV
+            parsed_files = {}
+            listing = os.listdir(path)
+            for extension in (EXTENSIONS["csv"], EXTENSIONS["parquet"]):
+                suffix = f"_{date_str}{extension}"
+                for f in listing:
+                    if f.startswith("FIDC_") and f.endswith(suffix):
+                        parsed_files[f[len("FIDC_"):-len(suffix)]] = f
 
             if fidc_list is None:
                 # Lê todos os arquivos com a data especificada
-                files_to_process = all_files
+                files_to_process = [parsed_files[name] for name in sorted(parsed_files)]
             else:
-                for fidc_name in fidc_list:
-                    # Arquivo esperado no formato "FIDC_<nome>_<data>.csv"
-                    matching_files = [f for f in all_files if re.match(fr"FIDC_{re.escape(fidc_name)}_{date_str}\.csv", f)]
-                    files_to_process.extend(matching_files)
-
-            for file in files_to_process:
-                try:
-                    path_file = os.path.join(path, file)
-                    name_file = os.path.splitext(file)[0]
-                    name = name_file.split("_")[1]
-
-                    df = pd.read_csv(path_file, sep=';', encoding='utf-8-sig', index_col="Data").astype("float64")
-                    logger.info(f"FIDC {name} encontrado para agrupamento.")
-                    df.columns = remove_suffix(df.columns)
-                    df = self._days_column_processing(df)
-                    df = self._rename_equiv_columns(df)
-                    df = self._grouping_days_column(df)
-                    csv_dict[name] = df
-                except Exception as e:
-                    logger.error(f"Erro ao processar o arquivo {file}: {e}")
+                # Arquivo esperado no formato "FIDC_<nome>_<data>.csv" (ou .parquet)
+                files_to_process = [parsed_files[name] for name in fidc_list if name in parsed_files]
+
+            def _read(file):
+                start = time.perf_counter()
+                df = read_parsed(os.path.join(path, file))
+                return df, time.perf_counter() - start
+
+            workers = max(1, min(max_workers or self.max_workers, len(files_to_process)))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = [executor.submit(_read, file) for file in files_to_process]
+
+                for file, future in zip(files_to_process, futures):
+                    try:
+                        name_file = os.path.splitext(file)[0]
+                        name = name_file.split("_")[1]
+
+                        df, elapsed = future.result()
+                        logger.info(f"FIDC {name} encontrado para agrupamento (lido em {elapsed:.3f}s).")
+                        df.columns = self.normalizer.normalize(df.columns)
+                        csv_dict[name] = df
+                    except Exception as e:
+                        logger.error(f"Erro ao processar o arquivo {file}: {e}")
 
             self.csv_dict = csv_dict
+            try:
+                self.normalizer.save()
+            except OSError as e:
+                logger.warning(f"Não foi possível gravar o cache de nomes de colunas: {e}")
         except Exception as e:
             logger.error(f"Erro ao ler os arquivos CSVs do diretório {path}: {e}")
             raise Exception(f"Erro ao ler os arquivos CSVs do diretório {path}: {e}")
@@ -629,12 +400,161 @@ class Grouper(object):
             logger.error(f"Erro ao agrupar FIDCs para a data {date_str}: {e}")
             raise Exception(f"Erro ao agrupar FIDCs para a data {date_str}: {e}")
 
+    def _report_path(self, date_final: datetime) -> str:
+        return os.path.join(self.folder_root, "02_REPORT", f"FIDCS_{date_final.strftime('%Y_%m_%d')}.csv")
+
+    def _save_report(self, grouped_data: pd.DataFrame, date_final: datetime) -> list[str]:
+        """
+        Grava os FIDCs de `grouped_data` (indexado por FIDC) na base de relatórios, no mês de `date_final`.
+
+        Só as linhas dos FIDCs presentes em `grouped_data` são substituídas (e só se mudaram); as demais ficam
+        como estão. Se o mês ainda não está na base mas já existe o `02_REPORT/FIDCS_<data>.csv` de uma execução
+        anterior, ele é importado antes. Com `export_csv`, o CSV do mês é regenerado a partir da base, mas só se
+        algum FIDC mudou ou se o arquivo ainda não existe.
+
+        Returns:
+            list[str]: Nome (FIDC) de todos os fundos presentes no relatório do mês.
+
+        Raises:
+            ValueError: Caso a coluna 'FIDC' não seja encontrada nos dados processados.
+        """
+        if grouped_data.index.name != "FIDC":
+            raise ValueError("Coluna 'FIDC' não encontrada nos dados novos.")
+
+        file_to_save = self._report_path(date_final)
+        if not self.store.has_month(date_final) and os.path.exists(file_to_save):
+            self.store.import_csv(date_final, file_to_save)
+
+        changed = self.store.upsert(date_final, grouped_data)
+        if self.export_csv and (any(changed.values()) or not os.path.exists(file_to_save)):
+            self.export_report(date_final)
+
+        return self.store.fidcs(date_final)
+
+    def export_report(self, date_final: datetime) -> str:
+        """
+        Gera o `02_REPORT/FIDCS_<data>.csv` do mês a partir da base de relatórios.
+
+        Returns:
+            str: Caminho do arquivo gerado.
+        """
+        file_to_save = self._report_path(date_final)
+        self.store.export_csv(date_final, file_to_save)
+        logger.info(f"Arquivo salvo/atualizado com sucesso em {file_to_save}")
+        return file_to_save
+
+    # ------------------------  PAINEL (VÁRIOS MESES)  ------------------------ #
+    def _group_months(self, date_start: datetime, date_end: datetime) -> Dict[pd.Timestamp, pd.DataFrame]:
+        """
+        Agrupa os FIDCs já lidos (`read_csvs`) para cada mês entre `date_start` e `date_end`.
+
+        Os DataFrames de `self.csv_dict` são filtrados e empilhados uma única vez; cada mês é então recortado
+        e tratado como no `group_fidcs`: ficam só as colunas com algum valor no mês e as métricas adicionais
+        são calculadas sobre o recorte do mês (uma métrica não aparece em um mês só porque as colunas que ela
+        usa existem em outro).
+
+        Returns:
+            Dict[pd.Timestamp, pd.DataFrame]: Para cada mês com dados, a tabela indexada por FIDC.
+        """
+        start = pd.Timestamp(date_start.strftime("%Y-%m-01"))
+        end = pd.Timestamp(date_end.strftime("%Y-%m-01"))
+        logger.info(f"Iniciando agrupamento em painel dos FIDCs de {start:%Y_%m_%d} a {end:%Y_%m_%d}")
+
+        by_name = self._selecting_columns_by_name()
+        by_regex = self._selecting_columns_by_regex()
+
+        column_names = {k: by_name.get(k, []) + by_regex.get(k, [])
+                        for k in by_name.keys()}
+        self._filter_final_columns(column_names)
+
+        frames = {
+            key: df.loc[(df.index >= start) & (df.index <= end), ~df.columns.duplicated()]
+            for key, df in self.csv_dict.items()
+        }
+        panel = pd.concat(frames, names=["FIDC", "Data"], sort=True).dropna(how="all")
+
+        regex_cols = list(pd.Series(chain.from_iterable(by_regex.values())).drop_duplicates())
+        main_columns = list(self.equiv_columns.keys())
+
+        ordered = self._reorder_df_columns(main_columns, regex_cols)
+        panel = panel[[col for col in ordered if col in panel.columns]]
+
+        dates = panel.index.get_level_values("Data")
+        months = {}
+        for month in dates.unique().sort_values():
+            grouped_data = panel[dates == month].droplevel("Data").dropna(axis=1, how="all")
+            grouped_data.index.name = 'FIDC'
+            months[month] = self._create_additional_columns(grouped_data)
+        return months
+
+    def group_panel(self, date_start: datetime, date_end: datetime) -> pd.DataFrame:
+        """
+        Agrupa os FIDCs já lidos (`read_csvs`) para todos os meses entre `date_start` e `date_end`, em uma única
+        tabela indexada por (FIDC, Data).
+
+        Cada mês tem as mesmas colunas e valores do `group_fidcs` daquele mês (ver `_group_months`); colunas
+        que não existem em um mês ficam vazias nas linhas desse mês.
+
+        Args:
+            date_start (datetime): Primeiro mês do intervalo (inclusive).
+            date_end (datetime): Último mês do intervalo (inclusive).
+
+        Returns:
+            pd.DataFrame: Painel com índice (FIDC, Data) e uma linha por FIDC e mês com dados.
+
+        Raises:
+            Exception: Se ocorrer erro durante o agrupamento.
+        """
+        try:
+            months = self._group_months(date_start, date_end)
+            if not months:
+                return pd.DataFrame(index=pd.MultiIndex.from_arrays([[], []], names=["FIDC", "Data"]))
+
+            panel = pd.concat(months, names=["Data", "FIDC"], sort=False).reorder_levels(["FIDC", "Data"])
+            self.metric_coverage = metric_coverage(panel)
+            return panel
+        except Exception as e:
+            logger.error(f"Erro no agrupamento em painel: {e}")
+            raise Exception(f"Erro no agrupamento em painel: {e}")
+
+    def run_panel(self, date_source: datetime, date_start: datetime, date_end: datetime,
+                  fidc_list: list[str] | None = None) -> Dict[datetime, list[str]]:
+        """
+        Gera os relatórios de todos os meses entre `date_start` e `date_end` em um único passo.
+
+        Os arquivos de "01_PARSED" da data `date_source` são lidos e normalizados uma única vez, cada mês é
+        agrupado por `_group_months` e gravado na base de relatórios com a mesma atualização do `run`.
+        O resultado de cada mês é o mesmo de um `run` daquele mês.
+        Serve para reconstruir o histórico dos relatórios sem uma execução completa por mês.
+
+        Args:
+            date_source (datetime): Data dos arquivos de "01_PARSED" usados como fonte.
+            date_start (datetime): Primeiro mês do intervalo (inclusive).
+            date_end (datetime): Último mês do intervalo (inclusive).
+            fidc_list (list[str] | None): Lista opcional com os nomes dos FIDCs a serem processados.
+
+        Returns:
+            Dict[datetime, list[str]]: Para cada mês com dados, os FIDCs presentes no relatório final.
+
+        Raises:
+            Exception: Caso ocorra qualquer erro no processo de agrupamento ou salvamento dos arquivos.
+        """
+        try:
+            self.read_csvs(date_source, fidc_list)
+            reports = {}
+            for month, grouped_data in self._group_months(date_start, date_end).items():
+                reports[month.to_pydatetime()] = self._save_report(grouped_data, month)
+            return reports
+        except Exception as e:
+            logger.error(f"Problema em agrupar e atualizar os arquivos em painel: {e}.")
+            raise Exception(f"Problema em agrupar e atualizar os arquivos em painel: {e}.")
+
     def run(self, date_source: datetime, date_final: datetime, fidc_list: list[str] | None = None) -> list[str]:
         """
            Executa o fluxo completo de leitura, agrupamento e atualização incremental dos dados dos FIDCs.
 
            Este método realiza a leitura dos arquivos CSV processados, agrupa os dados conforme a data
-           informada e atualiza o arquivo consolidado de saída. Caso já exista um arquivo salvo, o conteúdo
+           informada e atualiza a base de relatórios do mês. Caso o mês já tenha dados salvos, o conteúdo
            anterior é preservado, e as linhas com o mesmo identificador de FIDC são atualizadas com os dados
            mais recentes.
 
@@ -642,11 +562,10 @@ class Grouper(object):
            - Cria os diretórios necessários para salvar o resultado final.
            - Lê os arquivos CSV da pasta de entrada (01_PARSED).
            - Agrupa os dados conforme a data especificada.
-           - Lê o arquivo existente (caso exista) da pasta 02_REPORT.
-           - Faz o merge entre o arquivo antigo e o novo, mantendo:
-               - Todas as linhas antigas.
-               - As linhas novas, substituindo as que possuem o mesmo FIDC.
-           - Salva o resultado final atualizado em formato CSV.
+           - Grava os FIDCs na base de relatórios (`02_REPORT_store.sqlite`), mantendo:
+               - Todas as linhas antigas do mês.
+               - As linhas novas, substituindo as que possuem o mesmo FIDC (só se mudaram).
+           - Regenera o CSV do mês em 02_REPORT a partir da base (se `export_csv` e algum FIDC mudou).
            - Registra logs de sucesso ou erro no processo.
 
            Args:
@@ -661,43 +580,11 @@ class Grouper(object):
                Exception: Caso ocorra qualquer erro no processo de agrupamento ou salvamento dos arquivos.
            """
         try:
-            date_str = date_final.strftime("%Y_%m_%d")
-
-            path_to_read = os.path.join(self.folder_root, "01_PARSED")
-            path_to_save = os.path.join(self.folder_root, "02_REPORT")
-            file_name_save = f"FIDCS_{date_str}.csv"
-            file_to_save = os.path.join(path_to_save, file_name_save)
-
-            os.makedirs(os.path.dirname(file_to_save), exist_ok=True)
-
             # --- lê os novos dados ---
             self.read_csvs(date_source, fidc_list)
             grouped_data = self.group_fidcs(date_final)
 
-            # --- se já existir um arquivo salvo, faz merge com atualização ---
-            if os.path.exists(file_to_save):
-                old_df = pd.read_csv(file_to_save, sep=';', encoding='utf-8-sig', dtype=str)
-                new_df = grouped_data.astype(str).reset_index()
-
-                # garante que a coluna FIDC existe e é chave
-                if "FIDC" not in new_df.columns:
-                    raise ValueError("Coluna 'FIDC' não encontrada nos dados novos.")
-
-                # remove duplicados antigos e insere os novos
-                merged = (
-                    pd.concat([old_df, new_df])
-                    .drop_duplicates(subset=["FIDC"], keep="last")
-                    .reset_index(drop=True)
-                )
-            else:
-                merged = grouped_data.astype(str).reset_index()
-
-            # --- salva o resultado final ---
-            merged.to_csv(file_to_save, sep=';', index=False, encoding='utf-8-sig')
-            logger.info(f"Arquivo salvo/atualizado com sucesso em {file_to_save}")
-
-            fidc_list_final = merged["FIDC"].tolist()
-            return fidc_list_final
+            return self._save_report(grouped_data, date_final)
 
         except Exception as e:
             logger.error(f"Problema em agrupar e atualizar os arquivos: {e}.")
@@ -1,19 +1,62 @@
 from v8_utilities.paths import PathV8
 from v8_utilities.anbima_calendar import Calendar
 
-from v8_fidcs.src.parser.exceltransformer import ExcelTransformer
+from v8_fidcs.src.parser.exceltransformer import ExcelTransformer, PATH, TRANSFORM_VERSION
+from v8_fidcs.src.parser.patterns import PATTERNS
+from v8_fidcs.src.parser.workbook import DEFAULT_ENGINE, resolve_engine
+from v8_fidcs.src.parser.parsed import DEFAULT_FORMAT, check_format, output_paths
+from v8_fidcs.src.others.transform_cache import TransformCache
+from v8_fidcs.src.others.memory import track_peak_memory
 from v8_fidcs.src.others.logger import LogFIDC
 
-from typing import List
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional
 
+import pickle
 import os
 
+# com 1 a transformação roda no próprio processo, como antes; o pool de processos é opcional (`max_workers`)
+DEFAULT_MAX_WORKERS = 1
+
 logger = LogFIDC()
 
+
+def _transform_fidc(path_handle: PathV8, calendar_handle: Calendar, path_read: str, path_save: str,
+                    fidc_name: str, engine: str, output_format: str, low_memory: bool = False) -> None:
+    """
+    Transforma um único FIDC. Fica no nível do módulo para poder ser executada nos processos do pool.
+    No modo `low_memory`, o pico de memória da transformação é registrado no log.
+    """
+    if not low_memory:
+        ExcelTransformer(path_handle, calendar_handle, path_read, path_save, fidc_name, engine, output_format).transform_table()
+        return
+    with track_peak_memory(f"FIDC {fidc_name}"):
+        ExcelTransformer(path_handle, calendar_handle, path_read, path_save, fidc_name, engine, output_format,
+                         low_memory=True).transform_table()
+
+def _transform_output(jobs: List[tuple]) -> List[Optional[str]]:
+    """
+    Transforma, em sequência e na ordem recebida, os FIDCs que geram o mesmo arquivo de saída, para que dois
+    processos nunca escrevam no mesmo arquivo. Retorna, para cada FIDC, a mensagem de erro ou None se deu certo.
+    """
+    errors = []
+    for job in jobs:
+        try:
+            _transform_fidc(*job)
+            errors.append(None)
+        except Exception as e:
+            errors.append(str(e))
+    return errors
+
 class Transformer(object):
-    def __init__(self, path_handle: PathV8, calendar_handle: Calendar, folder_root: str = None):
+    def __init__(self, path_handle: PathV8, calendar_handle: Calendar, folder_root: str = None, engine: str = DEFAULT_ENGINE,
+                 max_workers: int = DEFAULT_MAX_WORKERS, output_format: str = DEFAULT_FORMAT, low_memory: bool = False):
         self.path_handle = path_handle
         self.calendar_handle = calendar_handle
+        self.engine = engine
+        self.max_workers = max_workers
+        self.output_format = check_format(output_format)
+        self.low_memory = low_memory
 
 
         self.fidc_renames = {"ONIXOLD": "ONIXPRIME",
@@ -33,9 +76,51 @@ class Transformer(object):
         else:
             self.folder_root = folder_root
 
-    def run(self, date: str, fidc_list: List[str]) -> List[str]:
+    def _workers_for(self, n_jobs: int, max_workers: Optional[int]) -> int:
+        """
+        Quantidade de processos a usar. Volta para 1 (execução no próprio processo) se houver só um FIDC ou
+        se os handles não puderem ser enviados para outros processos.
+        """
+        workers = min(max_workers or self.max_workers, n_jobs)
+        if workers <= 1:
+            return 1
+        try:
+            pickle.dumps((self.path_handle, self.calendar_handle))
+        except Exception as e:
+            logger.warning(f"Handles não serializáveis ({e}), a transformação será feita em um único processo.")
+            return 1
+        return workers
+
+    def _cache_key(self, fidc_name: str, path_read: str) -> Optional[Dict[str, str]]:
+        """
+        Chave de cache da transformação de um FIDC. Retorna None (sem cache) se o Excel ou a gestora não forem
+        encontrados; nesse caso o erro aparece na própria transformação.
+        """
+        try:
+            manager = PATTERNS.manager_of(fidc_name, os.path.join(PATH, "fidcs.yaml"))
+            return TransformCache.key(path_read, manager.digest, TRANSFORM_VERSION, self.output_format,
+                                      resolve_engine(path_read, self.engine))
+        except (KeyError, OSError, ValueError):
+            return None
+
+    def _output_key(self, jobs: List[tuple]) -> Optional[Dict[str, list]]:
+        """
+        Chave de cache de um arquivo de "01_PARSED": as chaves de todos os FIDCs que o geram (vários FIDCs podem
+        ser renomeados para a mesma saída), na ordem de `fidc_list`. Retorna None se alguma delas não existir.
+        """
+        sources = []
+        for job in jobs:
+            key = self._cache_key(job[4], job[2])
+            if key is None:
+                return None
+            sources.append(dict(key, fidc=job[4]))
+        return {"sources": sources}
+
+    def run(self, date: str, fidc_list: List[str], max_workers: Optional[int] = None, force: bool = False) -> List[str]:
         """
         Processa e transforma os arquivos Excel de uma lista de FIDCs, salvando-os como CSVs no caminho destino.
+        Com `output_format` "parquet" (no construtor), cada FIDC também é salvo em Parquet, lido pelo Grouper.
+        Com `low_memory`, cada FIDC é transformado sem cópias defensivas e o seu pico de memória vai para o log.
 
         Para cada FIDC na lista:
             - Constrói o caminho do arquivo Excel de entrada.
@@ -44,33 +129,101 @@ class Transformer(object):
             - Executa a transformação via ExcelTransformer.
             - Registra sucesso ou falha, removendo da lista os que falharem.
 
+        Com mais de um worker, cada arquivo de saída é transformado em um processo do pool; FIDCs renomeados para
+        o mesmo arquivo rodam em sequência no mesmo processo. A falha de um FIDC não afeta os demais e a lista
+        retornada mantém a ordem de `fidc_list`.
+
+        FIDCs cujo Excel, regras da gestora e versão do transformador não mudaram desde a última transformação
+        (ver `TransformCache`) não são processados de novo e contam como sucesso. O cache é por arquivo de saída:
+        se vários FIDCs são renomeados para o mesmo arquivo, todos são transformados de novo (na ordem de
+        `fidc_list`, o último prevalece) quando qualquer um deles mudou.
+
         Args:
             date (str): Data no formato YYYY_MM_DD
             fidc_list (List[str]): Lista de nomes dos FIDCs a serem processados.
+            max_workers (Optional[int]): Número de processos. Se None, usa o valor definido no construtor.
+            force (bool): Se True, ignora o cache e transforma todos os FIDCs.
 
         Returns:
             List[str]: Lista atualizada de FIDCs que foram processados com sucesso.
         """
         try:
-            for fidc_name in fidc_list[:]:
-                try:
-                    file_name_read = f"FIDC_{fidc_name}_" + date + ".xlsx"
-                    path_target_r = os.path.join(self.folder_root, "00_RAW", file_name_read)
+            cache = TransformCache(self.folder_root)
+            # FIDCs renomeados para o mesmo arquivo de saída formam um grupo: o último da lista prevalece
+            outputs: Dict[str, List[tuple]] = {}
+            for fidc_name in fidc_list:
+                file_name_read = f"FIDC_{fidc_name}_" + date + ".xlsx"
+                path_target_r = os.path.join(self.folder_root, "00_RAW", file_name_read)
 
-                    fidc_name_updated = self.fidc_renames.get(fidc_name, fidc_name)
-                    file_name_save = f"FIDC_{fidc_name_updated}_" + date + ".csv"
-                    path_target_s = os.path.join(self.folder_root, "01_PARSED", file_name_save)
+                fidc_name_updated = self.fidc_renames.get(fidc_name, fidc_name)
+                file_name_save = f"FIDC_{fidc_name_updated}_" + date + ".csv"
+                path_target_s = os.path.join(self.folder_root, "01_PARSED", file_name_save)
 
-                    os.makedirs(os.path.dirname(path_target_s), exist_ok=True)
+                outputs.setdefault(path_target_s, []).append(
+                    (self.path_handle, self.calendar_handle, path_target_r, path_target_s, fidc_name, self.engine,
+                     self.output_format, self.low_memory))
 
-                    ExcelTransformer(self.path_handle, self.calendar_handle, path_target_r, path_target_s, fidc_name).transform_table()
+            units, keys = [], {}
+            for path_target_s, group in outputs.items():
+                file_name_save = os.path.basename(path_target_s)
+                key = self._output_key(group)
+                if not force and cache.is_current(file_name_save, key, *output_paths(path_target_s, self.output_format)):
+                    fidc_names = ", ".join(job[4] for job in group)
+                    logger.info(f"O FIDC {fidc_names} não mudou desde a última transformação, mantendo {file_name_save}.")
+                    continue
+                keys[path_target_s] = (file_name_save, key)
+                units.append(group)
+
+            # só arquivos de saída diferentes rodam em paralelo; os FIDCs de um mesmo arquivo rodam em sequência
+            workers = self._workers_for(len(units), max_workers)
+            if workers > 1:
+                logger.info(f"Transformando {sum(map(len, units))} FIDCs em {workers} processos.")
+                executor = ProcessPoolExecutor(max_workers=workers)
+            else:
+                executor = None
+
+            try:
+                futures = []
+                for unit in units:
+                    try:
+                        os.makedirs(os.path.dirname(unit[0][3]), exist_ok=True)
+                        futures.append(executor.submit(_transform_output, unit) if executor else None)
+                    except Exception as e:
+                        futures.append(e)
+
+                failed = set()
+                for unit, future in zip(units, futures):
+                    try:
+                        if isinstance(future, Exception):
+                            raise future
+                        errors = _transform_output(unit) if future is None else future.result()
+                    except Exception as e:
+                        errors = [str(e)] * len(unit)
+
+                    for job, error in zip(unit, errors):
+                        fidc_name = job[4]
+                        if error is None:
+                            logger.info(f"O FIDC {fidc_name} foi tratado com sucesso.")
+                        else:
+                            failed.add(job[3])
+                            fidc_list.remove(fidc_name)
+                            logger.error(f"O FIDC {fidc_name} não foi tratado, devido ao erro: {error}")
+
+                for path_target_s, (file_name_save, key) in keys.items():
+                    if path_target_s in failed:
+                        cache.remove(file_name_save)
+                    else:
+                        cache.update(file_name_save, key)
+            finally:
+                if executor is not None:
+                    executor.shutdown()
+                try:
+                    cache.save()
+                except OSError as e:
+                    logger.warning(f"Não foi possível gravar o cache de transformação: {e}")
 
-                    logger.info(f"O FIDC {fidc_name} foi tratado com sucesso.")
-                except Exception as e:
-                    fidc_list.remove(fidc_name)
-                    logger.error(f"O FIDC {fidc_name} não foi tratado, devido ao erro: {e}")
             fidc_list = [self.fidc_renames.get(fidc, fidc) for fidc in fidc_list]
             return fidc_list
         except Exception as e:
             logger.error(f"Transformação dos Dados para o Mês {date}: {e}")
-            raise e
\ No newline at end of file
+            raise e
@@ -0,0 +1,83 @@
+"""
+Benchmark offline do `Extractor.download_fidcs` contra o servidor falso de `fake_graph.py`.
+
+Mede arquivos/s e MB/s para diferentes quantidades de downloads simultâneos.
+
+Uso:
+    python -m v8_fidcs.testes.bench_extractor --files 60 --size-kb 512 --latency 0.05 --workers 1 2 4 8
+"""
+from v8_fidcs.testes.fake_graph import MONTH_FOLDER, make_synthetic_workbooks, serve_fake_graph
+from v8_fidcs.src.services.extractor import Extractor
+from v8_fidcs.src.others.graph_session import build_session
+
+import argparse
+import datetime
+import tempfile
+import shutil
+import time
+import os
+
+MESES = ["janeiro", "fevereiro", "março", "abril", "maio", "junho",
+         "julho", "agosto", "setembro", "outubro", "novembro", "dezembro"]
+
+
+class _Calendar(object):
+    def get_month_by_number(self, month: int) -> str:
+        return MESES[month - 1]
+
+
+class OfflineExtractor(Extractor):
+    """
+    `Extractor` apontado para o servidor falso, sem passar pela autenticação do `SharePoint`.
+    """
+
+    def __init__(self, graph_url: str, folder_root: str, max_workers: int):
+        self.site_id = "fake"
+        self.headers = {"Authorization": "Bearer offline"}
+        self.calendar_handle = _Calendar()
+        self.path_handle = None
+        self.max_workers = max_workers
+        self.session = build_session(max_workers)
+        self.graph_url = graph_url
+        self.folder_root = folder_root
+
+
+def run(files: int, size_kb: int, latency: float, throttle_every: int, workers_list: list) -> None:
+    date = datetime.date(2025, 3, 1)
+    workdir = tempfile.mkdtemp(prefix="bench_extractor_")
+    try:
+        names = make_synthetic_workbooks(os.path.join(workdir, "drive", MONTH_FOLDER), files, size_kb)
+        total_mb = files * size_kb / 1024
+
+        with serve_fake_graph(os.path.join(workdir, "drive"), page_size=20, latency=latency,
+                              throttle_every=throttle_every, retry_after=0.05) as server:
+            print(f"{files} arquivos x {size_kb} KB, latência {latency * 1000:.0f} ms por requisição")
+            print(f"{'workers':>8} {'segundos':>9} {'arq/s':>8} {'MB/s':>8} {'429':>5}")
+            for workers in workers_list:
+                folder_root = os.path.join(workdir, f"out_{workers}")
+                extractor = OfflineExtractor(server.url, folder_root, workers)
+                throttled_before = server.throttled
+
+                listed = extractor.list_fidcs(date)
+                assert sorted(listed) == sorted(names), "listagem incompleta"
+
+                start = time.perf_counter()
+                downloaded = extractor.download_fidcs(date, listed)
+                elapsed = time.perf_counter() - start
+                assert downloaded == listed, "downloads com falha"
+
+                print(f"{workers:>8} {elapsed:>9.2f} {files / elapsed:>8.1f} {total_mb / elapsed:>8.1f} "
+                      f"{server.throttled - throttled_before:>5}")
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--files", type=int, default=60)
+    parser.add_argument("--size-kb", type=int, default=512)
+    parser.add_argument("--latency", type=float, default=0.05, help="atraso por requisição, em segundos")
+    parser.add_argument("--throttle-every", type=int, default=0, help="429 a cada N requisições (0 desativa)")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    args = parser.parse_args()
+    run(args.files, args.size_kb, args.latency, args.throttle_every, args.workers)
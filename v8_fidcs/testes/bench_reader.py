@@ -0,0 +1,127 @@
+"""
+Benchmark dos engines de leitura de `Workbook` nos layouts de planilha das gestoras.
+
+Para cada layout (uma sheet, três sheets como ORRAM/MULTIASSET/FIRMA e a sheet "Dados" da SOLAR) gera uma
+planilha sintética e mede, em um processo novo por engine, o tempo de leitura e o pico de memória (RSS).
+Também confere se os engines devolvem o mesmo conteúdo.
+
+Uso:
+    python -m v8_fidcs.testes.bench_reader --items 300 --months 120 --repeat 3
+"""
+from v8_fidcs.src.parser.workbook import Workbook, resolve_engine
+
+import subprocess
+import argparse
+import datetime
+import tempfile
+import resource
+import shutil
+import json
+import time
+import sys
+import os
+
+import numpy as np
+import pandas as pd
+
+ENGINES = ["openpyxl", "calamine"]
+
+
+def make_sheet(items: int, months: int, seed: int) -> pd.DataFrame:
+    """
+    Sheet no formato dos relatórios: itens nas linhas, meses nas colunas, números como float e como
+    texto PT-BR, e algumas células vazias ou com '-'.
+    """
+    rng = np.random.default_rng(seed)
+    start = datetime.date(2020, 1, 1)
+    dates = [(pd.Timestamp(start) + pd.DateOffset(months=m)).strftime("%d/%m/%Y") for m in range(months)]
+    values = rng.uniform(0, 1e7, size=(items, months)).round(2).astype(object)
+    as_text = rng.random(size=values.shape) < 0.3
+    values[as_text] = [f"{v:,.2f}".replace(",", "X").replace(".", ",").replace("X", ".") for v in values[as_text]]
+    values[rng.random(size=values.shape) < 0.05] = "-"
+    values[rng.random(size=values.shape) < 0.05] = None
+    sheet = pd.DataFrame(values, columns=dates)
+    sheet.insert(0, "Item", [f"Item {i}" for i in range(items)])
+    return sheet
+
+
+def make_layouts(folder: str, items: int, months: int) -> dict:
+    """
+    Gera uma planilha por layout e retorna {layout: (caminho, sheets, header)}.
+    """
+    layouts = {}
+
+    path = os.path.join(folder, "single.xlsx")
+    make_sheet(items, months, 0).to_excel(path, index=False)
+    layouts["uma sheet"] = (path, [0], 0)
+
+    path = os.path.join(folder, "multi.xlsx")
+    with pd.ExcelWriter(path) as writer:
+        for k in range(3):
+            make_sheet(items // 3, months, k).to_excel(writer, sheet_name=f"Sheet{k + 1}", index=False)
+    layouts["três sheets"] = (path, ["Sheet1", "Sheet2", "Sheet3"], None)
+
+    path = os.path.join(folder, "solar.xlsx")
+    with pd.ExcelWriter(path) as writer:
+        make_sheet(10, 5, 9).to_excel(writer, sheet_name="Capa", index=False)
+        make_sheet(items, months, 3).to_excel(writer, sheet_name="Dados", index=False)
+    layouts["SOLAR (Dados)"] = (path, ["Dados"], None)
+
+    return layouts
+
+
+def read_all(path: str, sheets: list, header, engine: str) -> list:
+    with Workbook(path, engine) as workbook:
+        return list(workbook.read_many(sheets, header=header).values())
+
+
+def child(path: str, sheets: list, header, engine: str, repeat: int) -> None:
+    """
+    Executado em um processo novo: mede tempo médio e pico de RSS do processo (inclui o próprio pandas,
+    igual para todos os engines).
+    """
+    start = time.perf_counter()
+    for _ in range(repeat):
+        read_all(path, sheets, header, engine)
+    elapsed = (time.perf_counter() - start) / repeat
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(json.dumps({"seconds": elapsed, "rss_mb": peak / 1024}))
+
+
+def measure(path: str, sheets: list, header, engine: str, repeat: int) -> dict:
+    cmd = [sys.executable, "-m", "v8_fidcs.testes.bench_reader", "--child", path, engine,
+           json.dumps(sheets), json.dumps(header), "--repeat", str(repeat)]
+    out = subprocess.run(cmd, check=True, capture_output=True, text=True).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def run(items: int, months: int, repeat: int) -> None:
+    engines = [e for e in ENGINES if resolve_engine("x.xlsx", e) == e]
+    workdir = tempfile.mkdtemp(prefix="bench_reader_")
+    try:
+        layouts = make_layouts(workdir, items, months)
+        print(f"{items} itens x {months} meses, média de {repeat} leituras")
+        print(f"{'layout':<15} {'engine':<10} {'segundos':>9} {'pico RSS (MB)':>14} {'igual':>6}")
+        for layout, (path, sheets, header) in layouts.items():
+            reference = read_all(path, sheets, header, "openpyxl")
+            for engine in engines:
+                same = all(a.equals(b) for a, b in zip(reference, read_all(path, sheets, header, engine)))
+                result = measure(path, sheets, header, engine, repeat)
+                print(f"{layout:<15} {engine:<10} {result['seconds']:>9.3f} {result['rss_mb']:>14.1f} "
+                      f"{'sim' if same else 'NÃO':>6}")
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--items", type=int, default=300)
+    parser.add_argument("--months", type=int, default=120)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--child", nargs=4, metavar=("PATH", "ENGINE", "SHEETS", "HEADER"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.child:
+        path, engine, sheets, header = args.child
+        child(path, json.loads(sheets), json.loads(header), engine, args.repeat)
+    else:
+        run(args.items, args.months, args.repeat)
@@ -0,0 +1,32 @@
+from v8_fidcs.testes.fake_graph import MONTH_FOLDER, make_synthetic_workbooks, serve_fake_graph
+from v8_fidcs.testes.bench_extractor import OfflineExtractor
+
+import datetime
+import pytest
+import os
+
+DATE = datetime.date(2025, 3, 1)
+
+
+@pytest.fixture
+def drive_folder(tmp_path):
+    """Pasta do mês (`MONTH_FOLDER`) dentro do drive servido pelo servidor falso."""
+    return os.path.join(str(tmp_path), "drive", MONTH_FOLDER)
+
+
+@pytest.fixture
+def fake_graph(tmp_path, drive_folder):
+    """
+    Servidor falso do Graph com 6 arquivos sintéticos de 64 KB na pasta do mês, paginados de 4 em 4.
+    Os nomes dos arquivos ficam em `fake_graph.names`.
+    """
+    names = make_synthetic_workbooks(drive_folder, count=6, size_kb=64)
+    with serve_fake_graph(os.path.join(str(tmp_path), "drive"), page_size=4, retry_after=0.05) as graph:
+        graph.names = names
+        yield graph
+
+
+@pytest.fixture
+def extractor(fake_graph, tmp_path):
+    """`Extractor` apontado para o `fake_graph`, gravando em `<tmp_path>/out`."""
+    return OfflineExtractor(fake_graph.url, os.path.join(str(tmp_path), "out"), max_workers=2)
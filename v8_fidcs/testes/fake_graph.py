@@ -0,0 +1,363 @@
+"""
+Servidor HTTP local que imita os endpoints do Microsoft Graph usados pelo `Extractor` e pelo `SharePoint`,
+servindo arquivos de um diretório local como se fossem o drive do site.
+
+Permite exercitar extração e download sem tenant real; a fixture `fake_graph` de `conftest.py` sobe o servidor
+para os testes de `test_extractor.py` e `server.url` substitui GRAPH_URL no Extractor.
+
+Endpoints emulados (sempre sob /v1.0/sites/<site>/drive):
+    - root:/<caminho>                 metadados do item pelo caminho
+    - root:/<caminho>:/children       filhos da pasta, paginados com @odata.nextLink
+    - root:/<caminho>:/content        conteúdo do arquivo
+    - items/<id>, items/<id>/children, items/<id>/content (com suporte a Range)
+    - root/delta                      delta: token=latest gera um cursor; com cursor, devolve os arquivos criados ou
+                                      alterados desde ele e os apagados (só com id, como o Graph)
+    - /v1.0/$batch                    lote de sub-requisições GET
+Falhas simuladas:
+    - throttling: a cada `throttle_every` requisições uma delas responde 429 com `Retry-After`;
+    - `interrupt_after`: o primeiro download completo de cada arquivo é cortado após esse número de bytes;
+    - `bad_hashes`: arquivos cujo quickXorHash informado não confere com o conteúdo.
+"""
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+from urllib.parse import parse_qs, unquote, urlsplit
+
+import threading
+import hashlib
+import sys
+import json
+import time
+import os
+
+from v8_fidcs.src.others.quickxor import QuickXorHash
+
+API_PREFIX = "/v1.0"
+MONTH_FOLDER = os.path.join("FIDCs Investidos", "Relatórios", "Planilhas de Monitoramentos", "2025", "Relatórios Março")
+
+
+def make_synthetic_workbooks(folder: str, count: int = 60, size_kb: int = 256, prefix: str = "FUNDO") -> list:
+    """
+    Cria `count` arquivos de `size_kb` KB com conteúdo pseudoaleatório determinístico, nomeados `<prefix><n>`
+    (sem extensão, como os itens da pasta do mês no SharePoint).
+
+    Returns:
+        list: Nomes dos arquivos criados.
+    """
+    os.makedirs(folder, exist_ok=True)
+    names = []
+    for n in range(count):
+        name = f"{prefix}{n:03d}"
+        seed = hashlib.sha256(name.encode()).digest()
+        block = seed * (1024 // len(seed))
+        with open(os.path.join(folder, name), "wb") as f:
+            for _ in range(size_kb):
+                f.write(block)
+        names.append(name)
+    return names
+
+
+class FakeGraph(object):
+    """
+    Estado do servidor falso: diretório servido, paginação, latência e regras de throttling.
+
+    Args:
+        root_dir (str): Diretório local que representa a raiz do drive.
+        page_size (int): Itens por página em `/children`.
+        latency (float): Atraso artificial (s) por requisição, para simular a ida e volta ao Graph.
+        throttle_every (int): A cada N requisições, uma recebe 429. Zero desativa.
+        retry_after (float): Valor do cabeçalho `Retry-After` nas respostas 429.
+        interrupt_after (int): Corta a conexão após esse número de bytes no primeiro download de cada arquivo.
+            Zero desativa.
+    """
+
+    def __init__(self, root_dir: str, page_size: int = 200, latency: float = 0.0,
+                 throttle_every: int = 0, retry_after: float = 0.1, interrupt_after: int = 0):
+        self.root_dir = os.path.abspath(root_dir)
+        self.page_size = page_size
+        self.latency = latency
+        self.throttle_every = throttle_every
+        self.retry_after = retry_after
+        self.interrupt_after = interrupt_after
+        self.bad_hashes: Set[str] = set()  # nomes de arquivo com hash errado
+        self.url = ""
+        self.requests_served = 0
+        self.throttled = 0
+        self.range_requests: List[Tuple[str, int]] = []
+        self._interrupted: Set[str] = set()
+        self._snapshots: List[Dict[str, Dict[str, Any]]] = []
+        self._lock = threading.Lock()
+        self._hash_cache: Dict[Tuple[str, float, int], str] = {}
+
+    # ------------------------  ITENS DO DRIVE  ------------------------ #
+    @staticmethod
+    def item_id(rel_path: str) -> str:
+        return hashlib.sha1(rel_path.encode("utf-8")).hexdigest()[:16]
+
+    def _path_by_id(self, item_id: str) -> Optional[str]:
+        for dirpath, dirnames, filenames in os.walk(self.root_dir):
+            for name in [""] + dirnames + filenames:
+                rel = os.path.relpath(os.path.join(dirpath, name), self.root_dir).replace(os.sep, "/")
+                rel = "" if rel == "." else rel
+                if self.item_id(rel) == item_id:
+                    return rel
+        return None
+
+    def _quick_xor(self, full_path: str, stat: os.stat_result) -> str:
+        key = (full_path, stat.st_mtime, stat.st_size)
+        if key not in self._hash_cache:
+            hasher = QuickXorHash()
+            with open(full_path, "rb") as f:
+                for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                    hasher.update(chunk)
+            self._hash_cache[key] = hasher.base64digest()
+        return self._hash_cache[key]
+
+    def item(self, rel_path: str) -> Optional[Dict[str, Any]]:
+        full_path = os.path.join(self.root_dir, rel_path)
+        if not os.path.exists(full_path):
+            return None
+        stat = os.stat(full_path)
+        parent = os.path.dirname(rel_path)
+        version = f"{stat.st_mtime_ns}-{stat.st_size}"
+        item = {
+            "id": self.item_id(rel_path),
+            "name": os.path.basename(rel_path) or "root",
+            "eTag": f'"{{{self.item_id(rel_path)}}},{version}"',
+            "cTag": f'"c:{{{self.item_id(rel_path)}}},{version}"',
+            "size": stat.st_size,
+            "lastModifiedDateTime": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(stat.st_mtime)),
+            "parentReference": {"id": self.item_id(parent), "path": f"/drive/root:/{parent}"},
+        }
+        if os.path.isdir(full_path):
+            item["folder"] = {"childCount": len(os.listdir(full_path))}
+        else:
+            quick_xor = self._quick_xor(full_path, stat)
+            if item["name"] in self.bad_hashes:
+                quick_xor = quick_xor[::-1]
+            item["file"] = {"hashes": {"quickXorHash": quick_xor}}
+        return item
+
+    def _files(self) -> Dict[str, Dict[str, Any]]:
+        files = {}
+        for dirpath, _, filenames in os.walk(self.root_dir):
+            for name in filenames:
+                item = self.item(os.path.relpath(os.path.join(dirpath, name), self.root_dir).replace(os.sep, "/"))
+                files[item["id"]] = item
+        return files
+
+    def delta(self, token: str) -> Dict[str, Any]:
+        """
+        Mudanças nos arquivos do drive desde o cursor `token` ("latest" só gera um cursor novo).
+        """
+        files = self._files()
+        with self._lock:
+            self._snapshots.append(files)
+            new_token = len(self._snapshots) - 1
+        link = f"{self.url}/sites/fake/drive/root/delta?token={new_token}"
+        if token == "latest":
+            return {"value": [], "@odata.deltaLink": link}
+        before = self._snapshots[int(token)]
+        changed = [item for item_id, item in files.items()
+                   if item_id not in before or before[item_id]["eTag"] != item["eTag"]]
+        deleted = [{"id": item_id, "deleted": {"state": "deleted"}} for item_id in before if item_id not in files]
+        return {"value": changed + deleted, "@odata.deltaLink": link}
+
+    def children(self, rel_path: str, skip: int) -> Optional[Dict[str, Any]]:
+        full_path = os.path.join(self.root_dir, rel_path)
+        if not os.path.isdir(full_path):
+            return None
+        names = sorted(os.listdir(full_path))
+        page = names[skip:skip + self.page_size]
+        body = {"value": [self.item(f"{rel_path}/{name}".strip("/")) for name in page]}
+        if skip + self.page_size < len(names):
+            body["@odata.nextLink"] = (f"{self.url}/sites/fake/drive/items/{self.item_id(rel_path)}/children"
+                                       f"?$skiptoken={skip + self.page_size}")
+        return body
+
+    def should_throttle(self) -> bool:
+        with self._lock:
+            self.requests_served += 1
+            if self.throttle_every and self.requests_served % self.throttle_every == 0:
+                self.throttled += 1
+                return True
+        return False
+
+    # ------------------------  ROTEAMENTO  ------------------------ #
+    def resolve(self, url: str) -> Tuple[int, Dict[str, str], Any]:
+        """
+        Resolve uma URL GET do drive e devolve (status, cabeçalhos, corpo JSON ou caminho de arquivo).
+        """
+        parts = urlsplit(url)
+        query = parse_qs(parts.query)
+        path = unquote(parts.path)
+        if path.startswith(API_PREFIX):
+            path = path[len(API_PREFIX):]
+
+        marker = "/drive/"
+        if marker not in path:
+            return 404, {}, {"error": {"code": "itemNotFound", "message": path}}
+        route = path.split(marker, 1)[1]
+        skip = int(query.get("$skiptoken", ["0"])[0])
+
+        if route == "root/delta":
+            return 200, {}, self.delta(query.get("token", ["latest"])[0])
+
+        suffix = None
+        if route.startswith("root:"):
+            rel = route[len("root:"):]
+            if rel.endswith(":/children") or rel.endswith(":/content"):
+                rel, suffix = rel.rsplit(":/", 1)
+            rel = rel.strip("/")
+        elif route.startswith("items/"):
+            pieces = route.split("/")
+            rel = self._path_by_id(pieces[1])
+            suffix = pieces[2] if len(pieces) > 2 else None
+            if rel is None:
+                return 404, {}, {"error": {"code": "itemNotFound", "message": pieces[1]}}
+        else:
+            return 404, {}, {"error": {"code": "invalidRequest", "message": route}}
+
+        if suffix == "children":
+            body = self.children(rel, skip)
+        elif suffix == "content":
+            full_path = os.path.join(self.root_dir, rel)
+            return (200, {}, full_path) if os.path.isfile(full_path) else (404, {}, {"error": {"code": "itemNotFound"}})
+        else:
+            body = self.item(rel)
+        if body is None:
+            return 404, {}, {"error": {"code": "itemNotFound", "message": rel}}
+        return 200, {}, body
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server_version = "FakeGraph/1.0"
+    protocol_version = "HTTP/1.1"
+
+    @property
+    def graph(self) -> FakeGraph:
+        return self.server.graph
+
+    def log_message(self, format, *args):  # silencioso: o benchmark mede, não loga
+        pass
+
+    def _send_json(self, status: int, body: Any, headers: Optional[Dict[str, str]] = None) -> None:
+        payload = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _throttled(self) -> bool:
+        if self.graph.latency:
+            time.sleep(self.graph.latency)
+        if self.graph.should_throttle():
+            self._send_json(429, {"error": {"code": "activityLimitReached"}},
+                            {"Retry-After": str(self.graph.retry_after)})
+            return True
+        return False
+
+    def _send_file(self, full_path: str) -> None:
+        size = os.path.getsize(full_path)
+        start, end = 0, size - 1
+        range_header = self.headers.get("Range")
+        if range_header and range_header.startswith("bytes="):
+            first, _, last = range_header[len("bytes="):].partition("-")
+            start = int(first or 0)
+            end = int(last) if last else size - 1
+            if start >= size:
+                self.send_response(416)
+                self.send_header("Content-Range", f"bytes */{size}")
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            self.graph.range_requests.append((os.path.basename(full_path), start))
+        stop = end + 1
+        if self.graph.interrupt_after and not range_header and full_path not in self.graph._interrupted:
+            self.graph._interrupted.add(full_path)
+            stop = min(stop, start + self.graph.interrupt_after)
+            self.close_connection = True
+        self.send_response(206 if range_header else 200)
+        self.send_header("Content-Type", "application/octet-stream")
+        self.send_header("Content-Length", str(end - start + 1))
+        self.send_header("Accept-Ranges", "bytes")
+        if range_header:
+            self.send_header("Content-Range", f"bytes {start}-{end}/{size}")
+        self.end_headers()
+        with open(full_path, "rb") as f:
+            f.seek(start)
+            remaining = stop - start
+            while remaining > 0:
+                chunk = f.read(min(1024 * 1024, remaining))
+                if not chunk:
+                    break
+                self.wfile.write(chunk)
+                remaining -= len(chunk)
+
+    def do_GET(self):
+        if self._throttled():
+            return
+        status, headers, body = self.graph.resolve(self.path)
+        if isinstance(body, str):
+            self._send_file(body)
+        else:
+            self._send_json(status, body, headers)
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        payload = json.loads(self.rfile.read(length) or b"{}")
+        if self._throttled():
+            return
+        if not self.path.rstrip("/").endswith("$batch"):
+            self._send_json(404, {"error": {"code": "invalidRequest"}})
+            return
+        responses = []
+        for sub in payload.get("requests", []):
+            if self.graph.should_throttle():
+                responses.append({"id": sub["id"], "status": 429,
+                                  "headers": {"Retry-After": str(self.graph.retry_after)}, "body": {}})
+                continue
+            status, headers, body = self.graph.resolve(sub["url"])
+            if isinstance(body, str):
+                status, body = 400, {"error": {"code": "invalidRequest", "message": "content in $batch"}}
+            responses.append({"id": sub["id"], "status": status, "headers": headers, "body": body})
+        self._send_json(200, {"responses": responses})
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def handle_error(self, request, client_address):
+        # clientes fechando conexões keep-alive ao fim do benchmark não são erro
+        if not isinstance(sys.exc_info()[1], (ConnectionResetError, BrokenPipeError)):
+            super().handle_error(request, client_address)
+
+
+@contextmanager
+def serve_fake_graph(root_dir: str, **options) -> Iterator[FakeGraph]:
+    """
+    Sobe o servidor falso em uma porta livre de 127.0.0.1, em thread própria, e o encerra ao sair do contexto.
+
+    Args:
+        root_dir (str): Diretório servido como raiz do drive.
+        **options: Repassados para `FakeGraph` (page_size, latency, throttle_every, retry_after).
+
+    Yields:
+        FakeGraph: Estado do servidor; `url` é a base a ser usada no lugar de `GRAPH_URL`.
+    """
+    graph = FakeGraph(str(root_dir), **options)
+    server = _Server(("127.0.0.1", 0), _Handler)
+    server.graph = graph
+    graph.url = f"http://127.0.0.1:{server.server_address[1]}{API_PREFIX}"
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield graph
+    finally:
+        server.shutdown()
+        server.server_close()
+        thread.join()
+
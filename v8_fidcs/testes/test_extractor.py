@@ -0,0 +1,97 @@
+from v8_fidcs.testes.conftest import DATE
+from v8_fidcs.src.others.manifest import RawManifest
+from v8_fidcs.src.services import extractor as extractor_module
+
+import types
+import time
+import os
+
+
+def _raw_file(extractor, name):
+    return os.path.join(extractor.folder_root, "00_RAW", f"FIDC_{name}_{DATE:%Y_%m_%d}.xlsx")
+
+
+def _read(path):
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def test_list_fidcs_follows_pages(extractor, fake_graph):
+    assert extractor.list_fidcs(DATE) == fake_graph.names
+
+
+def test_throttled_requests_wait_retry_after(extractor, fake_graph, monkeypatch):
+    waits = []
+    monkeypatch.setattr(extractor_module, "time",
+                        types.SimpleNamespace(sleep=lambda s: (waits.append(s), time.sleep(s))))
+    fake_graph.throttle_every = 3
+
+    assert extractor.download_fidcs(DATE, fake_graph.names) == fake_graph.names
+    assert fake_graph.throttled > 0
+    assert waits and all(wait == fake_graph.retry_after for wait in waits)
+
+
+def test_interrupted_download_resumes_with_range(extractor, fake_graph, drive_folder):
+    fake_graph.interrupt_after = 10 * 1024
+
+    assert extractor.download_fidcs(DATE, fake_graph.names) == fake_graph.names
+    assert sorted(name for name, _ in fake_graph.range_requests) == sorted(fake_graph.names)
+    assert all(start > 0 for _, start in fake_graph.range_requests)
+    for name in fake_graph.names:
+        assert _read(_raw_file(extractor, name)) == _read(os.path.join(drive_folder, name))
+        assert not os.path.exists(_raw_file(extractor, name) + ".part")
+
+
+def test_hash_mismatch_discards_download(extractor, fake_graph, drive_folder):
+    bad = fake_graph.names[0]
+    fake_graph.bad_hashes.add(bad)
+
+    assert extractor.download_fidcs(DATE, fake_graph.names) == fake_graph.names[1:]
+    assert not os.path.exists(_raw_file(extractor, bad))
+    assert not os.path.exists(_raw_file(extractor, bad) + ".part")
+
+    fake_graph.bad_hashes.clear()
+    assert extractor.download_fidcs(DATE, [bad]) == [bad]
+    assert _read(_raw_file(extractor, bad)) == _read(os.path.join(drive_folder, bad))
+
+
+def test_sync_retries_failed_download_after_delta(extractor, fake_graph, drive_folder):
+    assert extractor.sync_fidcs(DATE) == fake_graph.names
+    assert extractor.sync_fidcs(DATE) == []
+
+    # gestora reenvia um arquivo, mas o download dele falha
+    changed = fake_graph.names[1]
+    with open(os.path.join(drive_folder, changed), "wb") as f:
+        f.write(b"reenviado" * 4096)
+    fake_graph.bad_hashes.add(changed)
+    assert extractor.sync_fidcs(DATE) == []
+    assert changed in next(iter(RawManifest(extractor.folder_root).pending.values()))
+
+    # o arquivo não muda mais no SharePoint, mas continua pendente e é baixado na próxima sincronização
+    fake_graph.bad_hashes.clear()
+    assert extractor.sync_fidcs(DATE) == [changed]
+    assert _read(_raw_file(extractor, changed)) == b"reenviado" * 4096
+    assert RawManifest(extractor.folder_root).pending == {}
+    assert extractor.sync_fidcs(DATE) == []
+
+
+def test_sync_keeps_cursor_for_items_outside_fidc_list(extractor, fake_graph, drive_folder):
+    assert extractor.sync_fidcs(DATE) == fake_graph.names
+
+    first, changed = fake_graph.names[0], fake_graph.names[3]
+    with open(os.path.join(drive_folder, changed), "wb") as f:
+        f.write(b"novo" * 4096)
+    assert extractor.sync_fidcs(DATE, [first]) == []
+    assert extractor.sync_fidcs(DATE) == [changed]
+
+
+def test_sync_removes_deleted_items_by_id(extractor, fake_graph, drive_folder):
+    assert extractor.sync_fidcs(DATE) == fake_graph.names
+
+    deleted = fake_graph.names[2]
+    os.remove(os.path.join(drive_folder, deleted))
+    assert extractor.sync_fidcs(DATE) == []
+
+    files = RawManifest(extractor.folder_root).files
+    assert os.path.basename(_raw_file(extractor, deleted)) not in files
+    assert len(files) == len(fake_graph.names) - 1
@@ -0,0 +1,79 @@
+from v8_fidcs.src.services.grouper import Grouper
+from v8_fidcs.src.parser.parsed import write_parsed
+
+import pandas as pd
+import numpy as np
+
+import datetime
+import pytest
+import os
+
+SOURCE = datetime.datetime(2025, 6, 1)
+MONTHS = [datetime.datetime(2025, 4, 1), datetime.datetime(2025, 5, 1), datetime.datetime(2025, 6, 1)]
+
+
+def _write_parsed_files(folder_root):
+    """
+    Dois FIDCs em "01_PARSED": o A só tem "Valor Pago nas Operações no Mês" em junho e o B só tem
+    PL Mezanino a partir de maio, de modo que as métricas disponíveis mudam de um mês para o outro.
+    """
+    path = os.path.join(folder_root, "01_PARSED")
+    os.makedirs(path, exist_ok=True)
+    index = pd.Index([f"{d:%Y-%m-%d}" for d in MONTHS], name="Data")
+    tables = {
+        "A": pd.DataFrame({"PL Total": [100.0, 110.0, 120.0],
+                           "Volume Operado": [50.0, 55.0, 60.0],
+                           "Valor Pago nas Operações no Mês": [np.nan, np.nan, 30.0]}, index=index),
+        "B": pd.DataFrame({"PL Total": [200.0, 210.0, 220.0],
+                           "PL Subordinada Jr": [20.0, 21.0, 22.0],
+                           "PL Mezanino": [np.nan, 10.0, 11.0]}, index=index),
+    }
+    for name, table in tables.items():
+        write_parsed(table, os.path.join(path, f"FIDC_{name}_{SOURCE:%Y_%m_%d}.csv"))
+
+
+@pytest.fixture
+def roots(tmp_path):
+    roots = [os.path.join(str(tmp_path), "sequencial"), os.path.join(str(tmp_path), "painel")]
+    for root in roots:
+        _write_parsed_files(root)
+    return roots
+
+
+def test_run_panel_matches_sequential_runs(roots):
+    sequential, panel = Grouper(None, None, roots[0]), Grouper(None, None, roots[1])
+
+    for month in MONTHS:
+        sequential.run(SOURCE, month)
+    reports = panel.run_panel(SOURCE, MONTHS[0], MONTHS[-1])
+
+    assert list(reports) == MONTHS
+    for month in MONTHS:
+        pd.testing.assert_frame_equal(panel.store.read(month), sequential.store.read(month))
+        with open(sequential.export_report(month), "rb") as f_seq, open(panel.export_report(month), "rb") as f_pan:
+            assert f_pan.read() == f_seq.read()
+
+
+def test_panel_metrics_use_only_the_month_columns(roots):
+    grouper = Grouper(None, None, roots[1])
+    grouper.read_csvs(SOURCE)
+    panel = grouper.group_panel(MONTHS[0], MONTHS[-1])
+
+    volume = panel["Volume Operado (PL%)"]
+    assert volume.loc[("A", pd.Timestamp(MONTHS[-1]))] == pytest.approx(30.0 / 120.0)
+    assert volume.loc[("A", pd.Timestamp(MONTHS[0]))] != volume.loc[("A", pd.Timestamp(MONTHS[0]))]  # NaN
+    assert "Subordinação (%)" not in grouper.group_fidcs(MONTHS[0]).columns
+
+
+def test_export_keeps_empty_fields_and_skips_unchanged_months(roots):
+    grouper = Grouper(None, None, roots[0], export_csv=True)
+    grouper.run(SOURCE, MONTHS[0])
+    path = grouper._report_path(MONTHS[0])
+
+    report = pd.read_csv(path, sep=';', encoding='utf-8-sig', dtype=str, keep_default_na=False)
+    assert "nan" not in report.values
+    assert (report.values == "").any()
+
+    os.utime(path, (0, 0))
+    grouper.run(SOURCE, MONTHS[0])
+    assert os.path.getmtime(path) == 0
@@ -0,0 +1,86 @@
+from v8_fidcs.src.services import transformer as transformer_module
+from v8_fidcs.src.services.transformer import Transformer
+
+import shutil
+import time
+import pytest
+import os
+
+DATE = "2025_03_01"
+
+
+def _fake_transform(path_handle, calendar_handle, path_read, path_save, fidc_name, *args):
+    shutil.copyfile(path_read, path_save)
+
+
+@pytest.fixture
+def transformer(tmp_path, monkeypatch):
+    """
+    `Transformer` em `tmp_path` cuja transformação só copia o Excel e cuja chave de cache é o conteúdo do Excel.
+    """
+    monkeypatch.setattr(transformer_module, "_transform_fidc", _fake_transform)
+    raw = os.path.join(str(tmp_path), "00_RAW")
+    os.makedirs(raw)
+    for fidc_name in ("MULTIASSET", "MULTIASSET(NOVO)", "OKNO"):
+        with open(os.path.join(raw, f"FIDC_{fidc_name}_{DATE}.xlsx"), "wb") as f:
+            f.write(fidc_name.encode())
+
+    transformer = Transformer(None, None, str(tmp_path))
+
+    def cache_key(fidc_name, path_read):
+        with open(path_read, "rb") as f:
+            return {"raw": f.read().decode()}
+    transformer._cache_key = cache_key
+    return transformer
+
+
+def _parsed(transformer, fidc_name):
+    with open(os.path.join(transformer.folder_root, "01_PARSED", f"FIDC_{fidc_name}_{DATE}.csv"), "rb") as f:
+        return f.read()
+
+
+def test_renamed_fidcs_keep_last_one_and_stay_cached(transformer, monkeypatch):
+    fidc_list = ["MULTIASSET", "MULTIASSET(NOVO)", "OKNO"]
+    assert transformer.run(DATE, list(fidc_list)) == ["MULTIASSET", "MULTIASSET", "OKNONP"]
+    assert _parsed(transformer, "MULTIASSET") == b"MULTIASSET(NOVO)"
+
+    calls = []
+    monkeypatch.setattr(transformer_module, "_transform_fidc", lambda *job: calls.append(job[4]))
+    for _ in range(3):
+        assert transformer.run(DATE, list(fidc_list)) == ["MULTIASSET", "MULTIASSET", "OKNONP"]
+    assert calls == []
+    assert _parsed(transformer, "MULTIASSET") == b"MULTIASSET(NOVO)"
+
+
+def test_changed_source_reruns_whole_output_group(transformer):
+    fidc_list = ["MULTIASSET", "MULTIASSET(NOVO)"]
+    transformer.run(DATE, list(fidc_list))
+
+    with open(os.path.join(transformer.folder_root, "00_RAW", f"FIDC_MULTIASSET_{DATE}.xlsx"), "wb") as f:
+        f.write(b"reenviado")
+    transformer.run(DATE, list(fidc_list))
+    assert _parsed(transformer, "MULTIASSET") == b"MULTIASSET(NOVO)"
+
+
+
+def _logged_transform(path_handle, calendar_handle, path_read, path_save, fidc_name, *args):
+    # registra início e fim de cada escrita num log compartilhado entre os processos
+    log = os.path.join(os.path.dirname(os.path.dirname(path_save)), "writes.log")
+    with open(log, "a") as f:
+        f.write(f"start {os.path.basename(path_save)}\n")
+    time.sleep(0.2)
+    shutil.copyfile(path_read, path_save)
+    with open(log, "a") as f:
+        f.write(f"end {os.path.basename(path_save)}\n")
+
+
+def test_workers_never_write_the_same_output_together(transformer, monkeypatch):
+    monkeypatch.setattr(transformer_module, "_transform_fidc", _logged_transform)
+    fidc_list = ["MULTIASSET", "MULTIASSET(NOVO)", "OKNO"]
+
+    assert transformer.run(DATE, list(fidc_list), max_workers=3) == ["MULTIASSET", "MULTIASSET", "OKNONP"]
+    assert _parsed(transformer, "MULTIASSET") == b"MULTIASSET(NOVO)"
+
+    with open(os.path.join(transformer.folder_root, "writes.log")) as f:
+        writes = [line.split()[0] for line in f if "MULTIASSET" in line]
+    assert writes == ["start", "end", "start", "end"]